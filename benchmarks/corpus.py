@@ -0,0 +1,198 @@
+from os import PathLike
+from pathlib import Path
+from random import Random
+from xml.sax.saxutils import escape, quoteattr
+
+TYPES = ["int", "float", "bool", "String", "Vector2", "Color", "Node", "Array"]
+"""
+The types used for members, arguments and return values.
+"""
+
+WORDS = (
+    "the node is emitted when value of this property returns a new "
+    "scene tree and its children are used to draw on screen if enabled"
+).split()
+"""
+The words used to fill descriptions.
+"""
+
+INLINE_TAGS = ["b", "i", "u", "s", "code", "kbd"]
+"""
+The BBCode elements used to nest description text.
+"""
+
+
+def make_words(rng: Random, count: int) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(count))
+
+
+def make_description(
+    rng: Random,
+    classes: list[str],
+    length: int,
+    depth: int,
+) -> str:
+    """
+    Returns a BBCode description with roughly `length` words, mixing plain
+    text, references to `classes` and members, and elements nested up to
+    `depth` levels.
+    """
+
+    parts: list[str] = []
+    words = 0
+
+    while words < length:
+        kind = rng.randrange(6)
+
+        if kind == 0 and classes:
+            parts.append(f"[{rng.choice(classes)}]")
+        elif kind == 1:
+            parts.append(f"[method {rng.choice(WORDS)}_{rng.randrange(10)}]")
+        elif kind == 2:
+            parts.append(f"[member {rng.choice(WORDS)}]")
+        elif kind == 3 and depth > 0:
+            parts.append(make_nested(rng, rng.randint(1, depth)))
+        else:
+            parts.append(make_words(rng, 8))
+
+        words += 8
+
+    if rng.randrange(4) == 0:
+        parts.append(
+            "[codeblock]\nfunc _ready():\n    print([1, 2, 3])\n[/codeblock]")
+
+    return ' '.join(parts)
+
+
+def make_nested(rng: Random, depth: int) -> str:
+    """
+    Returns some text wrapped in `depth` nested BBCode elements.
+    """
+
+    text = make_words(rng, 3)
+
+    for _ in range(depth):
+        tag = rng.choice(INLINE_TAGS)
+
+        text = f"[{tag}]{make_words(rng, 2)} {text}[/{tag}]"
+
+    return text
+
+
+def make_class(
+    rng: Random,
+    name: str,
+    inherits: str,
+    classes: list[str],
+    members: int,
+    length: int,
+    depth: int,
+) -> str:
+    """
+    Returns the XML of a class with the same shape as the ones generated
+    by Godot's doctool.
+    """
+
+    def description() -> str:
+        return escape(make_description(rng, classes, length, depth))
+
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8" ?>',
+        f'<class name={quoteattr(name)} inherits={quoteattr(inherits)}>',
+        f"\t<brief_description>\n\t\t{escape(make_words(rng, 10))}\n\t</brief_description>",
+        f"\t<description>\n\t\t{description()}\n\t</description>",
+        "\t<methods>",
+    ]
+
+    for i in range(members):
+        lines.append(f'\t\t<method name="method_{i}">')
+        lines.append(f'\t\t\t<return type="{rng.choice(TYPES)}" />')
+
+        for j in range(rng.randrange(4)):
+            lines.append(
+                f'\t\t\t<param index="{j}" name="arg_{j}" type="{rng.choice(TYPES)}" />')
+
+        lines.append(
+            f"\t\t\t<description>\n\t\t\t\t{description()}\n\t\t\t</description>")
+        lines.append("\t\t</method>")
+
+    lines.append("\t</methods>")
+    lines.append("\t<members>")
+
+    for i in range(members):
+        lines.append(
+            f'\t\t<member name="member_{i}" type="{rng.choice(TYPES)}" '
+            f'setter="set_member_{i}" getter="get_member_{i}" default="null">'
+            f"\n\t\t\t{description()}\n\t\t</member>")
+
+    lines.append("\t</members>")
+    lines.append("\t<signals>")
+
+    for i in range(max(1, members // 4)):
+        lines.append(f'\t\t<signal name="signal_{i}">')
+        lines.append(f'\t\t\t<param index="0" name="value" type="{rng.choice(TYPES)}" />')
+        lines.append(
+            f"\t\t\t<description>\n\t\t\t\tEmitted when {escape(make_words(rng, 6))}.\n\t\t\t</description>")
+        lines.append("\t\t</signal>")
+
+    lines.append("\t</signals>")
+    lines.append("\t<constants>")
+
+    for i in range(max(1, members // 2)):
+        enum = f' enum="Mode{i % 3}"' if i % 2 else ''
+
+        lines.append(
+            f'\t\t<constant name="CONSTANT_{i}" value="{i}"{enum}>'
+            f"\n\t\t\t{description()}\n\t\t</constant>")
+
+    lines.append("\t</constants>")
+    lines.append("\t<theme_items>")
+
+    for i in range(max(1, members // 4)):
+        lines.append(
+            f'\t\t<theme_item name="item_{i}" data_type="color" type="Color" default="Color(1, 1, 1, 1)">'
+            f"\n\t\t\t{description()}\n\t\t</theme_item>")
+
+    lines.append("\t</theme_items>")
+    lines.append("</class>")
+
+    return '\n'.join(lines) + '\n'
+
+
+def generate(
+    path: str | PathLike[str],
+    classes: int = 100,
+    members: int = 10,
+    length: int = 40,
+    depth: int = 2,
+    seed: int = 0,
+) -> list[Path]:
+    """
+    Writes a synthetic corpus of `classes` XML docs to the `path` received
+    and returns the paths of the files written.
+
+    Each class has about `members` methods and properties, descriptions
+    of roughly `length` words and BBCode nested up to `depth` levels.
+    The same arguments always generate the same corpus.
+    """
+
+    rng = Random(seed)
+
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+
+    names = ["Object"] + [f"Class{i:04}" for i in range(1, classes)]
+    files: list[Path] = []
+
+    for i, name in enumerate(names):
+        inherits = names[rng.randrange(i)] if i > 0 else ''
+
+        file = path / f"{name}.xml"
+        file.write_text(
+            make_class(rng, name, inherits, names, members, length, depth),
+            encoding="utf-8",
+        )
+
+        files.append(file)
+
+    return files
@@ -0,0 +1,381 @@
+import copy
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from argparse import ArgumentParser, Namespace
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from statistics import mean
+from tempfile import TemporaryDirectory
+from typing import Any, Callable, TypedDict
+
+from godocs.parser import xml_parser, context_creator, ParseCache
+from godocs.translation.interpreter import BBCodeInterpreter, TokenBBCodeInterpreter
+from godocs.translation.interpreter import FlatBBCodeInterpreter
+from godocs.translation.translator import RSTSyntaxTranslator
+from godocs.translation import walker
+
+from benchmarks import corpus
+
+
+class Result(TypedDict):
+    items: int
+    best: float
+    mean: float
+    peak_memory: int
+
+
+class ContextReport(TypedDict):
+    classes: int
+    retained_memory: int
+    compact_retained_memory: int
+    identifiers: int
+    identifier_bytes: int
+    interned_bytes: int
+
+
+class Benchmark(TypedDict):
+    setup: Callable[[], Any]
+    run: Callable[[Any], int]
+
+
+def get_descriptions(ctx: context_creator.DocContext) -> list[str]:
+    """
+    Returns all the descriptions of the classes in a `DocContext`.
+    """
+
+    result: list[str] = []
+
+    for class_doc in ctx["classes"]:
+        result.append(class_doc["brief_description"])
+        result.append(class_doc["description"])
+
+        for key in ("properties", "methods", "signals", "constants", "theme_items"):
+            for member in class_doc[key]:
+                result.append(member["description"])
+
+        for enum in class_doc["enums"]:
+            for constant in enum["values"]:
+                result.append(constant["description"])
+
+    return result
+
+
+IDENTIFIERS = ("name", "type", "default", "value", "data_type")
+"""
+The keys of the records whose values are identifiers, interned while
+parsing.
+"""
+
+
+def get_identifiers(classes: list[context_creator.Class]) -> list[str]:
+    """
+    Returns every identifier (names, types, defaults and values) held
+    by the records of the `classes`, including repeated ones.
+    """
+
+    result: list[str] = []
+
+    stack: list[Any] = list(classes)
+
+    while stack:
+        record = stack.pop()
+
+        for key, value in record.items():
+            if isinstance(value, list):
+                stack.extend(item for item in value if not isinstance(item, str))
+                result.extend(item for item in value if isinstance(item, str))
+            elif key in IDENTIFIERS:
+                result.append(value)
+
+    return result
+
+
+def measure_context(path: Path) -> ContextReport:
+    """
+    Measures how much memory the classes streamed from the corpus in
+    `path` retain, as dicts and as compact records, and how much of it
+    the interning of their identifiers saves.
+
+    Without interning, each identifier would be a string of its own,
+    taking `identifier_bytes`, while interned ones only take
+    `interned_bytes`, as each distinct identifier is stored once.
+    """
+
+    retained: list[int] = []
+
+    for compact in (False, True):
+        gc.collect()
+        tracemalloc.start()
+
+        classes = list(context_creator.stream(path, compact=compact))
+
+        gc.collect()
+        retained.append(tracemalloc.get_traced_memory()[0])
+        tracemalloc.stop()
+
+    identifiers = get_identifiers(classes)
+    unique = {id(identifier): identifier for identifier in identifiers}
+
+    return {
+        "classes": len(classes),
+        "retained_memory": retained[0],
+        "compact_retained_memory": retained[1],
+        "identifiers": len(identifiers),
+        "identifier_bytes": sum(sys.getsizeof(i) for i in identifiers),
+        "interned_bytes": sum(sys.getsizeof(i) for i in unique.values()),
+    }
+
+
+def get_benchmarks(path: Path, cache_path: Path) -> dict[str, Benchmark]:
+    """
+    Returns the benchmarks of each stage of the pipeline, run against
+    the corpus in `path`, with caches stored in `cache_path`.
+
+    Each benchmark has a `setup`, whose result isn't measured, and a
+    `run`, which receives that result and returns how many items it
+    processed.
+    """
+
+    docs = xml_parser.parse(path)
+
+    # Warms the parse cache up.
+    ParseCache(cache_path).create(path)
+    ctx = context_creator.create(docs)
+    descriptions = get_descriptions(ctx)
+    trees = [TokenBBCodeInterpreter().interpret(text) for text in descriptions]
+    flat_trees = [FlatBBCodeInterpreter().interpret_flat(text)
+                  for text in descriptions]
+
+    def interpret(interpreter: BBCodeInterpreter) -> Callable[[Any], int]:
+        def run(_: Any) -> int:
+            for text in descriptions:
+                interpreter.interpret(text)
+
+            return len(descriptions)
+
+        return run
+
+    def translate_trees(_: Any) -> int:
+        translator = RSTSyntaxTranslator()
+
+        for tree in trees:
+            tree.translate(translator)
+
+        return len(trees)
+
+    def walk_trees(_: Any) -> int:
+        translator = RSTSyntaxTranslator()
+
+        for tree in trees:
+            walker.translate(tree, translator)
+
+        return len(trees)
+
+    def interpret_flat(_: Any) -> int:
+        interpreter = FlatBBCodeInterpreter()
+
+        for text in descriptions:
+            interpreter.interpret_flat(text)
+
+        return len(descriptions)
+
+    def translate_flat_trees(_: Any) -> int:
+        translator = RSTSyntaxTranslator()
+
+        for tree in flat_trees:
+            translator.translate_flat(tree)
+
+        return len(flat_trees)
+
+    def translate_context(ctx: context_creator.DocContext) -> int:
+        context_creator.translate(
+            ctx, TokenBBCodeInterpreter(), RSTSyntaxTranslator())
+
+        return len(ctx["classes"])
+
+    return {
+        "xml_parser.parse": {
+            "setup": lambda: None,
+            "run": lambda _: len(xml_parser.parse(path)),
+        },
+        "context_creator.create": {
+            "setup": lambda: None,
+            "run": lambda _: len(context_creator.create(docs)["classes"]),
+        },
+        "ParseCache.create": {
+            "setup": lambda: None,
+            "run": lambda _: len(ParseCache(cache_path).create(path)["classes"]),
+        },
+        "context_creator.stream": {
+            "setup": lambda: None,
+            "run": lambda _: sum(1 for _ in context_creator.stream(path)),
+        },
+        "BBCodeInterpreter.interpret": {
+            "setup": lambda: None,
+            "run": interpret(BBCodeInterpreter()),
+        },
+        "TokenBBCodeInterpreter.interpret": {
+            "setup": lambda: None,
+            "run": interpret(TokenBBCodeInterpreter()),
+        },
+        "FlatBBCodeInterpreter.interpret_flat": {
+            "setup": lambda: None,
+            "run": interpret_flat,
+        },
+        "RSTSyntaxTranslator.translate": {
+            "setup": lambda: None,
+            "run": translate_trees,
+        },
+        "walker.translate": {
+            "setup": lambda: None,
+            "run": walk_trees,
+        },
+        "RSTSyntaxTranslator.translate_flat": {
+            "setup": lambda: None,
+            "run": translate_flat_trees,
+        },
+        "context_creator.translate": {
+            "setup": lambda: {**ctx, "classes": copy.deepcopy(ctx["classes"])},
+            "run": translate_context,
+        },
+    }
+
+
+def measure(benchmark: Benchmark, repeat: int) -> Result:
+    """
+    Runs a `benchmark` `repeat` times, measuring its wall time, and then
+    once more with `tracemalloc`, measuring its peak memory usage.
+    """
+
+    times: list[float] = []
+    items = 0
+
+    for _ in range(repeat):
+        arg = benchmark["setup"]()
+
+        start = time.perf_counter()
+        items = benchmark["run"](arg)
+        times.append(time.perf_counter() - start)
+
+    arg = benchmark["setup"]()
+
+    tracemalloc.start()
+    benchmark["run"](arg)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "items": items,
+        "best": min(times),
+        "mean": mean(times),
+        "peak_memory": peak,
+    }
+
+
+def get_version() -> str:
+    try:
+        return version("godocs")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any]):
+    """
+    Prints how the `results` of each stage compare to the ones of
+    a `baseline` run.
+    """
+
+    print(f"{'stage':<36}{'time':>12}{'memory':>12}")
+
+    for name, result in results["results"].items():
+        previous = baseline["results"].get(name)
+
+        if previous is None:
+            print(f"{name:<36}{'new':>12}{'new':>12}")
+            continue
+
+        time_ratio = result["best"] / previous["best"] if previous["best"] else 0
+        memory_ratio = result["peak_memory"] / \
+            previous["peak_memory"] if previous["peak_memory"] else 0
+
+        print(f"{name:<36}{time_ratio:>11.2f}x{memory_ratio:>11.2f}x")
+
+
+def parse_args() -> Namespace:
+    parser = ArgumentParser(
+        description="Benchmarks the godocs pipeline against a synthetic corpus.")
+
+    parser.add_argument("--classes", type=int, default=100,
+                        help="Number of classes in the corpus.")
+    parser.add_argument("--members", type=int, default=10,
+                        help="Number of methods and properties per class.")
+    parser.add_argument("--length", type=int, default=40,
+                        help="Approximate number of words per description.")
+    parser.add_argument("--depth", type=int, default=2,
+                        help="Maximum BBCode nesting depth in descriptions.")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Seed used to generate the corpus.")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="How many times each stage is timed.")
+    parser.add_argument("--stage", action="append",
+                        help="Only run the given stage. Can be repeated.")
+    parser.add_argument("--output", help="Path to write the JSON results to.")
+    parser.add_argument("--compare",
+                        help="Path to previous JSON results to compare with.")
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    params = {
+        "classes": args.classes,
+        "members": args.members,
+        "length": args.length,
+        "depth": args.depth,
+        "seed": args.seed,
+    }
+
+    results: dict[str, Any] = {
+        "meta": {
+            "godocs": get_version(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "corpus": params,
+        },
+        "results": {},
+    }
+
+    with TemporaryDirectory() as path:
+        corpus.generate(Path(path, "docs"), **params)
+
+        benchmarks = get_benchmarks(Path(path, "docs"), Path(path, "cache"))
+
+        for name, benchmark in benchmarks.items():
+            if args.stage and name not in args.stage:
+                continue
+
+            results["results"][name] = measure(benchmark, args.repeat)
+
+        results["context"] = measure_context(Path(path, "docs"))
+
+    output = json.dumps(results, indent=2)
+
+    if args.output:
+        Path(args.output).write_text(output + '\n', encoding="utf-8")
+    else:
+        print(output)
+
+    if args.compare:
+        compare(results, json.loads(
+            Path(args.compare).read_text(encoding="utf-8")))
+
+
+if __name__ == "__main__":
+    main()
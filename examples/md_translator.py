@@ -1,4 +1,3 @@
-from functools import reduce
 from godocs.translation.translator import SyntaxTranslator as BaseTranslator
 from godocs.translation import ast
 
@@ -19,11 +18,7 @@ class SyntaxTranslator(BaseTranslator):
 
     def translate_tag(self, node: "ast.TagNode") -> str:
         # First of all, translates the children of the node received.
-        content = reduce(
-            lambda prev, next: prev + next.translate(self),
-            node.children,
-            '',
-        )
+        content = self.translate_children(node)
 
         # Depending on the node name, the resultant syntax will change.
         match node.name:
@@ -1,3 +1,19 @@
-from . import cli, constructor, parser, plugin, translation, util
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import cli, constructor, parser, plugin, translation, util
 
 __all__ = ["cli", "constructor", "parser", "plugin", "translation", "util"]
+
+
+def __getattr__(name: str):
+    """
+    Imports the subpackages of `godocs` when they're first accessed, so
+    that starting the CLI doesn't import the ones it doesn't use.
+    """
+
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
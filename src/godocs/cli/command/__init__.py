@@ -1,5 +1,6 @@
 from .cli_command import CLICommand
 from .app_command import AppCommand
 from .contruct_command import ConstructCommand
+from .serve_command import ServeCommand
 
-__all__ = ["CLICommand", "AppCommand", "ConstructCommand"]
+__all__ = ["CLICommand", "AppCommand", "ConstructCommand", "ServeCommand"]
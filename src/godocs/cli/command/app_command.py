@@ -1,10 +1,11 @@
+import sys
 from argparse import ArgumentParser, Namespace
-from typing import TypedDict, cast, Optional, TYPE_CHECKING, Callable
+from typing import TypedDict, cast, Optional, Sequence, TYPE_CHECKING, Callable
 from os import PathLike
 from godocs.cli.command.cli_command import CLICommand
 from godocs.cli.command.contruct_command import ConstructCommand
-from godocs.plugin import Plugin as PluginType, load as load_plugins
-from godocs.util import module
+from godocs.cli.command.serve_command import ServeCommand
+from godocs.plugin import Plugin as PluginType, LazyPlugin, load as load_plugins
 
 if TYPE_CHECKING:
     from argparse import _SubParsersAction  # type: ignore
@@ -13,15 +14,17 @@ if TYPE_CHECKING:
 
 class AppSubcommands(TypedDict):
     construct: ConstructCommand
+    serve: ServeCommand
 
 
 class AppCommand(CLICommand):
     """
     The main `CLICommand` for the `godocs` app.
 
-    This command exposes as its main (and only, for now) option the
-    `"construct"` subcommand, which triggers the generation of
-    documentation output.
+    This command exposes as its main option the `"construct"`
+    subcommand, which triggers the generation of documentation output,
+    along with the `"serve"` subcommand, which keeps the app running
+    to answer build requests.
 
     It's possible to extend the functionality of this CLI app
     by providing a path to a script in the `--plugin` or `-p`
@@ -31,6 +34,11 @@ class AppCommand(CLICommand):
 
     That function can then make any modifications/ additions
     to the application parsers and subparsers as needed.
+
+    Installed plugins are only imported when the command line needs
+    them, that is, when one of the commands they registered in a
+    previous run is chosen or shown in the help. The other ones are
+    kept in `deferred`.
     """
 
     parser: ArgumentParser
@@ -44,29 +52,49 @@ class AppCommand(CLICommand):
     """
 
     subcommands: AppSubcommands = {
-        "construct": ConstructCommand()
+        "construct": ConstructCommand(),
+        "serve": ServeCommand(),
     }
     """
     The subcommands this `AppCommand` exposes.
 
-    Currently, there's only the `"construct"` option.
+    Currently, there are the `"construct"` and `"serve"` options.
     """
 
     processors: list[Callable[[Namespace], Namespace]] = []
 
+    deferred: list[LazyPlugin] = []
+    """
+    The installed plugins that weren't registered, as the command
+    line doesn't need them.
+    """
+
+    argv: Optional[list[str]] = None
+    """
+    The arguments of the command line this `AppCommand` parses, or
+    `None` for the ones the program was started with (`sys.argv[1:]`).
+    """
+
     def register(
         self,
         superparsers: "Optional[_SubParsersAction[ArgumentParser]]" = None,
         parent_parser: Optional[ArgumentParser] = None,
-        processors: "Optional[list[Processor]]" = None
+        processors: "Optional[list[Processor]]" = None,
+        argv: Optional[Sequence[str]] = None
     ):
         """
         Creates the `parser` for this `AppCommand` and
         registers the `--plugin` or `-p` option, as well
         as sets the help printing function as the default
         behavior when nothing else is chosen.
+
+        The installed plugins registered are the ones needed by the
+        command line in `argv`, which is the one the program was
+        started with if not passed, and is the one `parse` uses.
         """
 
+        self.argv = None if argv is None else list(argv)
+
         self.parser = ArgumentParser(
             description="Godot Docs generator CLI")
 
@@ -79,14 +107,36 @@ class AppCommand(CLICommand):
 
         plugins = load_plugins()
 
+        command = self._get_command(
+            sys.argv[1:] if self.argv is None else self.argv)
+
+        self.deferred = []
+
         for p in plugins:
+            if not p.is_needed(command):
+                self.deferred.append(p)
+                continue
+
+            self._register_plugin(p)
+
+    def register_deferred(self):
+        """
+        Registers the plugins that were `deferred`, for commands that
+        execute other command lines, like `serve`.
+        """
+
+        deferred = self.deferred
+
+        self.deferred = []
+
+        for p in deferred:
             self._register_plugin(p)
 
     def execute(self, args: Namespace):
         self.parser.print_help()
 
     def parse(self):
-        args, _ = self.parser.parse_known_args()
+        args, _ = self.parser.parse_known_args(self.argv)
 
         return args
 
@@ -104,6 +154,8 @@ class AppCommand(CLICommand):
         """
 
         if not isinstance(plugin, PluginType):
+            from godocs.util import module
+
             plugin_module = module.load("plugin", plugin)
 
             Plugin = dict(
@@ -117,6 +169,22 @@ class AppCommand(CLICommand):
 
         plugin.register(self)
 
+    def _get_command(self, argv: list[str]) -> list[str]:
+        """
+        Returns the subcommands chosen in the arguments of a command
+        line, which are the ones before the first option.
+        """
+
+        result: list[str] = []
+
+        for arg in argv:
+            if arg.startswith("-"):
+                break
+
+            result.append(arg)
+
+        return result
+
     def _register_subcommands(self):
         """
         Registers the subcommands for this `AppCommand`.
@@ -125,3 +193,9 @@ class AppCommand(CLICommand):
         # Registers the construct command to the subparsers
         self.subcommands["construct"].register(
             self.subparsers, None, self.processors)
+
+        # Registers the serve command, which executes build requests
+        # through this app
+        self.subcommands["serve"].app = self
+        self.subcommands["serve"].register(
+            self.subparsers, None, self.processors)
@@ -1,20 +1,31 @@
+import sys
+import time
+from pathlib import Path
 from argparse import ArgumentParser, Namespace
-from typing import Optional, TYPE_CHECKING
+from typing import Callable, Optional, TYPE_CHECKING
 from godocs.cli.command.cli_command import CLICommand
-from godocs.parser import xml_parser, context_creator
-from godocs.translation.interpreter import BBCodeInterpreter
-from godocs.translation.translator import get_translator
-from godocs import util
+from godocs.util.profiling import Profiler
 
 if TYPE_CHECKING:
     from argparse import _SubParsersAction  # type: ignore
     from godocs.cli.command.cli_command import Processor
+    from godocs.parser import BuildCache
+    from godocs.translation.interpreter import Interpreter
+    from godocs.translation.translator import SyntaxTranslator
 
 
 class ConstructCommand(CLICommand):
     """
     A `CLICommand` that allows choosing a `constructor` for
     generating documentation.
+
+    Constructors receive the translated context in the `ctx` attribute
+    of the parsed arguments. With the `--watch` option, they're executed
+    again after each change in the input directory, with the names of
+    the classes that were rebuilt in the `changed` attribute (which is
+    `None` for full builds), so they can skip writing the other ones.
+    The same happens for repeated builds of a `persistent` command,
+    like the ones requested to the `serve` command.
     """
 
     TRANSLATORS = ["rst"]
@@ -22,6 +33,12 @@ class ConstructCommand(CLICommand):
     The default translators accepted by this command.
     """
 
+    WATCH_INTERVAL = 0.25
+    """
+    How long, in seconds, the `--watch` mode waits between checks
+    of the input directory.
+    """
+
     parser: ArgumentParser
     """
     The `argparse.ArgumentParser` instance this `ConstructCommand` uses.
@@ -43,6 +60,30 @@ class ConstructCommand(CLICommand):
     The subcommands this `ConstructCommand` exposes.
     """
 
+    persistent: bool = False
+    """
+    Whether the contexts built are kept in memory, so that later builds
+    of the same input directory in this process only rebuild the classes
+    that changed.
+    """
+
+    caches: "dict[tuple[str, str | None, str], BuildCache]" = {}
+    """
+    The build caches kept in memory by this command, keyed by the input
+    directory, cache directory and translator of the builds.
+    """
+
+    profiler: Profiler = Profiler()
+    """
+    The `Profiler` that measures the stages of the construction, which
+    is reset at the start of each build, so its reports only hold the
+    stages of the last one.
+
+    Plugins can call its `subscribe` method to receive a report of each
+    stage (`xml_parser.parse`, `context_creator.create`,
+    `context_creator.translate` and `constructor`) as it ends.
+    """
+
     def register(
         self,
         superparsers: "Optional[_SubParsersAction[ArgumentParser]]" = None,
@@ -78,6 +119,42 @@ class ConstructCommand(CLICommand):
             "-O", "--options-file",
             help=f"Path to options JSON with data to use in documentation."
         )
+        self.parent_parser.add_argument(
+            "-j", "--jobs",
+            type=int,
+            help=f"Number of worker processes to use for parsing and translation. Use 0 for one per CPU."
+        )
+        self.parent_parser.add_argument(
+            "-c", "--cache-dir",
+            nargs="?",
+            const=".godocs-cache",
+            help=f"Directory of a build cache used to only rebuild changed classes. Defaults to .godocs-cache when no value is given."
+        )
+        self.parent_parser.add_argument(
+            "-w", "--watch",
+            action="store_true",
+            help=f"Keep running after constructing, rebuilding the classes whose XML files change in the input directory."
+        )
+        self.parent_parser.add_argument(
+            "--check-references",
+            action="store_true",
+            help=f"Warn about references that point to no documented symbol. References that may point to undocumented classes, like the ones of the engine, aren't checked."
+        )
+        self.parent_parser.add_argument(
+            "--compact",
+            action="store_true",
+            help=f"Keep the parsed classes in compact records instead of dicts, which uses less memory. Builds with a cache keep dicts."
+        )
+        self.parent_parser.add_argument(
+            "--profile",
+            action="store_true",
+            help=f"Print the time and item count of each construction stage."
+        )
+        self.parent_parser.add_argument(
+            "--profile-memory",
+            action="store_true",
+            help=f"Print the peak memory of each construction stage too, which slows the stages down, so their times are better measured without this option."
+        )
         self.parent_parser.add_argument(
             "input_dir", help="Input directory with XML documentation files."
         )
@@ -99,21 +176,194 @@ class ConstructCommand(CLICommand):
         if not hasattr(args, "input_dir") or not hasattr(args, "output_dir"):
             return args
 
-        docs = xml_parser.parse(args.input_dir)
+        # The parsing and translation modules are only imported when
+        # constructing, so other commands start faster.
+        from godocs.parser import xml_parser, context_creator
+        from godocs.translation.interpreter import TokenBBCodeInterpreter
+        from godocs.translation.translator import get_translator
+        from godocs import util
 
         options: dict[str, str] = {}
 
         if args.options_file != None:
             options = util.options.load(args.options_file)
 
-        ctx = context_creator.create(docs, options)
-
-        interpreter = BBCodeInterpreter()
+        interpreter = TokenBBCodeInterpreter()
 
         translator = get_translator(args.translator)
 
-        ctx = context_creator.translate(ctx, interpreter, translator)
+        profiler = self.profiler
+
+        # The profiler outlives each build in watching and persistent
+        # commands, so only the options of the current one apply.
+        profiler.reset()
+        profiler.enabled = args.profile or args.profile_memory
+        profiler.memory = args.profile_memory
+
+        changed: list[str] | None = None
+
+        # Watching and persistent builds keep a build cache in memory even
+        # if no cache directory is used, so only changed classes are rebuilt.
+        if args.cache_dir != None or args.watch or self.persistent:
+            cache = self.get_cache(args)
+
+            # Caches that already built a context know what changed since.
+            warm = cache.signature != ''
+
+            ctx = cache.build(
+                args.input_dir, interpreter, translator, options,
+                check_references=args.check_references, profiler=profiler,
+                jobs=args.jobs)
+
+            if warm:
+                changed = cache.affected
+        else:
+            with profiler.stage("xml_parser.parse") as stage:
+                docs = xml_parser.parse(args.input_dir, args.jobs)
+                stage["items"] = len(docs)
+
+            with profiler.stage("context_creator.create") as stage:
+                ctx = context_creator.create(docs, options, args.compact)
+                stage["items"] = len(ctx["classes"])
+
+            with profiler.stage("context_creator.translate") as stage:
+                ctx = context_creator.translate(
+                    ctx, interpreter, translator, jobs=args.jobs,
+                    check_references=args.check_references)
+                stage["items"] = len(ctx["classes"])
+
+        self.report_broken(translator)
 
         args.ctx = ctx
+        args.changed = changed
+
+        if profiler.active:
+            args.execute = self.profile_execute(args.execute)
+
+        if args.watch:
+            args.execute = self.watch_execute(
+                args.execute, cache, interpreter, translator, options)
 
         return args
+
+    def get_cache(self, args: Namespace) -> "BuildCache":
+        """
+        Returns the `BuildCache` for the input directory, cache directory
+        and translator in the `args`, which is kept in `caches` if this
+        command is `persistent`.
+        """
+
+        from godocs.parser import BuildCache
+
+        if not self.persistent:
+            return BuildCache(args.cache_dir)
+
+        key = (
+            str(Path(args.input_dir).resolve()),
+            args.cache_dir,
+            args.translator,
+        )
+
+        cache = self.caches.get(key)
+
+        if cache is None:
+            cache = BuildCache(args.cache_dir)
+            self.caches[key] = cache
+
+        return cache
+
+    def report_broken(self, translator: "SyntaxTranslator"):
+        """
+        Warns about the references that the `translator` couldn't resolve
+        to any documented symbol in its last translation.
+        """
+
+        for reference in getattr(translator, "broken", []):
+            print(
+                f"Broken reference in {reference["scope"]}: [{reference["kind"]} {reference["name"]}]",
+                file=sys.stderr,
+            )
+
+    def profile_execute(self, execute: Callable[[Namespace], None]):
+        """
+        Wraps the `execute` function of the constructor chosen so that
+        it is measured as the `"constructor"` stage, printing the report
+        of all stages afterwards if the `--profile` or `--profile-memory`
+        options were passed.
+        """
+
+        def profiled_execute(args: Namespace):
+            with self.profiler.stage("constructor") as stage:
+                execute(args)
+                stage["items"] = len(args.ctx["classes"])
+
+            if self.profiler.enabled:
+                print(self.profiler.format(), file=sys.stderr)
+
+        return profiled_execute
+
+    def watch_execute(
+        self,
+        execute: Callable[[Namespace], None],
+        cache: "BuildCache",
+        interpreter: "Interpreter",
+        translator: "SyntaxTranslator",
+        options: dict[str, str],
+    ):
+        """
+        Wraps the `execute` function of the constructor chosen so that,
+        after running once, it runs again each time the XML files in the
+        input directory change, until interrupted.
+
+        The context is rebuilt with the `cache` of the first build, so
+        only the classes affected by each change are parsed and
+        translated again.
+        """
+
+        from xml.etree.ElementTree import ParseError
+        from godocs.util.watch import Watcher
+
+        def watched_execute(args: Namespace):
+            execute(args)
+
+            watcher = Watcher(args.input_dir, "*.xml", self.WATCH_INTERVAL)
+
+            print(f"Watching {args.input_dir} for changes...", file=sys.stderr)
+
+            try:
+                while True:
+                    watcher.wait()
+
+                    start = time.perf_counter()
+
+                    self.profiler.reset()
+
+                    # Files may be left invalid while being edited, so
+                    # errors are reported without stopping the watch.
+                    try:
+                        args.ctx = cache.build(
+                            args.input_dir, interpreter, translator, options,
+                            check_references=args.check_references,
+                            profiler=self.profiler, jobs=args.jobs)
+                    except (ParseError, OSError) as error:
+                        print(f"Build failed: {error}", file=sys.stderr)
+                        continue
+
+                    self.report_broken(translator)
+
+                    # Files that were only touched don't change the context.
+                    if not cache.affected and cache.stats["removed"] == 0:
+                        continue
+
+                    args.changed = cache.affected
+
+                    execute(args)
+
+                    print(
+                        f"Rebuilt {len(cache.affected)} classes in {time.perf_counter() - start:.3f} s",
+                        file=sys.stderr,
+                    )
+            except KeyboardInterrupt:
+                pass
+
+        return watched_execute
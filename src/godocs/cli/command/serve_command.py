@@ -0,0 +1,279 @@
+import json
+import sys
+import time
+from argparse import ArgumentParser, Namespace
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Any, IO, Optional, TYPE_CHECKING
+from godocs.cli.command.cli_command import CLICommand
+
+if TYPE_CHECKING:
+    from argparse import _SubParsersAction  # type: ignore
+    from godocs.cli.command.app_command import AppCommand
+    from godocs.cli.command.cli_command import Processor
+
+
+PARSE_ERROR = -32700
+"""
+The JSON-RPC error code for requests that aren't valid JSON.
+"""
+
+INVALID_REQUEST = -32600
+"""
+The JSON-RPC error code for requests that aren't valid request objects.
+"""
+
+METHOD_NOT_FOUND = -32601
+"""
+The JSON-RPC error code for requests of unknown methods.
+"""
+
+INVALID_PARAMS = -32602
+"""
+The JSON-RPC error code for requests with invalid params.
+"""
+
+BUILD_ERROR = -32000
+"""
+The JSON-RPC error code for builds that failed.
+"""
+
+
+class RPCError(Exception):
+    """
+    An error to be answered to a JSON-RPC request.
+    """
+
+    code: int
+    """
+    The JSON-RPC code of this error.
+    """
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+
+        self.code = code
+
+
+class ServeCommand(CLICommand):
+    """
+    A `CLICommand` that keeps `godocs` running, answering build requests
+    sent as JSON-RPC 2.0 messages, one per line, through the standard
+    input or a Unix socket.
+
+    Plugins are loaded only once, when the server starts, and the
+    `construct` command is made `persistent`, so each build after the
+    first one only parses and translates the classes that changed.
+
+    The methods available are:
+
+    - `"build"`, whose `"args"` param is a list of the arguments of a
+      `godocs` command line (like `["construct", "jinja", "in", "out"]`),
+      which is executed as if it was called from the shell. Its result
+      holds the number of `"classes"` built, the names of the classes
+      that `"changed"` (`null` for the first build) and the `"time"`
+      it took, in seconds.
+    - `"ping"`, which answers `"pong"`.
+    - `"shutdown"`, which stops the server after answering.
+    """
+
+    parser: ArgumentParser
+    """
+    The `argparse.ArgumentParser` instance this `ServeCommand` uses.
+    """
+
+    app: "AppCommand"
+    """
+    The `AppCommand` that parses and executes the command lines of the
+    build requests.
+    """
+
+    running: bool = False
+    """
+    Whether this `ServeCommand` is answering requests.
+    """
+
+    def register(
+        self,
+        superparsers: "Optional[_SubParsersAction[ArgumentParser]]" = None,
+        parent_parser: Optional[ArgumentParser] = None,
+        processors: "Optional[list[Processor]]" = None
+    ):
+        """
+        Registers this `ServeCommand` as a subparser for the
+        `subparsers` received.
+        """
+
+        if superparsers is None:
+            raise ValueError(
+                'superparsers are needed for "serve" registration')
+
+        self.parser = superparsers.add_parser(
+            "serve", help="Keep running, answering build requests sent as JSON-RPC")
+
+        self.parser.add_argument(
+            "-s", "--socket",
+            help=f"Path of a Unix socket to listen to, instead of reading requests from the standard input."
+        )
+
+        self.parser.set_defaults(execute=self.execute)
+
+    def execute(self, args: Namespace):
+        # Build requests may use any plugin.
+        self.app.register_deferred()
+
+        self.app.subcommands["construct"].persistent = True
+
+        if args.socket != None:
+            self.serve_socket(args.socket)
+        else:
+            self.serve_stream(sys.stdin, sys.stdout)
+
+    def serve_stream(self, input: IO[str], output: IO[str]):
+        """
+        Answers the requests read from the lines of the `input`, writing
+        each response as a line of the `output`, until the `input` ends
+        or a `"shutdown"` is requested.
+        """
+
+        self.running = True
+
+        for line in input:
+            response = self.handle(line)
+
+            if response is not None:
+                output.write(response + "\n")
+                output.flush()
+
+            if not self.running:
+                break
+
+        self.running = False
+
+    def serve_socket(self, path: str):
+        """
+        Answers the requests sent to a Unix socket created at `path`,
+        one connection at a time, until a `"shutdown"` is requested.
+        """
+
+        import socketserver
+
+        if not hasattr(socketserver, "UnixStreamServer"):
+            raise NotImplementedError(
+                "Unix sockets aren't supported on this platform")
+
+        command = self
+
+        class Handler(socketserver.StreamRequestHandler):
+
+            def handle(self):
+                for line in self.rfile:
+                    response = command.handle(line.decode("utf-8"))
+
+                    if response is not None:
+                        self.wfile.write(response.encode("utf-8") + b"\n")
+
+                    if not command.running:
+                        break
+
+        self.running = True
+
+        with socketserver.UnixStreamServer(path, Handler) as server:  # type: ignore
+            print(f"Listening on {path}", file=sys.stderr)
+
+            try:
+                while self.running:
+                    server.handle_request()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                self.running = False
+
+                Path(path).unlink(missing_ok=True)
+
+    def handle(self, line: str) -> str | None:
+        """
+        Answers a JSON-RPC request in a `line`, returning its response
+        as a line of JSON, or `None` for notifications and blank lines.
+        """
+
+        if not line.strip():
+            return None
+
+        id: Any = None
+
+        try:
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as error:
+                raise RPCError(PARSE_ERROR, f"Parse error: {error}")
+
+            if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+                raise RPCError(INVALID_REQUEST, "Invalid request")
+
+            id = request.get("id")
+
+            result = self.call(request["method"], request.get("params", {}))
+        except RPCError as error:
+            response = {"code": error.code, "message": str(error)}
+
+            return json.dumps({"jsonrpc": "2.0", "id": id, "error": response})
+
+        # Requests without an id are notifications, which aren't answered.
+        if "id" not in request:
+            return None
+
+        return json.dumps({"jsonrpc": "2.0", "id": id, "result": result})
+
+    def call(self, method: str, params: Any) -> Any:
+        """
+        Calls the `method` of a request with its `params`, returning
+        its result.
+        """
+
+        if method == "ping":
+            return "pong"
+
+        if method == "shutdown":
+            self.running = False
+            return None
+
+        if method == "build":
+            if not isinstance(params, dict) or not isinstance(params.get("args"), list):
+                raise RPCError(INVALID_PARAMS, 'Builds need a list of "args"')
+
+            return self.build([str(arg) for arg in params["args"]])
+
+        raise RPCError(METHOD_NOT_FOUND, f"Method not found: {method}")
+
+    def build(self, argv: list[str]) -> dict[str, Any]:
+        """
+        Executes a `godocs` command line, returning a summary of the
+        context it built.
+        """
+
+        start = time.perf_counter()
+
+        # The standard output may be the channel of the responses, so
+        # anything printed by the commands goes to the standard error.
+        with redirect_stdout(sys.stderr):
+            try:
+                args = self.app.parser.parse_args(argv)
+            except SystemExit:
+                raise RPCError(INVALID_PARAMS, f"Invalid arguments: {argv}")
+
+            if getattr(args, "watch", False) or args.execute == self.execute:
+                raise RPCError(INVALID_PARAMS, "Builds can't watch or serve")
+
+            try:
+                self.app.start(args)
+            except (Exception, SystemExit) as error:
+                raise RPCError(BUILD_ERROR, f"Build failed: {error}")
+
+        ctx = getattr(args, "ctx", None)
+
+        return {
+            "classes": None if ctx is None else len(ctx["classes"]),
+            "changed": getattr(args, "changed", None),
+            "time": time.perf_counter() - start,
+        }
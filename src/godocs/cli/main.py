@@ -1,15 +1,19 @@
+from typing import Optional, Sequence
+
 from godocs.cli.command import AppCommand
 
 
-def main():
+def main(argv: Optional[Sequence[str]] = None):
     """
-    Entrypoint for the `godocs` CLI application.
+    Entrypoint for the `godocs` CLI application, which executes the
+    command line in `argv` (by default, the one the program was
+    started with).
     """
 
     # Instantiates main app
     app = AppCommand()
 
-    app.register()
+    app.register(argv=argv)
 
     args = app.parse()
 
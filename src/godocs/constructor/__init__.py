@@ -1,3 +1,4 @@
 from .constructor import Constructor
+from .writer import OutputWriter
 
-__all__ = ["Constructor"]
+__all__ = ["Constructor", "OutputWriter"]
@@ -7,6 +7,14 @@ type ConstructorContext = dict[str, Any]
 
 
 class Constructor(ABC):
+    """
+    Base class for the constructors, which generate documentation
+    from a `ConstructorContext`.
+
+    Constructors that write many files can use an `OutputWriter`, which
+    writes them from a pool of threads, atomically, skipping the files
+    whose content didn't change.
+    """
 
     @abstractmethod
     def construct(self, context: ConstructorContext, path: str | PathLike[str]):
@@ -0,0 +1,177 @@
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from os import PathLike
+from pathlib import Path
+from typing import TypedDict
+
+
+class WriteStats(TypedDict):
+    written: int
+    skipped: int
+
+
+class OutputWriter:
+    """
+    Writes the output files of a constructor from a pool of threads.
+
+    Each file is written atomically, to a temporary file in the same
+    directory that is then renamed over the target, so readers never
+    see a partially written file. Files whose current content is the
+    same as the new one aren't written at all, which keeps their
+    modification times, so tools like Sphinx only rebuild the pages
+    that actually changed.
+
+    Writes are queued with `write` and run in the background, until
+    `wait` or `close` are called (or the `with` block of the writer
+    ends), which raise the first error that happened, if any.
+    """
+
+    root: Path
+    """
+    The directory the paths written are relative to.
+    """
+
+    jobs: int | None
+    """
+    The number of threads used for writing, where `None` (or `0` and
+    negative numbers, like the `--jobs` option) uses the default of the
+    `ThreadPoolExecutor` and `1` writes each file as soon as it's
+    queued, in the calling thread.
+    """
+
+    stats: WriteStats
+    """
+    How many files were `written` and how many were `skipped` because
+    their content didn't change.
+    """
+
+    def __init__(self, root: str | PathLike[str], jobs: int | None = None):
+        self.root = Path(root)
+        self.jobs = jobs
+        self.stats = {
+            "written": 0,
+            "skipped": 0,
+        }
+        self._executor = None if jobs == 1 else ThreadPoolExecutor(
+            jobs if jobs is not None and jobs > 0 else None)
+        self._futures: list[Future[bool]] = []
+        self._lock = threading.Lock()
+
+    def write(
+        self,
+        path: str | PathLike[str],
+        content: str | bytes,
+        encoding: str = "utf-8",
+    ) -> "Future[bool]":
+        """
+        Queues the `content` to be written to the file at `path`, relative
+        to the `root`, returning a `Future` with whether it was written.
+
+        Each path should only be written once per construction, as the
+        order of concurrent writes isn't defined.
+        """
+
+        target = self.root / path
+        data = content.encode(encoding) if isinstance(content, str) else content
+
+        if self._executor is not None:
+            future = self._executor.submit(self._write, target, data)
+        else:
+            future = Future()
+
+            try:
+                future.set_result(self._write(target, data))
+            except Exception as error:
+                future.set_exception(error)
+
+        self._futures.append(future)
+
+        return future
+
+    def wait(self):
+        """
+        Waits for all the files queued to be written, raising the first
+        error that happened while writing them, if any.
+        """
+
+        futures = self._futures
+
+        self._futures = []
+
+        for future in futures:
+            future.result()
+
+    def close(self):
+        """
+        Waits for all the files queued to be written and stops the
+        threads of this writer.
+        """
+
+        try:
+            self.wait()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+
+    def _write(self, target: Path, data: bytes) -> bool:
+        written = write_file(target, data)
+
+        with self._lock:
+            self.stats["written" if written else "skipped"] += 1
+
+        return written
+
+    def __enter__(self) -> "OutputWriter":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+def write_file(path: str | PathLike[str], data: bytes) -> bool:
+    """
+    Writes `data` to the file at `path` atomically, creating its parent
+    directories if needed, unless the file already has that content.
+
+    Returns whether the file was written.
+    """
+
+    path = Path(path)
+
+    if is_unchanged(path, data):
+        return False
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Each thread has its own temporary file, in the same directory
+    # as the target so that renaming it is atomic.
+    temp = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+
+    try:
+        with open(temp, "wb") as f:
+            f.write(data)
+
+        os.replace(temp, path)
+    except BaseException:
+        temp.unlink(missing_ok=True)
+        raise
+
+    return True
+
+
+def is_unchanged(path: Path, data: bytes) -> bool:
+    """
+    Returns whether the file at `path` exists with exactly the `data`.
+
+    The size of the file is checked first, so only files that may be
+    unchanged are read.
+    """
+
+    try:
+        if path.stat().st_size != len(data):
+            return False
+
+        return path.read_bytes() == data
+    except OSError:
+        return False
@@ -1,4 +1,9 @@
 from . import xml_parser  # type: ignore
 from . import context_creator  # type: ignore
+from . import records  # type: ignore
+from .class_index import ClassIndex
+from .symbol_table import SymbolTable
+from .parse_cache import ParseCache
+from .build_cache import BuildCache
 
-__all__ = ["xml_parser", "context_creator"]
+__all__ = ["xml_parser", "context_creator", "records", "ClassIndex", "SymbolTable", "ParseCache", "BuildCache"]
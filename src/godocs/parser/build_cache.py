@@ -0,0 +1,360 @@
+import hashlib
+import json
+import os
+import sys
+from os import PathLike
+from pathlib import Path
+from typing import TypedDict
+
+from . import context_creator
+from .context_creator import Class, DocContext
+from . import xml_parser
+from .parse_cache import ParseCache
+from godocs.translation.cache import TranslationCache
+from godocs.translation.interpreter import Interpreter
+from godocs.translation.translator import SyntaxTranslator
+from godocs.util.profiling import Profiler
+
+
+class BuildEntry(TypedDict):
+    hash: str
+    name: str
+    inherits: str
+    record: Class
+
+
+class BuildStats(TypedDict):
+    files: int
+    changed: int
+    removed: int
+    updated: int
+
+
+class BuildCache:
+    """
+    An on-disk cache that allows building a `DocContext` incrementally.
+
+    For each input XML file, the cache stores a hash of its content and
+    the translated `Class` record created from it. When building again,
+    only the classes whose files changed are translated; the
+    other ones are loaded from the cache, with their inheritage updated
+    in case any of their ancestors changed.
+
+    The cache is invalidated entirely when the interpreter, the translator
+    or the context creation logic change. Even then, XML files are only
+    parsed again if they changed, as the untranslated records are kept
+    by a `ParseCache` in the same directory.
+
+    Entries are kept in memory between builds made with the same
+    interpreter and translator, so a process that builds repeatedly,
+    like the `--watch` mode of the `construct` command, only reads the
+    cache file once. A cache created without a `path` is never saved.
+    """
+
+    VERSION = 1
+    """
+    The version of the format of the cache file.
+    """
+
+    FILE_NAME = "build.json"
+    """
+    The name of the cache file inside the cache directory.
+    """
+
+    path: Path | None
+    """
+    The directory where the cache file is stored, or `None` if this
+    cache is only kept in memory.
+    """
+
+    entries: dict[str, BuildEntry]
+    """
+    The cached entries, keyed by the path of their XML files.
+    """
+
+    signature: str
+    """
+    A hash identifying the logic used to create the cached records.
+    """
+
+    parse_cache: ParseCache
+    """
+    The `ParseCache` the untranslated records are created with, kept
+    in the same directory.
+    """
+
+    stats: BuildStats
+    """
+    Statistics about the last build made with this cache: how many
+    `files` were read, how many of them `changed` or were `removed`
+    and how many unchanged records had their inheritage `updated`.
+    """
+
+    affected: list[str]
+    """
+    The names of the classes whose records were created or updated
+    in the last build.
+    """
+
+    def __init__(self, path: str | PathLike[str] | None = ".godocs-cache"):
+        self.path = None if path is None else Path(path)
+        self.entries = {}
+        self.signature = ''
+        self.parse_cache = ParseCache(self.path)
+        self.affected = []
+        self.stats = {
+            "files": 0,
+            "changed": 0,
+            "removed": 0,
+            "updated": 0,
+        }
+
+    def load(self, signature: str):
+        """
+        Loads the entries saved in the cache directory, discarding them
+        if they were saved with a different format or `signature`, or if
+        the cache file can't be read or is malformed.
+        """
+
+        self.signature = signature
+        self.entries = {}
+
+        if self.path is None:
+            return
+
+        try:
+            with open(self.path / self.FILE_NAME, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(data, dict):
+            return
+        if data.get("version") != self.VERSION:
+            return
+        if data.get("signature") != signature:
+            return
+
+        entries = data.get("entries")
+
+        if not is_valid(entries):
+            return
+
+        self.entries = entries
+
+    def save(self):
+        """
+        Saves the entries of this cache in the cache directory.
+
+        The cache file is written to a temporary file first and then
+        renamed, so an interrupted build never leaves a corrupted cache.
+        Caches without a `path` aren't saved.
+        """
+
+        if self.path is None:
+            return
+
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        target = self.path / self.FILE_NAME
+        temp = target.with_suffix(".tmp")
+
+        with open(temp, "w", encoding="utf-8") as f:
+            json.dump({
+                "version": self.VERSION,
+                "signature": self.signature,
+                "entries": self.entries,
+            }, f)
+
+        os.replace(temp, target)
+
+    def build(
+        self,
+        path: str | PathLike[str],
+        interpreter: Interpreter,
+        translator: SyntaxTranslator,
+        options: dict[str, str] | None = None,
+        cache: TranslationCache | None = None,
+        check_references: bool = False,
+        profiler: Profiler | None = None,
+        jobs: int | None = None,
+    ) -> DocContext:
+        """
+        Creates and translates a `DocContext` from the XML docs in the
+        `path` received, reusing the records of unchanged files from
+        this cache, and saves the updated cache afterwards if anything
+        changed.
+
+        The entries are loaded first, unless they were already loaded
+        for the same `interpreter` and `translator`.
+
+        The `"index"` of the resulting context only holds XML nodes
+        for the classes that were parsed in this build. If
+        `check_references` is `True`, the `translator` collects the
+        `broken` references of the classes translated in it.
+
+        If a `profiler` is passed, the stages of the build are measured
+        like the ones of a build without cache: `"xml_parser.parse"` and
+        `"context_creator.create"` by the `ParseCache`, and
+        `"context_creator.translate"`, with the classes translated again
+        as items.
+
+        The files that changed are parsed, and their classes translated,
+        in process pools with the given number of `jobs`, like with
+        `xml_parser.parse` and `context_creator.translate`.
+        """
+
+        if options is None:
+            options = {}
+        if cache is None:
+            cache = TranslationCache()
+        if profiler is None:
+            profiler = Profiler()
+
+        signature = get_signature(interpreter, translator)
+
+        if signature != self.signature:
+            self.load(signature)
+
+        # Untranslated records come from a parse cache in the same
+        # directory, so XML files are only parsed when they change.
+        parse_cache = self.parse_cache
+        parsed = parse_cache.create(path, options, profiler, jobs)
+
+        paths = xml_parser.get_files(path)
+
+        entries: dict[str, BuildEntry] = {}
+        updated = 0
+
+        # The keys of the affected classes, in the order of their files.
+        affected: list[str] = []
+
+        # The keys, hashes and records of the classes to translate again.
+        pending: list[tuple[str, str, Class]] = []
+
+        with profiler.stage("context_creator.translate") as stage:
+            for subpath, record in zip(paths, parsed["classes"]):
+                key = str(subpath)
+                digest = parse_cache.entries[key]["hash"]
+
+                entry = self.entries.get(key)
+
+                if entry is not None and entry["hash"] == digest:
+                    entries[key] = entry
+
+                    # Descendants of changed classes only need their
+                    # inheritage updated.
+                    if entry["record"]["inheritage"] != record["inheritage"]:
+                        entry["record"]["inheritage"] = record["inheritage"]
+                        affected.append(key)
+                        updated += 1
+
+                    continue
+
+                affected.append(key)
+                pending.append((key, digest, record))
+
+            # Only changed classes are translated again, so references
+            # are only checked in them.
+            translated = context_creator.translate(
+                {**parsed, "classes": [record for _, _, record in pending]},
+                interpreter, translator, cache, jobs,
+                check_references=check_references,
+            )
+
+            for (key, digest, _), record in zip(pending, translated["classes"]):
+                entries[key] = {
+                    "hash": digest,
+                    "name": record["name"],
+                    "inherits": record["inheritage"][0] if record["inheritage"] else '',
+                    "record": record,
+                }
+
+            changed = len(pending)
+
+            stage["items"] = changed
+
+        removed = sum(1 for key in self.entries if key not in entries)
+
+        self.entries = entries
+        self.affected = [entries[key]["name"] for key in affected]
+        self.stats = {
+            "files": len(paths),
+            "changed": changed,
+            "removed": removed,
+            "updated": updated,
+        }
+
+        if changed > 0 or removed > 0 or updated > 0:
+            self.save()
+
+        return {
+            "options": options,
+            "classes": [entries[str(subpath)]["record"] for subpath in paths],
+            "index": parsed["index"],
+            "hierarchy": parsed["hierarchy"],
+            "symbols": parsed["symbols"],
+        }
+
+
+def is_valid(entries: object) -> bool:
+    """
+    Returns whether the `entries` loaded from a cache file have the
+    structure of the ones of a `BuildCache`.
+    """
+
+    if not isinstance(entries, dict):
+        return False
+
+    return all(
+        isinstance(entry, dict)
+        and BuildEntry.__required_keys__ <= entry.keys()
+        and isinstance(entry["record"], dict)
+        for entry in entries.values()
+    )
+
+
+def get_signature(interpreter: Interpreter, translator: SyntaxTranslator) -> str:
+    """
+    Returns a hash identifying the logic used to create translated
+    records, built from the source files returned by `get_sources`.
+    """
+
+    digest = hashlib.blake2b(str(BuildCache.VERSION).encode(), digest_size=16)
+
+    for name, path in get_sources(interpreter, translator).items():
+        digest.update(name.encode())
+
+        if path.is_file():
+            digest.update(path.read_bytes())
+
+    return digest.hexdigest()
+
+
+def get_sources(interpreter: Interpreter, translator: SyntaxTranslator) -> dict[str, Path]:
+    """
+    Returns the source files of the logic used to create translated
+    records, sorted by name: the ones of the context creator, of the
+    whole `godocs.translation` package (with its base classes, walker
+    and AST nodes) and of the modules of the classes in the MRO of the
+    `interpreter` and `translator`, which may come from scripts.
+    """
+
+    result: dict[str, Path] = {}
+
+    for name in [
+        context_creator.__name__,
+        *(cls.__module__ for cls in type(interpreter).__mro__),
+        *(cls.__module__ for cls in type(translator).__mro__),
+    ]:
+        file = getattr(sys.modules.get(name), "__file__", None)
+
+        if file is not None:
+            result[name] = Path(file)
+
+    package = Path(sys.modules["godocs.translation"].__file__ or '').parent
+
+    for path in package.rglob("*.py"):
+        result[f"godocs.translation/{path.relative_to(package).as_posix()}"] = path
+
+    return dict(sorted(result.items()))
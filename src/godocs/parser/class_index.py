@@ -0,0 +1,169 @@
+from typing import Iterable, Iterator
+from .xml_parser import (
+    XMLNode,
+    XMLDoc,
+)
+
+
+class ClassIndex:
+    """
+    A lookup table from class names to the XML nodes that define them.
+
+    The index is built once from a list of docs, after which getting
+    the node or the parent of a class is a constant time operation,
+    instead of a scan over all the docs.
+
+    Entries can also be registered without their XML node, through
+    the `add_entry` method, for cases in which only the inheritance
+    information of a class is known.
+
+    The inheritance chains of the indexed classes are memoized, so
+    classes that share ancestors (like `Node2D` and `Control`, that
+    both end in `Node -> Object`) reuse the chains already computed.
+    """
+
+    nodes: dict[str, XMLNode]
+    """
+    The root XML nodes of the indexed classes, keyed by class name.
+    """
+
+    parents: dict[str, str]
+    """
+    The name of the class each indexed class inherits from, keyed by
+    class name. Classes without a parent map to an empty `str`.
+    """
+
+    _chains: dict[str, tuple[str, ...]]
+    """
+    Memo table with the inheritance chains already computed, keyed by
+    class name.
+    """
+
+    def __init__(self, docs: Iterable[XMLDoc] | None = None):
+        self.nodes = {}
+        self.parents = {}
+        self._chains = {}
+
+        if docs is None:
+            return
+
+        for doc in docs:
+            self.add(doc.getroot())
+
+    def add(self, root: XMLNode):
+        """
+        Registers the class defined by the `root` node in this index.
+        """
+
+        name = root.attrib.get("name", '')
+
+        self.nodes[name] = root
+
+        self.add_entry(name, root.attrib.get("inherits", ''))
+
+    def add_entry(self, name: str, inherits: str = ''):
+        """
+        Registers a class by its `name` and the name of the class it
+        `inherits` from, without an associated XML node.
+        """
+
+        self.parents[name] = inherits
+        self._chains.clear()
+
+    def remove(self, name: str):
+        """
+        Removes the class with the given `name` from this index, if present.
+        """
+
+        self.nodes.pop(name, None)
+        self.parents.pop(name, None)
+        self._chains.clear()
+
+    def get(self, name: str) -> XMLNode | None:
+        """
+        Returns the root XML node of the class with the given `name`,
+        or `None` if it isn't indexed (or was indexed without a node).
+        """
+
+        return self.nodes.get(name)
+
+    def get_parent(self, name: str) -> str:
+        """
+        Returns the name of the class the class `name` inherits from,
+        or an empty `str` if it has no parent or isn't indexed.
+        """
+
+        return self.parents.get(name, '')
+
+    def get_inheritage(self, name: str) -> list[str]:
+        """
+        Returns the names of the ancestors of the class `name`, starting
+        from its direct parent.
+
+        The chain stops at the first ancestor that isn't indexed, which is
+        still included, and is empty if the class itself isn't indexed.
+        """
+
+        return list(self._get_chain(name))
+
+    def get_hierarchy(self) -> dict[str, list[str]]:
+        """
+        Returns a `dict` with the inheritance chain of every indexed class,
+        keyed by class name.
+        """
+
+        return {name: self.get_inheritage(name) for name in self.parents}
+
+    def _get_chain(self, name: str) -> tuple[str, ...]:
+        """
+        Computes the inheritance chain of the class `name`, reusing and
+        filling the memo table of chains.
+        """
+
+        if name in self._chains:
+            return self._chains[name]
+
+        # Walks up the hierarchy until reaching an ancestor with a known
+        # chain, the topmost class or a class that isn't indexed.
+        path: list[str] = []
+        visited: set[str] = set()
+        current = name
+
+        while (
+            current in self.parents
+            and current not in self._chains
+            and current not in visited
+        ):
+            path.append(current)
+            visited.add(current)
+
+            current = self.parents[current]
+
+        if not path:
+            return ()
+
+        # Builds the chains back down, so every class in the path
+        # is memoized with the chain of its parent as the tail.
+        if current == '':
+            chain: tuple[str, ...] = ()
+        elif current in self._chains:
+            chain = (current, *self._chains[current])
+        else:
+            # The parent isn't indexed (or there is an inheritance cycle).
+            chain = (current,)
+
+        for i in range(len(path) - 1, -1, -1):
+            self._chains[path[i]] = chain
+
+            chain = (path[i], *chain)
+
+        return self._chains[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.parents
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.parents)
+
+    def __len__(self) -> int:
+        return len(self.parents)
@@ -1,10 +1,22 @@
-from typing import TypedDict
+import copy
+import pickle
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Callable, Iterator, TypedDict, cast
+from . import xml_parser
 from .xml_parser import (
     XMLNode,
     XMLDoc,
 )
+from . import records
+from .class_index import ClassIndex
+from .symbol_table import SymbolTable
 from godocs.translation.translator import SyntaxTranslator
+from godocs.translation.translator.syntax_translator import BrokenReference
 from godocs.translation.interpreter import Interpreter
+from godocs.translation.cache import TranslationCache
 
 
 class Property(TypedDict):
@@ -63,9 +75,27 @@ class Class(TypedDict):
 class DocContext(TypedDict):
     classes: list[Class]
     options: dict[str, str]
+    index: ClassIndex
+    hierarchy: dict[str, list[str]]
+    symbols: SymbolTable
 
 
-def get_class_node(class_name: str, docs: list[XMLDoc]) -> XMLNode | None:
+def get_index(docs: list[XMLDoc] | ClassIndex) -> ClassIndex:
+    """
+    Returns the `docs` received as a `ClassIndex`, building one
+    if they are a plain list of docs.
+    """
+
+    if isinstance(docs, ClassIndex):
+        return docs
+
+    return ClassIndex(docs)
+
+
+def get_class_node(class_name: str, docs: list[XMLDoc] | ClassIndex) -> XMLNode | None:
+    if isinstance(docs, ClassIndex):
+        return docs.get(class_name)
+
     for doc in docs:
         root = doc.getroot()
 
@@ -75,22 +105,36 @@ def get_class_node(class_name: str, docs: list[XMLDoc]) -> XMLNode | None:
     return None
 
 
-def parse_inheritage(root: XMLNode, docs: list[XMLDoc]) -> list[str]:
-    result: list[str] = []
+def parse_inheritage(root: XMLNode, docs: list[XMLDoc] | ClassIndex) -> list[str]:
+    """
+    Returns the names of the ancestors of the class represented by `root`,
+    starting from its direct parent.
+
+    The ancestors are looked up in the `docs`, which should preferably be
+    a `ClassIndex`, as a plain list of docs has to be indexed first.
+    """
 
-    parent_name = root.attrib.get("inherits", '')
+    index = get_index(docs)
 
-    while parent_name != '':
-        result.append(parent_name)
+    parent_name = get_attribute(root, "inherits")
 
-        parent = get_class_node(parent_name, docs)
+    if parent_name == '':
+        return []
 
-        if parent is None:
-            break
+    return [parent_name, *index.get_inheritage(parent_name)]
 
-        parent_name = parent.attrib.get("inherits", '')
 
-    return result
+def get_attribute(node: XMLNode, key: str) -> str:
+    """
+    Returns the value of the attribute `key` of a `node`, or an empty
+    str if it has none.
+
+    Values are interned, as the same type names, defaults and member
+    names are repeated in thousands of nodes, so each of them is only
+    kept in memory once, and comparing them is faster.
+    """
+
+    return sys.intern(node.attrib.get(key, ''))
 
 
 def parse_property(node: XMLNode) -> Property:
@@ -120,9 +164,9 @@ def parse_property(node: XMLNode) -> Property:
         "description": '',
     }
 
-    result["name"] = node.attrib.get("name", '')
-    result["type"] = node.attrib.get("type", '')
-    result["default"] = node.attrib.get("default", '')
+    result["name"] = get_attribute(node, "name")
+    result["type"] = get_attribute(node, "type")
+    result["default"] = get_attribute(node, "default")
     result["description"] = node.text.strip() if node.text is not None else ''
 
     return result
@@ -173,8 +217,8 @@ def parse_method(node: XMLNode) -> Method:
         "description": '',
     }
 
-    result["name"] = node.attrib.get("name", '')
-    result["type"] = node.find("return").attrib.get("type", '')  # type: ignore
+    result["name"] = get_attribute(node, "name")
+    result["type"] = get_attribute(node.find("return"), "type")  # type: ignore
     result["description"] = node \
         .find("description") \
         .text.strip() if node.text is not None else ''  # type: ignore
@@ -220,7 +264,7 @@ def parse_signal(node: XMLNode) -> Signal:
         "description": '',
     }
 
-    result["name"] = node.attrib.get("name", '')
+    result["name"] = get_attribute(node, "name")
     result["description"] = node \
         .find("description") \
         .text.strip() if node.text is not None else ''  # type: ignore
@@ -256,8 +300,8 @@ def parse_constant(node: XMLNode) -> Constant:
         "description": '',
     }
 
-    result["name"] = node.attrib.get("name", '')
-    result["value"] = node.attrib.get("value", '')
+    result["name"] = get_attribute(node, "name")
+    result["value"] = get_attribute(node, "value")
     result["description"] = node.text.strip() if node.text is not None else ''
 
     return result
@@ -333,10 +377,10 @@ def parse_theme_item(node: XMLNode) -> ThemeItem:
         "description": '',
     }
 
-    result["name"] = node.attrib.get("name", '')
-    result["data_type"] = node.attrib.get("data_type", '')
-    result["type"] = node.attrib.get("type", '')
-    result["default"] = node.attrib.get("default", '')
+    result["name"] = get_attribute(node, "name")
+    result["data_type"] = get_attribute(node, "data_type")
+    result["type"] = get_attribute(node, "type")
+    result["default"] = get_attribute(node, "default")
     result["description"] = node.text.strip() if node.text is not None else ''
 
     return result
@@ -598,7 +642,7 @@ def parse_enums(node: XMLNode) -> list[Enum]:
     enums: dict[str, list[XMLNode]] = {}
 
     for constant in node.findall("constant"):
-        enum_name = constant.attrib.get("enum", '')
+        enum_name = get_attribute(constant, "enum")
 
         if enum_name == '':
             continue
@@ -664,13 +708,13 @@ def parse_theme_items(node: XMLNode) -> list[ThemeItem]:
     return result
 
 
-def parse_class(root: XMLNode, docs: list[XMLDoc]) -> Class:
+def parse_class_header(root: XMLNode, docs: list[XMLDoc] | ClassIndex) -> Class:
     """
-    Parses an XML node representing a Godot class into a convenient dict
-    with separated information about the class members.
+    Creates the dict of a Godot class from the attributes of its XML root
+    node, with its name and inheritage, but with no members yet.
 
-    The structure of the XML expected is the one generated by Godot's doctool
-    and the generated dict has its structure defined in the Class type.
+    The `docs` are used to look up the ancestors of the class, and should
+    preferably be a `ClassIndex` when parsing many classes.
     """
 
     result: Class = {
@@ -686,98 +730,357 @@ def parse_class(root: XMLNode, docs: list[XMLDoc]) -> Class:
         "theme_items": [],
     }
 
-    result["name"] = root.attrib.get("name", '')
+    result["name"] = get_attribute(root, "name")
     result["inheritage"] = parse_inheritage(root, docs)
-    result["brief_description"] = root \
-        .find("brief_description").text.strip()  # type: ignore
-    result["description"] = root \
-        .find("description").text.strip()  # type: ignore
+
+    return result
+
+
+def parse_class_node(result: Class, node: XMLNode):
+    """
+    Parses a node that is a direct child of a Godot class XML root,
+    storing its data in the `result` dict of that class.
+    """
+
+    match node.tag:
+        case "brief_description":
+            result["brief_description"] = node.text.strip() if node.text is not None else ''
+        case "description":
+            result["description"] = node.text.strip() if node.text is not None else ''
+        case "members": result["properties"] = parse_properties(node)
+        case "methods": result["methods"] = parse_methods(node)
+        case "signals": result["signals"] = parse_signals(node)
+        case "constants":
+            result["constants"] = parse_constants(node)
+            result["enums"] = parse_enums(node)
+        case "theme_items": result["theme_items"] = parse_theme_items(node)
+        case _: pass
+
+
+def parse_class(root: XMLNode, docs: list[XMLDoc] | ClassIndex) -> Class:
+    """
+    Parses an XML node representing a Godot class into a convenient dict
+    with separated information about the class members.
+
+    The structure of the XML expected is the one generated by Godot's doctool
+    and the generated dict has its structure defined in the Class type.
+
+    The `docs` are used to look up the ancestors of the class, and should
+    preferably be a `ClassIndex` when parsing many classes.
+    """
+
+    result = parse_class_header(root, docs)
 
     for node in root:
-        match node.tag:
-            case "members": result["properties"] = parse_properties(node)
-            case "methods": result["methods"] = parse_methods(node)
-            case "signals": result["signals"] = parse_signals(node)
-            case "constants":
-                result["constants"] = parse_constants(node)
-                result["enums"] = parse_enums(node)
-            case "theme_items": result["theme_items"] = parse_theme_items(node)
-            case _: pass
+        parse_class_node(result, node)
+
+    return result
+
+
+def parse_class_file(path: str | Path, docs: list[XMLDoc] | ClassIndex) -> Class:
+    """
+    Parses the XML file of a Godot class into a convenient dict, like
+    `parse_class`, but streaming the file so that only one of the
+    sections of the class is held as XML nodes at a time.
+    """
+
+    nodes = xml_parser.stream_file(path)
+
+    result = parse_class_header(next(nodes), docs)
+
+    for node in nodes:
+        parse_class_node(result, node)
 
     return result
 
 
 def create(
         docs: list[XMLDoc],
-        options: dict[str, str] | None = None
+        options: dict[str, str] | None = None,
+        compact: bool = False,
 ) -> DocContext:
     """
     Creates a DocContext with information about all classes present in the
     docs list passed, as well as with data about the options desired to keep
     in context inside the options parameter.
+
+    The `ClassIndex` built from the docs is also stored in the context
+    under the `"index"` key, so that it can be queried by constructors,
+    and the inheritance chains of all classes under the `"hierarchy"` key.
+
+    A `SymbolTable` with all the documented symbols is stored under the
+    `"symbols"` key, so that references can be resolved while
+    translating the context.
+
+    If `compact` is `True`, classes and their members are stored as
+    the slotted records of the `records` module instead of dicts, which
+    takes much less memory for large docs.
     """
 
     if options is None:
         options = {}
 
+    index = ClassIndex(docs)
+
     result: DocContext = {
         "options": options,
         "classes": [],
+        "index": index,
+        "hierarchy": {},
+        "symbols": SymbolTable(),
     }
 
     for doc in docs:
-        root = doc.getroot()
+        class_doc = parse_class(doc.getroot(), index)
 
-        result["classes"].append(parse_class(root, docs))
+        result["classes"].append(to_record(class_doc) if compact else class_doc)
+
+    result["hierarchy"] = index.get_hierarchy()
+    result["symbols"] = SymbolTable(result["classes"])
 
     return result
 
 
-def translate(ctx: DocContext, interpreter: Interpreter, translator: SyntaxTranslator):
-    classes = ctx["classes"]
-    for class_doc in classes:
-        for member in class_doc:
-            match(member):
-                case "brief_description":
-                    class_doc[member] = interpreter.interpret(
-                        class_doc[member]).translate(translator)
-                case "description":
-                    class_doc[member] = interpreter.interpret(
-                        class_doc[member]).translate(translator)
-                case "constants":
-                    constants = class_doc[member]
+def stream(
+        path: str | Path,
+        index: ClassIndex | None = None,
+        compact: bool = False,
+) -> Iterator[Class]:
+    """
+    Yields the dicts of the Godot classes from the XML files in `path`
+    one at a time, parsing each file only when its class is requested.
+
+    Differently from `create`, the XML trees of the classes aren't kept
+    in memory, so peak memory stays close to the size of a single class.
+    To resolve inheritances, a `ClassIndex` is built beforehand from the
+    root attributes of the files, unless an `index` is passed.
+
+    If `compact` is `True`, the classes are yielded as `ClassRecords`.
+    """
+
+    paths = xml_parser.get_files(path)
+
+    if index is None:
+        index = ClassIndex()
+
+        for subpath in paths:
+            header = xml_parser.parse_header(subpath)
+
+            index.add_entry(header.get("name", ''), header.get("inherits", ''))
+
+    for subpath in paths:
+        class_doc = parse_class_file(subpath, index)
+
+        yield to_record(class_doc) if compact else class_doc
+
+
+def to_record(class_doc: Class) -> Class:
+    """
+    Converts a `class_doc` dict into a `ClassRecord`, which implements
+    the same mapping interface, so it can be used wherever a `Class` is.
+    """
+
+    return cast(Class, records.compact(class_doc))
+
+
+def translate_class(
+        class_doc: Class,
+        interpreter: Interpreter,
+        translator: SyntaxTranslator,
+        cache: TranslationCache | None = None,
+) -> Class:
+    """
+    Translates the descriptions of the `class_doc` received, in place,
+    interpreting them with the `interpreter` and translating the
+    resulting AST with the `translator`.
+
+    Repeated descriptions are only converted once, through a
+    `TranslationCache`. If no `cache` is passed, a new one is used
+    for this call.
+
+    The `translator` has its `scope` set to the name of the class, so
+    unqualified references are resolved relative to it.
+    """
+
+    if cache is None:
+        cache = TranslationCache()
+
+    translator.scope = class_doc["name"]
+
+    def convert(text: str) -> str:
+        return cache.translate(text, interpreter, translator)
+
+    for member in class_doc:
+        match(member):
+            case "brief_description":
+                class_doc[member] = convert(class_doc[member])
+            case "description":
+                class_doc[member] = convert(class_doc[member])
+            case "constants":
+                constants = class_doc[member]
+                for constant in constants:
+                    constant["description"] = convert(constant["description"])
+            case "enums":
+                enums = class_doc[member]
+                for enum in enums:
+                    enum["description"] = convert(enum["description"])
+                    constants = enum["values"]
                     for constant in constants:
-                        constant["description"] = interpreter.interpret(
-                            constant["description"]).translate(translator)
-                case "enums":
-                    enums = class_doc[member]
-                    for enum in enums:
-                        enum["description"] = interpreter.interpret(
-                            enum["description"]).translate(translator)
-                        constants = enum["values"]
-                        for constant in constants:
-                            constant["description"] = interpreter.interpret(
-                                constant["description"]).translate(translator)
-                case "methods":
-                    methods = class_doc[member]
-                    for method in methods:
-                        method["description"] = interpreter.interpret(
-                            method["description"]).translate(translator)
-                case "properties":
-                    properties = class_doc[member]
-                    for property in properties:
-                        property["description"] = interpreter.interpret(
-                            property["description"]).translate(translator)
-                case "signals":
-                    signals = class_doc[member]
-                    for signal in signals:
-                        signal["description"] = interpreter.interpret(
-                            signal["description"]).translate(translator)
-                case "theme_items":
-                    theme_items = class_doc[member]
-                    for theme_item in theme_items:
-                        theme_item["description"] = interpreter.interpret(
-                            theme_item["description"]).translate(translator)
-                case _: pass
+                        constant["description"] = convert(constant["description"])
+            case "methods":
+                methods = class_doc[member]
+                for method in methods:
+                    method["description"] = convert(method["description"])
+            case "properties":
+                properties = class_doc[member]
+                for property in properties:
+                    property["description"] = convert(property["description"])
+            case "signals":
+                signals = class_doc[member]
+                for signal in signals:
+                    signal["description"] = convert(signal["description"])
+            case "theme_items":
+                theme_items = class_doc[member]
+                for theme_item in theme_items:
+                    theme_item["description"] = convert(theme_item["description"])
+            case _: pass
+
+    return class_doc
+
+
+def translate(
+        ctx: DocContext,
+        interpreter: Interpreter | Callable[[], Interpreter],
+        translator: SyntaxTranslator | Callable[[], SyntaxTranslator],
+        cache: TranslationCache | None = None,
+        jobs: int | None = None,
+        executor: Executor | None = None,
+        check_references: bool = False,
+) -> DocContext:
+    """
+    Translates the descriptions of all classes in the `ctx` received,
+    interpreting them with the `interpreter` and translating the
+    resulting AST with the `translator`.
+
+    Repeated descriptions are only converted once, through a
+    `TranslationCache`. If no `cache` is passed, a new one is used
+    for this call.
+
+    The classes can be translated in a process pool with the given
+    number of `jobs` (`0` uses one worker per CPU), or with an
+    `executor`. In that case, the `interpreter` and `translator` are
+    sent to the workers, so they should be picklable instances, or
+    factories (like their classes) that create them. If they can't be
+    pickled, the classes are translated serially instead.
+
+    If `check_references` is `True`, the `"symbols"` of the `ctx` are
+    given to the `translator` (and to the ones of the workers), which
+    then collects the references that point to no documented symbol
+    in its `broken` list.
+    """
+
+    interpreter = get_instance(interpreter, Interpreter)
+    translator = get_instance(translator, SyntaxTranslator)
+
+    classes = ctx["classes"]
+    symbols = ctx.get("symbols") if check_references else None
+
+    workers = min(xml_parser.get_workers(jobs), len(classes))
+
+    if (executor is None and workers <= 1) or not is_picklable(interpreter, translator):
+        translator.use_symbols(symbols)
+
+        if cache is None:
+            cache = TranslationCache()
+
+        for class_doc in classes:
+            translate_class(class_doc, interpreter, translator, cache)
+
+        return ctx
+
+    # Sends classes in batches, so each worker can reuse its cache
+    # for the descriptions repeated within a batch.
+    chunksize = max(1, len(classes) // (workers * 4))
+    chunks = [classes[i:i + chunksize]
+              for i in range(0, len(classes), chunksize)]
+
+    args = (
+        translate_classes,
+        chunks,
+        repeat(interpreter),
+        repeat(translator),
+        repeat(symbols),
+    )
+
+    if executor is not None:
+        results = list(executor.map(*args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(*args))
+
+    ctx["classes"] = [class_doc for chunk, _ in results for class_doc in chunk]
+
+    # The symbols are sent to the workers apart, so they aren't
+    # pickled along with the translator.
+    translator.use_symbols(symbols)
+
+    for _, broken in results:
+        translator.broken.extend(broken)
 
     return ctx
+
+
+def translate_classes(
+        classes: list[Class],
+        interpreter: Interpreter | Callable[[], Interpreter],
+        translator: SyntaxTranslator | Callable[[], SyntaxTranslator],
+        symbols: SymbolTable | None = None,
+) -> tuple[list[Class], list[BrokenReference]]:
+    """
+    Translates a list of classes with a cache of their own, returning them
+    along with the broken references found in them, if `symbols` to
+    check them against are passed.
+
+    This is the work done by each worker when translating in parallel.
+    """
+
+    interpreter = get_instance(interpreter, Interpreter)
+
+    # Workers in threads may share the translator, whose scope and
+    # broken references are set while translating, so each one uses
+    # its own copy.
+    translator = copy.copy(get_instance(translator, SyntaxTranslator))
+    translator.use_symbols(symbols)
+
+    cache = TranslationCache()
+
+    for class_doc in classes:
+        translate_class(class_doc, interpreter, translator, cache)
+
+    return classes, translator.broken
+
+
+def get_instance[T](source: T | Callable[[], T], base: type[T]) -> T:
+    """
+    Returns the `source` received if it is an instance of the `base`
+    class, or the instance created by calling it, if it is a factory.
+    """
+
+    if isinstance(source, base):
+        return source
+
+    return cast(Callable[[], T], source)()
+
+
+def is_picklable(*objects: object) -> bool:
+    """
+    Returns whether all the `objects` received can be pickled, and thus
+    sent to worker processes.
+    """
+
+    try:
+        pickle.dumps(objects)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+
+    return True
@@ -0,0 +1,367 @@
+import hashlib
+import json
+import os
+import sys
+from os import PathLike
+from pathlib import Path
+from typing import TypedDict
+import xml.etree.ElementTree as ET
+
+from . import context_creator
+from . import xml_parser
+from .class_index import ClassIndex
+from .context_creator import Class, DocContext
+from .symbol_table import SymbolTable
+from .xml_parser import XMLNode
+from godocs.util.profiling import Profiler
+
+
+class ParseEntry(TypedDict):
+    size: int
+    mtime: int
+    hash: str
+    name: str
+    inherits: str
+    record: str
+
+
+class ParseStats(TypedDict):
+    files: int
+    hashed: int
+    parsed: int
+    removed: int
+
+
+class ParseCache:
+    """
+    An on-disk cache of the `Class` records parsed from XML files, which
+    allows creating a `DocContext` without parsing unchanged files again.
+
+    For each input XML file, the cache stores its size, modification time
+    and a hash of its content, along with the untranslated `Class` record
+    parsed from it, as JSON. When creating a context again, files whose
+    size and modification time didn't change are trusted without being
+    read, files that were only touched are hashed, and only files whose
+    content changed are parsed.
+
+    Since the records aren't translated, the cache stays valid when the
+    interpreter, the translator or the templates change, and is only
+    invalidated when the parsing logic itself changes.
+
+    A cache created without a `path` is only kept in memory, which is
+    useful for processes that create many contexts, like the `--watch`
+    mode of the `construct` command.
+    """
+
+    VERSION = 2
+    """
+    The version of the format of the cache file.
+    """
+
+    FILE_NAME = "parse.json"
+    """
+    The name of the cache file inside the cache directory.
+    """
+
+    path: Path | None
+    """
+    The directory where the cache file is stored, or `None` if this
+    cache is only kept in memory.
+    """
+
+    entries: dict[str, ParseEntry]
+    """
+    The cached entries, keyed by the path of their XML files.
+    """
+
+    signature: str
+    """
+    A hash identifying the logic used to parse the cached records.
+    """
+
+    stats: ParseStats
+    """
+    Statistics about the last context created with this cache: how many
+    `files` were found, how many of them had to be `hashed` and `parsed`
+    and how many were `removed`.
+    """
+
+    def __init__(self, path: str | PathLike[str] | None = ".godocs-cache"):
+        self.path = None if path is None else Path(path)
+        self.entries = {}
+        self.signature = ''
+        self.stats = {
+            "files": 0,
+            "hashed": 0,
+            "parsed": 0,
+            "removed": 0,
+        }
+
+    def load(self, signature: str | None = None):
+        """
+        Loads the entries saved in the cache directory, discarding them
+        if they were saved with a different format or `signature`.
+
+        If no `signature` is passed, the one of the current parsing
+        logic is used.
+
+        The cache file only holds data, as it may be committed along
+        with a project, and files that can't be read or are malformed
+        are discarded too.
+        """
+
+        if signature is None:
+            signature = get_signature()
+
+        self.signature = signature
+        self.entries = {}
+
+        if self.path is None:
+            return
+
+        try:
+            with open(self.path / self.FILE_NAME, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(data, dict):
+            return
+        if data.get("version") != self.VERSION:
+            return
+        if data.get("signature") != signature:
+            return
+
+        entries = data.get("entries")
+
+        if not is_valid(entries):
+            return
+
+        self.entries = entries
+
+    def save(self):
+        """
+        Saves the entries of this cache in the cache directory.
+
+        The cache file is written to a temporary file first and then
+        renamed, so an interrupted run never leaves a corrupted cache.
+        Caches without a `path` aren't saved.
+        """
+
+        if self.path is None:
+            return
+
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        target = self.path / self.FILE_NAME
+        temp = target.with_suffix(".tmp")
+
+        with open(temp, "w", encoding="utf-8") as f:
+            json.dump({
+                "version": self.VERSION,
+                "signature": self.signature,
+                "entries": self.entries,
+            }, f)
+
+        os.replace(temp, target)
+
+    def create(
+        self,
+        path: str | PathLike[str],
+        options: dict[str, str] | None = None,
+        profiler: Profiler | None = None,
+        jobs: int | None = None,
+    ) -> DocContext:
+        """
+        Creates a `DocContext` from the XML docs in the `path` received,
+        like `context_creator.create`, reusing the records of unchanged
+        files from this cache, and saves the updated cache afterwards
+        if anything changed.
+
+        The entries are loaded first, if they weren't already. The
+        `"index"` of the resulting context only holds XML nodes for the
+        classes that were parsed.
+
+        If a `profiler` is passed, the reading and parsing of the files
+        are measured as its `"xml_parser.parse"` stage, with the files
+        parsed as items, and the creation of the records as its
+        `"context_creator.create"` stage.
+
+        The files that changed are parsed in a process pool with the
+        given number of `jobs`, like with `xml_parser.parse`.
+        """
+
+        if options is None:
+            options = {}
+        if profiler is None:
+            profiler = Profiler()
+
+        if not self.signature:
+            self.load()
+
+        paths = xml_parser.get_files(path)
+
+        index = ClassIndex()
+        entries: dict[str, ParseEntry] = {}
+        changed: dict[str, tuple[XMLNode, os.stat_result, str]] = {}
+        hashed = 0
+
+        # Files are only parsed apart from being read if there are
+        # workers to parse them.
+        pending: dict[str, tuple[Path, os.stat_result, str]] = {}
+        parallel = xml_parser.get_workers(jobs) > 1
+
+        with profiler.stage("xml_parser.parse") as stage:
+            for subpath in paths:
+                key = str(subpath)
+                stat = subpath.stat()
+
+                entry = self.entries.get(key)
+
+                if entry is not None and entry["size"] == stat.st_size \
+                        and entry["mtime"] == stat.st_mtime_ns:
+                    entries[key] = entry
+                    continue
+
+                data = subpath.read_bytes()
+                digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+
+                hashed += 1
+
+                # The file was only touched, so its record is still valid.
+                if entry is not None and entry["hash"] == digest:
+                    entries[key] = {
+                        **entry,
+                        "size": stat.st_size,
+                        "mtime": stat.st_mtime_ns,
+                    }
+                    continue
+
+                if parallel:
+                    pending[key] = (subpath, stat, digest)
+                    continue
+
+                changed[key] = (ET.fromstring(data), stat, digest)
+
+            docs = xml_parser.parse_files(
+                [subpath for subpath, _, _ in pending.values()], jobs)
+
+            for (key, (_, stat, digest)), doc in zip(pending.items(), docs):
+                changed[key] = (doc.getroot(), stat, digest)
+
+            # Classes are indexed in the order of their files, however
+            # they were parsed.
+            for subpath in paths:
+                key = str(subpath)
+
+                if key in changed:
+                    index.add(changed[key][0])
+                else:
+                    index.add_entry(entries[key]["name"], entries[key]["inherits"])
+
+            stage["items"] = len(changed)
+
+        classes: list[Class] = []
+
+        with profiler.stage("context_creator.create") as stage:
+            for subpath in paths:
+                key = str(subpath)
+
+                if key in changed:
+                    root, stat, digest = changed[key]
+
+                    record = context_creator.parse_class(root, index)
+
+                    entries[key] = {
+                        "size": stat.st_size,
+                        "mtime": stat.st_mtime_ns,
+                        "hash": digest,
+                        "name": record["name"],
+                        "inherits": root.attrib.get("inherits", ''),
+                        "record": json.dumps(record),
+                    }
+
+                    classes.append(record)
+                    continue
+
+                # Records are decoded for each context created, so they
+                # can be translated in place without changing this cache.
+                entry = entries[key]
+                record = json.loads(entry["record"])
+
+                # Ancestors of the class may have changed.
+                record["inheritage"] = get_inheritage(entry["inherits"], index)
+
+                classes.append(record)
+
+            stage["items"] = len(classes)
+
+        removed = sum(1 for key in self.entries if key not in entries)
+
+        self.stats = {
+            "files": len(paths),
+            "hashed": hashed,
+            "parsed": len(changed),
+            "removed": removed,
+        }
+
+        dirty = hashed > 0 or removed > 0
+
+        self.entries = entries
+
+        if dirty:
+            self.save()
+
+        return {
+            "options": options,
+            "classes": classes,
+            "index": index,
+            "hierarchy": index.get_hierarchy(),
+            "symbols": SymbolTable(classes),
+        }
+
+
+def is_valid(entries: object) -> bool:
+    """
+    Returns whether the `entries` loaded from a cache file have the
+    structure of the ones of a `ParseCache`.
+    """
+
+    if not isinstance(entries, dict):
+        return False
+
+    return all(
+        isinstance(entry, dict) and ParseEntry.__required_keys__ <= entry.keys()
+        for entry in entries.values()
+    )
+
+
+def get_inheritage(parent: str, index: ClassIndex) -> list[str]:
+    """
+    Returns the names of the ancestors of a class whose direct `parent`
+    is given, as `context_creator.parse_inheritage` does.
+    """
+
+    if parent == '':
+        return []
+
+    return [parent, *index.get_inheritage(parent)]
+
+
+def get_signature() -> str:
+    """
+    Returns a hash identifying the logic used to parse records, built
+    from the source files of the XML parser and the context creator.
+    """
+
+    digest = hashlib.blake2b(str(ParseCache.VERSION).encode(), digest_size=16)
+
+    for name in (xml_parser.__name__, context_creator.__name__):
+        digest.update(name.encode())
+
+        file = getattr(sys.modules.get(name), "__file__", None)
+
+        if file is not None and Path(file).is_file():
+            digest.update(Path(file).read_bytes())
+
+    return digest.hexdigest()
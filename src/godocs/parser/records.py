@@ -0,0 +1,156 @@
+from collections.abc import MutableMapping
+from dataclasses import dataclass, field
+from typing import Any, Iterator, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .context_creator import Class
+
+
+class Record(MutableMapping[str, Any]):
+    """
+    Base class of the compact records of a `DocContext`, which are
+    slotted dataclasses with the same fields as the `TypedDict` types
+    of `context_creator`.
+
+    Records have no `__dict__`, so each one only takes the memory of its
+    fields, instead of a hash table. They still implement the mapping
+    interface over their fields, so code and templates that index them
+    like dicts (`property["name"]`) keep working, as does comparing them
+    with dicts, while attribute access (`property.name`) is faster.
+
+    Fields can be changed but not removed, and no other keys can be set.
+    Since `EnumRecord` has a `values` field, its `values()` method is
+    shadowed, so its fields should be read by key or attribute.
+    """
+
+    __slots__ = ()
+
+    __match_args__: tuple[str, ...]
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__match_args__:
+            raise KeyError(key)
+
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key not in self.__match_args__:
+            raise KeyError(key)
+
+        setattr(self, key, value)
+
+    def __delitem__(self, key: str):
+        raise TypeError(f"{type(self).__name__} fields can't be removed")
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__match_args__
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__match_args__)
+
+    def __len__(self) -> int:
+        return len(self.__match_args__)
+
+
+@dataclass(slots=True, eq=False)
+class PropertyRecord(Record):
+    name: str
+    type: str
+    default: str
+    description: str
+
+
+@dataclass(slots=True, eq=False)
+class ConstantRecord(Record):
+    name: str
+    value: str
+    description: str
+
+
+@dataclass(slots=True, eq=False)
+class MethodRecord(Record):
+    name: str
+    type: str
+    args: list[PropertyRecord]
+    description: str
+
+
+@dataclass(slots=True, eq=False)
+class SignalRecord(Record):
+    name: str
+    args: list[PropertyRecord]
+    description: str
+
+
+@dataclass(slots=True, eq=False)
+class EnumRecord(Record):
+    name: str
+    # Without a default, the one of `values` would be the method of
+    # the mapping interface it shadows.
+    values: list[ConstantRecord] = field(default_factory=list)
+    description: str = ''
+
+
+@dataclass(slots=True, eq=False)
+class ThemeItemRecord(Record):
+    name: str
+    data_type: str
+    type: str
+    default: str
+    description: str
+
+
+@dataclass(slots=True, eq=False)
+class ClassRecord(Record):
+    name: str
+    inheritage: list[str]
+    brief_description: str
+    description: str
+    properties: list[PropertyRecord]
+    methods: list[MethodRecord]
+    signals: list[SignalRecord]
+    constants: list[ConstantRecord]
+    enums: list[EnumRecord]
+    theme_items: list[ThemeItemRecord]
+
+
+def compact(class_doc: "Class | ClassRecord") -> ClassRecord:
+    """
+    Returns a `ClassRecord` with the data of a `class_doc` dict, with
+    all of its members converted to records as well.
+    """
+
+    return ClassRecord(
+        name=class_doc["name"],
+        inheritage=class_doc["inheritage"],
+        brief_description=class_doc["brief_description"],
+        description=class_doc["description"],
+        properties=[PropertyRecord(**p) for p in class_doc["properties"]],
+        methods=[
+            MethodRecord(
+                name=m["name"],
+                type=m["type"],
+                args=[PropertyRecord(**a) for a in m["args"]],
+                description=m["description"],
+            )
+            for m in class_doc["methods"]
+        ],
+        signals=[
+            SignalRecord(
+                name=s["name"],
+                args=[PropertyRecord(**a) for a in s["args"]],
+                description=s["description"],
+            )
+            for s in class_doc["signals"]
+        ],
+        constants=[ConstantRecord(**c) for c in class_doc["constants"]],
+        enums=[
+            EnumRecord(
+                name=e["name"],
+                values=[ConstantRecord(**c) for c in e["values"]],
+                description=e["description"],
+            )
+            for e in class_doc["enums"]
+        ],
+        theme_items=[ThemeItemRecord(**t) for t in class_doc["theme_items"]],
+    )
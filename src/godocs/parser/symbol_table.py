@@ -0,0 +1,192 @@
+from typing import Iterable, TypedDict, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .context_creator import Class
+
+
+class Symbol(TypedDict):
+    kind: str
+    class_name: str
+    enum: str
+    name: str
+
+
+KINDS = ("class", "member", "method", "signal", "constant", "enum", "theme_item")
+"""
+The kinds of the symbols in a `SymbolTable`, named like the `BBCode`
+tags that reference them.
+"""
+
+GLOBAL_SCOPES = ("@GlobalScope", "@GDScript")
+"""
+The classes whose symbols can be referenced without being qualified
+from any other class.
+"""
+
+
+class SymbolTable:
+    """
+    A lookup table from the qualified names of the documented symbols
+    (classes and their members, signals, constants, enums and theme
+    items) to where they are documented.
+
+    Qualified names follow the ones used by `BBCode` references, like
+    `"Node"` for a class, `"Node.name"` for its members or
+    `"Node.PROCESS_MODE_INHERIT"` for the values of its enums.
+    Since a class can have symbols of different kinds with the same
+    name, symbols are indexed by their kind and qualified name, so
+    each lookup is a single hash table access.
+    """
+
+    symbols: dict[str, dict[str, Symbol]]
+    """
+    The symbols of each kind, keyed by their qualified names.
+    """
+
+    inheritage: dict[str, list[str]]
+    """
+    The ancestors of the indexed classes, keyed by class name, used
+    to resolve references to inherited symbols.
+    """
+
+    _scopes: dict[str, tuple[str, ...]]
+    """
+    Memo table with the classes that unqualified names are looked up
+    in from each class, keyed by class name.
+    """
+
+    def __init__(self, classes: Iterable["Class"] | None = None):
+        self.symbols = {kind: {} for kind in KINDS}
+        self.inheritage = {}
+        self._scopes = {}
+
+        if classes is None:
+            return
+
+        for class_doc in classes:
+            self.add(class_doc)
+
+    def add(self, class_doc: "Class"):
+        """
+        Registers a class and all of its symbols in this table.
+        """
+
+        class_name = class_doc["name"]
+
+        self.inheritage[class_name] = class_doc["inheritage"]
+        self._scopes.clear()
+
+        self.add_symbol("class", class_name, '')
+
+        for kind, key in (
+            ("member", "properties"),
+            ("method", "methods"),
+            ("signal", "signals"),
+            ("constant", "constants"),
+            ("theme_item", "theme_items"),
+        ):
+            for member in class_doc[key]:
+                self.add_symbol(kind, class_name, member["name"])
+
+        for enum in class_doc["enums"]:
+            self.add_symbol("enum", class_name, enum["name"])
+
+            for value in enum["values"]:
+                self.add_symbol("constant", class_name, value["name"], enum["name"])
+
+    def add_symbol(self, kind: str, class_name: str, name: str, enum: str = ''):
+        """
+        Registers a symbol of a `kind` documented in a class, whose
+        `name` is empty for the class itself.
+        """
+
+        qualified = f"{class_name}.{name}" if name else class_name
+
+        self.symbols[kind][qualified] = {
+            "kind": kind,
+            "class_name": class_name,
+            "enum": enum,
+            "name": name,
+        }
+
+    def get(self, kind: str, qualified: str) -> Symbol | None:
+        """
+        Returns the symbol of a `kind` with a `qualified` name, if any.
+        """
+
+        table = self.symbols.get(kind)
+
+        if table is None:
+            return None
+
+        return table.get(qualified)
+
+    def resolve(self, kind: str, name: str, scope: str = '') -> Symbol | None:
+        """
+        Returns the symbol of a `kind` that a reference to `name` made
+        in the documentation of the `scope` class points to, if any.
+
+        Names that aren't qualified are looked up in the `scope` class,
+        in its ancestors and in the `GLOBAL_SCOPES`, as are qualified
+        names of members inherited by the class that qualifies them.
+        """
+
+        table = self.symbols.get(kind)
+
+        if table is None:
+            return None
+
+        result = table.get(name)
+
+        if result is not None or kind == "class":
+            return result
+
+        owner, _, member = name.rpartition('.')
+
+        if not owner:
+            owner = scope
+
+        scopes = self._scopes.get(owner)
+
+        if scopes is None:
+            scopes = (owner, *self.inheritage.get(owner, ()), *GLOBAL_SCOPES)
+            self._scopes[owner] = scopes
+
+        for class_name in scopes:
+            result = table.get(f"{class_name}.{member}")
+
+            if result is not None:
+                return result
+
+        return None
+
+    def is_documented(self, kind: str, name: str, scope: str = '') -> bool:
+        """
+        Returns whether all the classes that a reference to `name` made
+        in the documentation of the `scope` class could point into are
+        documented, so that failing to `resolve` it means the reference
+        is broken.
+
+        That's never the case for references to classes, which may be
+        any class of the engine, nor for references to members of
+        classes that have undocumented ancestors, like the ones of an
+        addon inheriting from engine classes.
+        """
+
+        if kind == "class" or kind not in self.symbols:
+            return False
+
+        owner = name.rpartition('.')[0] or scope
+
+        ancestors = self.inheritage.get(owner)
+
+        if ancestors is None:
+            return False
+
+        return all(ancestor in self.inheritage for ancestor in ancestors)
+
+    def __contains__(self, qualified: str) -> bool:
+        return any(qualified in table for table in self.symbols.values())
+
+    def __len__(self) -> int:
+        return sum(len(table) for table in self.symbols.values())
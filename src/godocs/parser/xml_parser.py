@@ -1,4 +1,7 @@
+from concurrent.futures import Executor, ProcessPoolExecutor
+from os import cpu_count
 from pathlib import Path
+from typing import Iterator
 import xml.etree.ElementTree as ET
 
 type XMLNode = ET.Element[str]
@@ -24,12 +27,171 @@ def parse_file(path: str | Path) -> XMLDoc:
     return ET.parse(path)
 
 
-def parse_folder(path: str | Path) -> list[XMLDoc]:
+def stream_file(path: str | Path) -> Iterator[XMLNode]:
+    """
+    Parses an XML file from a given path incrementally, with `ET.iterparse`.
+
+    The first element yielded is the root of the document, as soon as its
+    start tag is read, so only its attributes are guaranteed to be
+    available. After that, each direct child of the root is yielded once
+    it is completely parsed, and removed from the root when the next one
+    is requested, so only one of them is kept in memory at a time.
+
+    Args:
+      path: Path to the XML file.
+
+    Returns:
+      An iterator over the root and then its children.
+
+    Raises:
+        FileNotFoundError: If the file at the given path does not exist.
+        xml.etree.ElementTree.ParseError: If the file is not a valid XML document.
+    """
+
+    with open(path, "rb") as f:
+        root: XMLNode | None = None
+        depth = 0
+
+        for event, node in ET.iterparse(f, events=("start", "end")):
+            if event == "start":
+                depth += 1
+
+                if root is None:
+                    root = node
+                    yield root
+
+                continue
+
+            depth -= 1
+
+            if depth == 1 and root is not None:
+                yield node
+
+                root.remove(node)
+
+
+def parse_header(path: str | Path) -> dict[str, str]:
+    """
+    Returns the attributes of the root of an XML file from a given path,
+    reading only as much of the file as needed to get them.
+
+    Args:
+      path: Path to the XML file.
+
+    Returns:
+      A dict with the attributes of the root element.
+
+    Raises:
+        FileNotFoundError: If the file at the given path does not exist.
+        xml.etree.ElementTree.ParseError: If the file is not a valid XML document.
+    """
+
+    nodes = stream_file(path)
+
+    try:
+        return dict(next(nodes).attrib)
+    finally:
+        nodes.close()
+
+
+def get_files(path: str | Path) -> list[Path]:
+    """
+    Returns the paths of the XML files from a given path.
+
+    If the path points to a file, returns only that file.
+    If the path points to a directory, returns all XML files in the
+    directory, in alphabetical order.
+
+    Args:
+      path: Path to an XML file or a directory containing XML files.
+
+    Returns:
+      A list with the paths of the XML files.
+
+    Raises:
+        NotADirectoryError: If the path doesn't point to a file or directory.
+    """
+
+    path = Path(path)
+
+    if path.is_file():
+        return [path]
+    if not path.is_dir():
+        raise NotADirectoryError(f"{path} is not a directory")
+
+    return sorted(path.glob("*.xml"))
+
+
+def get_workers(jobs: int | None) -> int:
+    """
+    Returns the number of worker processes to use given a `jobs` count.
+
+    A `jobs` of `None` or `1` means the work should be done serially,
+    while `0` (or any negative number) means that one worker per CPU
+    should be used.
+    """
+
+    if jobs is None:
+        return 1
+    if jobs <= 0:
+        return cpu_count() or 1
+
+    return jobs
+
+
+def parse_files(
+    paths: list[Path],
+    jobs: int | None = None,
+    executor: Executor | None = None,
+) -> list[XMLDoc]:
+    """
+    Parses a list of XML files, returning their ElementTree objects in the
+    same order as the `paths` received.
+
+    Args:
+      paths: Paths to the XML files.
+      jobs: Number of worker processes to spread the parsing over.
+        `None` or `1` parses serially and `0` uses one worker per CPU.
+      executor: An `Executor` to use instead of creating a process pool.
+        When passed, `jobs` is ignored.
+
+    Returns:
+      List with the parsed ElementTrees containing the XML data.
+    """
+
+    if executor is not None:
+        return list(executor.map(parse_file, paths))
+
+    workers = min(get_workers(jobs), len(paths))
+
+    if workers <= 1:
+        return [parse_file(subpath) for subpath in paths]
+
+    # Sends files in batches so that the inter-process overhead doesn't
+    # outweigh the cost of parsing small files.
+    chunksize = max(1, len(paths) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(parse_file, paths, chunksize=chunksize))
+
+
+def parse_folder(
+    path: str | Path,
+    jobs: int | None = None,
+    executor: Executor | None = None,
+) -> list[XMLDoc]:
     """
     Parses all XML files from a given path and returns a list with ElementTree objects.
 
+    The files are parsed in the alphabetical order of their paths, so
+    the result is deterministic regardless of how many `jobs` are used.
+
     Args:
       path: Path to the folder containing XML files.
+      jobs: Number of worker processes to spread the parsing over.
+        `None` or `1` parses serially and `0` uses one worker per CPU.
+      executor: An `Executor` to use instead of creating a process pool.
+        When passed, `jobs` is ignored.
 
     Returns:
       List with the parsed ElementTrees containing the XML data.
@@ -43,10 +205,14 @@ def parse_folder(path: str | Path) -> list[XMLDoc]:
     if not path.is_dir():
         raise NotADirectoryError(f"{path} is not a directory")
 
-    return [parse_file(subpath) for subpath in path.glob("*.xml")]
+    return parse_files(sorted(path.glob("*.xml")), jobs, executor)
 
 
-def parse(path: str | Path) -> list[XMLDoc]:
+def parse(
+    path: str | Path,
+    jobs: int | None = None,
+    executor: Executor | None = None,
+) -> list[XMLDoc]:
     """
     Parses one or more XML files from a given path.
 
@@ -56,6 +222,10 @@ def parse(path: str | Path) -> list[XMLDoc]:
 
     Args:
       path: Path to an XML file or a directory containing XML files.
+      jobs: Number of worker processes to spread the parsing over.
+        `None` or `1` parses serially and `0` uses one worker per CPU.
+      executor: An `Executor` to use instead of creating a process pool.
+        When passed, `jobs` is ignored.
 
     Returns:
       A list of ElementTree objects parsed from the XML files.
@@ -67,4 +237,4 @@ def parse(path: str | Path) -> list[XMLDoc]:
 
     path = Path(path)
 
-    return [parse_file(path)] if path.is_file() else parse_folder(path)
+    return [parse_file(path)] if path.is_file() else parse_folder(path, jobs, executor)
@@ -1,4 +1,4 @@
-from .loader import load
+from .loader import load, LazyPlugin, PluginRegistry
 from .plugin import Plugin
 
-__all__ = ["load", "Plugin"]
+__all__ = ["load", "LazyPlugin", "Plugin", "PluginRegistry"]
@@ -1,19 +1,371 @@
-from importlib.metadata import entry_points
-from typing import Any
+import hashlib
+import importlib
+import json
+import os
+import sys
+from argparse import ArgumentParser, _SubParsersAction
+from os import PathLike
+from pathlib import Path
+from typing import Any, Sequence, TypedDict, TYPE_CHECKING
 
+from .plugin import Plugin
 
-def load() -> list[Any]:
+if TYPE_CHECKING:
+    from godocs.cli import AppCommand
+
+
+GROUP = "godocs.plugins"
+"""
+The group of the entry points that expose plugins.
+"""
+
+
+class PluginEntry(TypedDict):
+    name: str
+    value: str
+    commands: list[list[str]] | None
+
+
+class PluginRegistry:
+    """
+    A cache of the plugin entry points found in the installed
+    distributions, which allows discovering plugins without scanning
+    the metadata of every distribution on each run.
+
+    Along with each entry point, the registry stores the `commands` its
+    plugin registered the first time it was loaded, so plugins can be
+    skipped when none of their commands are used.
+
+    The registry is invalidated when any directory of the import path
+    (like `site-packages`) changes, which happens whenever a
+    distribution is installed, upgraded or removed.
+    """
+
+    VERSION = 1
+    """
+    The version of the format of the registry file.
+    """
+
+    path: Path | None
+    """
+    The file where the registry is stored, or `None` if it's only
+    kept in memory.
+    """
+
+    entries: list[PluginEntry]
+    """
+    The plugin entry points found.
+    """
+
+    signature: str
+    """
+    A hash identifying the state of the import path when the `entries`
+    were found.
+    """
+
+    def __init__(self, path: str | PathLike[str] | None = None):
+        self.path = None if path is None else Path(path)
+        self.entries = []
+        self.signature = ''
+
+    def load(self, signature: str | None = None) -> bool:
+        """
+        Loads the entries saved in the registry file, returning whether
+        they were saved with the same format and `signature`.
+
+        If no `signature` is passed, the one of the current import
+        path is used.
+        """
+
+        if signature is None:
+            signature = get_signature()
+
+        self.signature = signature
+        self.entries = []
+
+        if self.path is None:
+            return False
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        if not isinstance(data, dict):
+            return False
+        if data.get("version") != self.VERSION:
+            return False
+        if data.get("signature") != signature:
+            return False
+
+        self.entries = data.get("entries", [])
+
+        return True
+
+    def save(self):
+        """
+        Saves the entries of this registry in its file, if it has one.
+
+        The file is written to a temporary file first and then renamed,
+        and failing to write it (like in a read-only home directory)
+        only means plugins are discovered again on the next run.
+        """
+
+        if self.path is None:
+            return
+
+        # Each process has its own temporary file, so concurrent runs
+        # don't write over each other's.
+        temp = self.path.with_suffix(f".{os.getpid()}.tmp")
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+            with open(temp, "w", encoding="utf-8") as f:
+                json.dump({
+                    "version": self.VERSION,
+                    "signature": self.signature,
+                    "entries": self.entries,
+                }, f)
+
+            os.replace(temp, self.path)
+        except OSError:
+            try:
+                temp.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def discover(self) -> list[PluginEntry]:
+        """
+        Returns the plugin entry points of the installed distributions,
+        scanning their metadata only if the saved entries are outdated.
+        """
+
+        if self.load():
+            return self.entries
+
+        # Scanning the installed distributions is slow, so their
+        # metadata is only imported when the registry is outdated.
+        from importlib.metadata import entry_points
+
+        self.entries = [
+            {"name": ep.name, "value": ep.value, "commands": None}
+            for ep in entry_points(group=GROUP)
+        ]
+
+        self.save()
+
+        return self.entries
+
+
+class LazyPlugin(Plugin):
+    """
+    A `Plugin` that stands for the one exposed by an entry point,
+    importing and instantiating it only when it's first needed.
+    """
+
+    entry: PluginEntry
+    """
+    The entry point of the plugin.
+    """
+
+    registry: PluginRegistry
+    """
+    The registry the `entry` belongs to, which is saved when the
+    commands of the plugin are recorded.
+    """
+
+    plugin: Plugin | None
+    """
+    The plugin loaded, if it already was.
+    """
+
+    def __init__(self, entry: PluginEntry, registry: PluginRegistry):
+        self.entry = entry
+        self.registry = registry
+        self.plugin = None
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the entry point of the plugin.
+        """
+
+        return self.entry["name"]
+
+    def load(self) -> Plugin:
+        """
+        Imports and instantiates the plugin, if it wasn't yet.
+        """
+
+        if self.plugin is None:
+            # Entry point values look like "module:Object.attr [extras]".
+            value = self.entry["value"].split("[")[0].strip()
+            module, _, attrs = value.partition(":")
+
+            result: Any = importlib.import_module(module.strip())
+
+            for attr in attrs.strip().split(".") if attrs.strip() else []:
+                result = getattr(result, attr)
+
+            self.plugin = result()
+
+        return self.plugin  # type: ignore
+
+    def register(self, app: "AppCommand"):
+        """
+        Loads the plugin and registers it to the `app`, recording the
+        commands it adds if they weren't recorded before.
+        """
+
+        plugin = self.load()
+
+        if self.entry["commands"] is not None:
+            plugin.register(app)
+            return
+
+        before = get_commands(app.parser)
+
+        plugin.register(app)
+
+        added = get_commands(app.parser) - before
+
+        # Only the topmost commands added are kept.
+        self.entry["commands"] = [
+            list(command) for command in sorted(added)
+            if command[:-1] not in added
+        ]
+
+        self.registry.save()
+
+    def is_needed(self, command: Sequence[str]) -> bool:
+        """
+        Returns whether the plugin needs to be registered for a command
+        line whose subcommands (the arguments before the first option)
+        are `command`.
+
+        That's the case when one of the commands the plugin registered
+        is chosen, or listed in the help of the command chosen, when its
+        commands are unknown and when it registers no commands, as it
+        may change any of them.
+        """
+
+        commands = self.entry["commands"]
+
+        if not commands:
+            return True
+
+        for path in commands:
+            size = min(len(path), len(command))
+
+            if list(command[:size]) == path[:size] and size >= len(path) - 1:
+                return True
+
+        return False
+
+
+def get_commands(parser: ArgumentParser) -> set[tuple[str, ...]]:
+    """
+    Returns the paths of all the subcommands of an argument `parser`,
+    like `("construct", "jinja")`.
+    """
+
+    result: set[tuple[str, ...]] = set()
+
+    stack: list[tuple[ArgumentParser, tuple[str, ...]]] = [(parser, ())]
+
+    while stack:
+        current, path = stack.pop()
+
+        for action in current._actions:
+            if not isinstance(action, _SubParsersAction):
+                continue
+
+            for name, subparser in action.choices.items():  # type: ignore
+                result.add((*path, name))
+                stack.append((subparser, (*path, name)))
+
+    return result
+
+
+def get_cache_path() -> Path | None:
     """
-    Loads all plugin entry points registered under the `godocs.plugin`
-    group and instantiates them, storing their result in the
-    returned `list`.
+    Returns the path of the registry file of the current environment,
+    in the directory set in `GODOCS_CACHE_DIR` or else in the user cache
+    directory (`XDG_CACHE_HOME`, `~/.cache` or `%LOCALAPPDATA%`).
+
+    Returns `None` if there's no cache directory to use, like when the
+    home directory is unknown, so the registry is only kept in memory.
     """
 
-    plugins: list[Any] = []
+    cache_dir = os.environ.get("GODOCS_CACHE_DIR")
+
+    if not cache_dir:
+        variable = "LOCALAPPDATA" if sys.platform == "win32" else "XDG_CACHE_HOME"
+        base = os.environ.get(variable)
+
+        # Relative paths are ignored, as the XDG specification requires.
+        if not base or not os.path.isabs(base):
+            try:
+                home = Path.home()
+            except RuntimeError:
+                return None
+
+            if sys.platform == "win32":
+                base = home / "AppData" / "Local"
+            else:
+                base = home / ".cache"
+
+        cache_dir = Path(base) / "godocs"
+
+    # Each environment has its own registry.
+    prefix = hashlib.blake2b(sys.prefix.encode(), digest_size=8).hexdigest()
+
+    return Path(cache_dir) / f"plugins-{prefix}.json"
+
 
-    for ep in entry_points(group="godocs.plugins"):
-        Plugin = ep.load()
+def get_signature() -> str:
+    """
+    Returns a hash identifying the state of the import path, built from
+    the modification times of its directories, which change when
+    distributions are installed in or removed from them.
+
+    The current directory is left out, as it changes whenever files
+    (like generated docs) are written in it.
+    """
+
+    digest = hashlib.blake2b(
+        str(PluginRegistry.VERSION).encode(), digest_size=16)
+
+    cwd = os.getcwd()
+
+    for entry in sys.path:
+        if entry in ('', '.', cwd):
+            continue
+
+        try:
+            mtime = os.stat(entry).st_mtime_ns
+        except OSError:
+            continue
+
+        digest.update(f"{entry}:{mtime}\n".encode())
+
+    return digest.hexdigest()
+
+
+def load(registry: PluginRegistry | None = None) -> list[LazyPlugin]:
+    """
+    Returns the plugins exposed by entry points under the
+    `godocs.plugins` group, as `LazyPlugins` that are only imported
+    and instantiated when registered.
+
+    Entry points are discovered through a `PluginRegistry`, which is
+    stored in the user cache directory (when there's one) if none is
+    passed.
+    """
 
-        plugins.append(Plugin())
+    if registry is None:
+        registry = PluginRegistry(get_cache_path())
 
-    return plugins
+    return [LazyPlugin(entry, registry) for entry in registry.discover()]
@@ -1,5 +1,7 @@
 from . import ast
 from . import interpreter
 from . import translator
+from . import cache
+from . import walker
 
-__all__ = ["ast", "interpreter", "translator"]
+__all__ = ["ast", "interpreter", "translator", "cache", "walker"]
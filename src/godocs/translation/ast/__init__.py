@@ -1,5 +1,6 @@
 from .node import Node
 from .tag_node import TagNode
 from .text_node import TextNode
+from .flat_tree import FlatTree, FlatTables, FlatTemplate
 
-__all__ = ["Node", "TagNode", "TextNode"]
+__all__ = ["Node", "TagNode", "TextNode", "FlatTree", "FlatTables", "FlatTemplate"]
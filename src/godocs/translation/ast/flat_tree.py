@@ -0,0 +1,466 @@
+from array import array
+from types import MappingProxyType
+from typing import Mapping, Sequence
+
+from .node import Node
+from .tag_node import TagNode, EMPTY_PARAMS
+from .text_node import TextNode
+
+
+TEXT = 0
+"""
+The kind of the nodes of a `FlatTree` that hold text.
+"""
+
+TAG = 1
+"""
+The kind of the nodes of a `FlatTree` that can hold other nodes.
+"""
+
+NONE = -1
+"""
+The index used by a `FlatTree` where there is no node.
+"""
+
+
+type FlatTemplate = tuple[tuple[int, int, int, int], ...]
+"""
+The nodes of an AST in document order, as the fields of a `FlatTree`
+node: their kind, the offset of their parent from the first node (or
+`NONE` for the first one), and the ids of their value and params.
+"""
+
+
+class FlatTables:
+    """
+    The interned tag names, texts and params used by `FlatTrees`.
+
+    Tables can be shared by many `FlatTrees`, like the ones built by
+    the same interpreter, so that each name and set of params is stored
+    only once for all of them.
+    """
+
+    strings: list[str]
+    """
+    The interned names of tags and texts outside of the sources of trees.
+    """
+
+    param_tables: list[Mapping[str, str]]
+    """
+    The interned, read-only params of the tags. The first one is always
+    the `EMPTY_PARAMS`.
+    """
+
+    def __init__(self):
+        self.strings = []
+        self.param_tables = [EMPTY_PARAMS]
+        self._string_ids: dict[str, int] = {}
+        self._param_ids: dict[tuple[tuple[str, str], ...], int] = {}
+
+    def intern_string(self, value: str) -> int:
+        """
+        Returns the id of a `value` in the `strings`, adding it if needed.
+        """
+
+        result = self._string_ids.get(value)
+
+        if result is None:
+            result = len(self.strings)
+
+            self.strings.append(value)
+            self._string_ids[value] = result
+
+        return result
+
+    def intern_params(self, params: Mapping[str, str] | None) -> int:
+        """
+        Returns the id of some `params` in the `param_tables`,
+        adding a read-only copy of them if needed.
+        """
+
+        if not params:
+            return 0
+
+        key = tuple(params.items())
+
+        result = self._param_ids.get(key)
+
+        if result is None:
+            result = len(self.param_tables)
+
+            self.param_tables.append(MappingProxyType(dict(params)))
+            self._param_ids[key] = result
+
+        return result
+
+    def make_template(self, node: Node) -> FlatTemplate:
+        """
+        Returns a `FlatTemplate` with an AST `node` and its descendants,
+        interning their names, texts and params.
+        """
+
+        result: list[tuple[int, int, int, int]] = []
+
+        stack: list[tuple[Node, int]] = [(node, NONE)]
+
+        while stack:
+            current, parent = stack.pop()
+
+            if isinstance(current, TagNode):
+                stack.extend((child, len(result)) for child in reversed(current.children))
+
+                result.append((
+                    TAG,
+                    parent,
+                    self.intern_string(current.name),
+                    self.intern_params(current.params),
+                ))
+            else:
+                result.append((
+                    TEXT,
+                    parent,
+                    self.intern_string(current.content),  # type: ignore
+                    0,
+                ))
+
+        return tuple(result)
+
+
+class FlatTree:
+    """
+    Class representing an abstract syntax tree used for syntax translation
+    (AST) as parallel arrays, instead of one `Node` object per node.
+
+    Nodes are stored in document order (each node comes before its
+    children, which come before its next sibling) and are identified by
+    their index in the arrays below, which hold their `kind`, the index
+    of their `parent`, the span of their text in the `source` and the
+    ids of their name and params in the interned `tables`.
+
+    Text nodes only store the offsets of their text in the `source`, so
+    no string is copied until a translator asks for it. Text that isn't
+    part of the `source` (like the `"["` of a `[lb]` tag) is interned in
+    the `tables` instead.
+
+    The `to_node` method adapts any node of this tree to the `ast.Node`
+    API, while translators can walk the arrays directly through
+    `SyntaxTranslator.translate_flat`.
+    """
+
+    source: str
+    """
+    The text the spans of the text nodes point into.
+    """
+
+    kinds: array
+    """
+    The kind of each node, either `TEXT` or `TAG`.
+    """
+
+    parents: array
+    """
+    The index of the parent of each node, or `NONE` for top nodes.
+    """
+
+    starts: array
+    """
+    The offset in the `source` where the text of each text node starts.
+    """
+
+    ends: array
+    """
+    The offset in the `source` where the text of each text node ends.
+    """
+
+    values: array
+    """
+    The id in the interned strings of the name of each tag node, or of the
+    text of each text node that isn't a span of the `source`
+    (`NONE` for the ones that are).
+    """
+
+    params: array
+    """
+    The id in the interned params of the params of each node.
+    """
+
+    tables: FlatTables
+    """
+    The interned names and params of the tags and texts outside of
+    the `source`, which may be shared with other trees.
+    """
+
+    def __init__(self, source: str = '', tables: FlatTables | None = None):
+        if tables is None:
+            tables = FlatTables()
+
+        self.source = source
+        self.tables = tables
+        self.kinds = array('b')
+        self.parents = array('i')
+        self.starts = array('i')
+        self.ends = array('i')
+        self.values = array('i')
+        self.params = array('i')
+
+    @classmethod
+    def from_node(cls, node: Node) -> "FlatTree":
+        """
+        Creates a `FlatTree` with the same structure as an AST `node`.
+        """
+
+        result = cls()
+
+        result.add_node(node)
+
+        return result
+
+    def add(
+        self,
+        kind: int,
+        parent: int = NONE,
+        start: int = 0,
+        end: int = 0,
+        value: int = NONE,
+        params: int = 0,
+    ) -> int:
+        """
+        Adds a node with the given fields at the end of this tree,
+        returning its index.
+
+        To keep the document order, the `parent` must be the last node
+        added or one of its ancestors.
+        """
+
+        self.kinds.append(kind)
+        self.parents.append(parent)
+        self.starts.append(start)
+        self.ends.append(end)
+        self.values.append(value)
+        self.params.append(params)
+
+        return len(self.kinds) - 1
+
+    def add_tag(
+        self,
+        name: str,
+        params: Mapping[str, str] | None = None,
+        parent: int = NONE,
+    ) -> int:
+        """
+        Adds a tag node with a `name` and `params`, returning its index.
+        """
+
+        return self.add(
+            TAG,
+            parent,
+            value=self.tables.intern_string(name),
+            params=self.tables.intern_params(params),
+        )
+
+    def add_text(self, start: int, end: int, parent: int = NONE) -> int:
+        """
+        Adds a text node spanning the `source` from `start` to `end`,
+        returning its index.
+        """
+
+        return self.add(TEXT, parent, start, end)
+
+    def add_string(self, content: str, parent: int = NONE) -> int:
+        """
+        Adds a text node with a `content` that isn't part of the `source`,
+        returning its index.
+        """
+
+        return self.add(TEXT, parent, value=self.tables.intern_string(content))
+
+    def add_node(self, node: Node, parent: int = NONE) -> int:
+        """
+        Adds an AST `node` and all of its descendants, returning the
+        index of the `node`.
+        """
+
+        return self.add_template(self.tables.make_template(node), parent)
+
+    def add_template(self, template: "FlatTemplate", parent: int = NONE) -> int:
+        """
+        Adds the nodes described by a `template`, returning the index
+        of the first of them.
+
+        The `template` must have been made by the `tables` of this tree.
+        """
+
+        result = len(self)
+
+        for kind, offset, value, params in template:
+            self.add(
+                kind,
+                parent if offset == NONE else result + offset,
+                value=value,
+                params=params,
+            )
+
+        return result
+
+    def insert_nodes(self, position: int, nodes: Sequence[Node], parent: int):
+        """
+        Inserts AST `nodes` and their descendants at `position`, as
+        children of the `parent`, moving the nodes after them forward.
+        """
+
+        size = len(self)
+
+        for node in nodes:
+            self.add_node(node, parent)
+
+        added = len(self) - size
+
+        if added == 0:
+            return
+
+        # Indices of nodes added at the end point to where they'll be moved,
+        # while indices of nodes after the position are moved forward.
+        self.parents = array('i', (
+            index if index < position
+            else index + added if index < size
+            else index - size + position
+            for index in self.parents
+        ))
+
+        for name in ("kinds", "parents", "starts", "ends", "values", "params"):
+            values = getattr(self, name)
+
+            values[position:] = values[size:] + values[position:size]
+
+    def set_tag(self, index: int, name: str, params: Mapping[str, str] | None = None):
+        """
+        Turns the node at `index` into a tag node with a `name` and `params`,
+        keeping its children.
+        """
+
+        self.kinds[index] = TAG
+        self.values[index] = self.tables.intern_string(name)
+        self.params[index] = self.tables.intern_params(params)
+
+    def replace(self, index: int, node: Node):
+        """
+        Turns the node at `index`, which must have no children, into
+        a copy of an AST `node` and its descendants.
+        """
+
+        if isinstance(node, TagNode):
+            self.set_tag(index, node.name, node.params)
+            self.insert_nodes(index + 1, node.children, index)
+            return
+
+        self.kinds[index] = TEXT
+        self.values[index] = self.tables.intern_string(node.content)  # type: ignore
+        self.params[index] = 0
+
+    def unwrap(self, index: int):
+        """
+        Turns the children of the node at `index` into children of its
+        parent, placed right after it.
+        """
+
+        parent = self.parents[index]
+
+        for child in self.get_children(index):
+            self.parents[child] = parent
+
+    def skip(self, index: int) -> int:
+        """
+        Returns the index of the first node after the node at `index`
+        that isn't one of its descendants.
+        """
+
+        parents = self.parents
+        size = len(parents)
+
+        result = index + 1
+
+        # In document order, descendants come right after a node,
+        # and only they have parents at or after it.
+        while result < size and parents[result] >= index:
+            result += 1
+
+        return result
+
+    def get_name(self, index: int) -> str:
+        """
+        Returns the name of the tag node at `index`.
+        """
+
+        return self.tables.strings[self.values[index]]
+
+    def get_params(self, index: int) -> Mapping[str, str]:
+        """
+        Returns the read-only params of the tag node at `index`.
+        """
+
+        return self.tables.param_tables[self.params[index]]
+
+    def get_text(self, index: int) -> str:
+        """
+        Returns the text of the text node at `index`, copying it
+        from the `source` if it's a span of it.
+        """
+
+        value = self.values[index]
+
+        if value != NONE:
+            return self.tables.strings[value]
+
+        return self.source[self.starts[index]:self.ends[index]]
+
+    def get_children(self, index: int) -> list[int]:
+        """
+        Returns the indices of the children of the node at `index`.
+        """
+
+        parents = self.parents
+
+        return [
+            child for child in range(index + 1, self.skip(index))
+            if parents[child] == index
+        ]
+
+    def make_node(self, index: int) -> Node:
+        """
+        Creates an AST `Node` for the node at `index`, without its children.
+        """
+
+        if self.kinds[index] == TEXT:
+            if self.values[index] == NONE:
+                return TextNode.from_span(
+                    self.source, self.starts[index], self.ends[index])
+
+            return TextNode(self.get_text(index))
+
+        return TagNode(self.get_name(index), None, self.get_params(index))
+
+    def to_node(self, index: int = 0) -> Node:
+        """
+        Creates the AST `Node` equivalent to the node at `index` and
+        its descendants.
+        """
+
+        result = self.make_node(index)
+
+        nodes: dict[int, Node] = {index: result}
+
+        for child in range(index + 1, self.skip(index)):
+            node = self.make_node(child)
+
+            nodes[self.parents[child]].append(node)  # type: ignore
+
+            if self.kinds[child] == TAG:
+                nodes[child] = node
+
+        return result
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __str__(self) -> str:
+        return str(self.to_node())
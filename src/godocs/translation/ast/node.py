@@ -28,6 +28,8 @@ class Node(ABC):
     TODO: finish protocol documentation.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def translate(self, translator: "SyntaxTranslator") -> str:
         """
@@ -35,3 +37,11 @@ class Node(ABC):
         """
 
         pass
+
+    def emit(self, translator: "SyntaxTranslator", out: list[str]):
+        """
+        Appends the translation of this `Node` by a given `translator`
+        to the `out` buffer.
+        """
+
+        out.append(self.translate(translator))
@@ -1,5 +1,6 @@
 from textwrap import indent
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import Iterable, Mapping, Sequence, TYPE_CHECKING
 
 from .node import Node
 
@@ -7,6 +8,17 @@ if TYPE_CHECKING:
     from godocs.translation.translator import SyntaxTranslator
 
 
+EMPTY_CHILDREN: tuple[Node, ...] = ()
+"""
+The children shared by all frozen `TagNodes` without any.
+"""
+
+EMPTY_PARAMS: Mapping[str, str] = MappingProxyType({})
+"""
+The read-only params shared by all frozen `TagNodes` without any.
+"""
+
+
 class TagNode(Node):
     """
     Class representing a node that can hold other `Nodes` as content
@@ -15,26 +27,133 @@ class TagNode(Node):
     Besides its `children`, the `TagNode` class can have a `name` -
     to identify its type - and `params` - to store specific data.
     All of these properties are expected to be passed on construction.
+
+    Since ASTs can have millions of nodes, `TagNodes` are kept compact:
+    they have no instance `__dict__`, and the `list` of children and
+    the `dict` of params of a node created without them are only
+    allocated when first read, so they can still be changed in place
+    (like `node.children.append(child)`). Once a tree is no longer
+    changed, `freeze` makes it read-only, with its children in tuples
+    and its params in read-only mappings.
     """
 
+    __slots__ = ("name", "_children", "_params")
+
+    name: str
+
     def __init__(
         self,
         name: str,
-        children: list[Node] | None = None,
-        params: dict[str, str] | None = None,
+        children: Sequence[Node] | None = None,
+        params: Mapping[str, str] | None = None,
     ):
+        self.name = name
+        self._children = children
+        self._params = params
+
+    @property
+    def children(self) -> Sequence[Node]:
+        """
+        The nodes inside this `TagNode`, in a `list` that can be changed
+        in place, unless this node is frozen.
+        """
+
+        children = self._children
+
         if children is None:
-            children = []
+            children = self._children = []
+
+        return children
+
+    @children.setter
+    def children(self, value: Sequence[Node]):
+        self._children = value
+
+    @property
+    def params(self) -> Mapping[str, str]:
+        """
+        The params of this `TagNode`, in a `dict` that can be changed
+        in place, unless this node is frozen.
+        """
+
+        params = self._params
+
         if params is None:
-            params = {}
+            params = self._params = {}
 
-        self.name = name
-        self.children = children
-        self.params = params
+        return params
+
+    @params.setter
+    def params(self, value: Mapping[str, str]):
+        self._params = value
+
+    def append(self, child: Node):
+        """
+        Adds a `child` to the end of the children of this `TagNode`.
+        """
+
+        if not isinstance(self._children, list):
+            self._children = list(self._children or ())
+
+        self._children.append(child)
+
+    def extend(self, children: Iterable[Node]):
+        """
+        Adds the `children` received to the end of the children of this `TagNode`.
+        """
+
+        if not isinstance(self._children, list):
+            self._children = list(self._children or ())
+
+        self._children.extend(children)
+
+    def set_param(self, key: str, value: str):
+        """
+        Sets the param `key` of this `TagNode` to the `value` received.
+        """
+
+        if not isinstance(self._params, dict):
+            self._params = dict(self._params or {})
+
+        self._params[key] = value
+
+    def freeze(self) -> "TagNode":
+        """
+        Makes this `TagNode` and its descendants compact and read-only,
+        storing their children in tuples and their params in read-only
+        mappings, and returns it.
+
+        Frozen nodes can still be changed through `append`, `extend` and
+        `set_param`, which copy their children or params first.
+        """
+
+        stack: list[TagNode] = [self]
+
+        while stack:
+            node = stack.pop()
+
+            if node._children:
+                node._children = tuple(node._children)
+            else:
+                node._children = EMPTY_CHILDREN
+
+            if node._params:
+                if isinstance(node._params, dict):
+                    node._params = MappingProxyType(node._params)
+            else:
+                node._params = EMPTY_PARAMS
+
+            stack.extend(
+                child for child in node._children if isinstance(child, TagNode))
+
+        return self
 
     def translate(self, translator: "SyntaxTranslator") -> str:
         return translator.translate_tag(self)
 
+    def emit(self, translator: "SyntaxTranslator", out: list[str]):
+        translator.emit_tag(self, out)
+
     def stringify_params(self) -> str:
         result = ""
 
@@ -12,10 +12,88 @@ class TextNode(Node):
 
     This class expects that its text `content` is passed in order
     for it to be constructed.
+
+    Alternatively, a `TextNode` can be created with `from_span` as a span
+    of a bigger `source` text (like the description being interpreted),
+    in which case its `content` is only copied from the `source` when
+    it's first read.
     """
 
+    __slots__ = ("_content",)
+
     def __init__(self, content: str):
-        self.content = content
+        self._content: "str | tuple[str, int, int]" = content
+
+    @classmethod
+    def from_span(cls, source: str, start: int, end: int) -> "TextNode":
+        """
+        Creates a `TextNode` whose `content` is the span of the `source`
+        from `start` to `end`, without copying it.
+        """
+
+        result = cls.__new__(cls)
+
+        # The span is kept in the slot of the content until it's copied,
+        # so nodes don't need slots of their own for it.
+        if start == 0 and end == len(source):
+            result._content = source
+        else:
+            result._content = (source, start, end)
+
+        return result
+
+    @property
+    def content(self) -> str:
+        """
+        The text of this `TextNode`.
+
+        If this node was created from a span, its text is copied from
+        the `source` the first time it's read, and the `source` is
+        released.
+        """
+
+        content = self._content
+
+        if isinstance(content, tuple):
+            source, start, end = content
+            content = self._content = source[start:end]
+
+        return content
+
+    @content.setter
+    def content(self, value: str):
+        self._content = value
+
+    @property
+    def source(self) -> str:
+        """
+        The text the `content` of this `TextNode` is a span of, which is
+        the `content` itself once it has been copied.
+        """
+
+        content = self._content
+
+        return content[0] if isinstance(content, tuple) else content
+
+    @property
+    def start(self) -> int:
+        """
+        The offset in the `source` where the `content` starts.
+        """
+
+        content = self._content
+
+        return content[1] if isinstance(content, tuple) else 0
+
+    @property
+    def end(self) -> int:
+        """
+        The offset in the `source` where the `content` ends.
+        """
+
+        content = self._content
+
+        return content[2] if isinstance(content, tuple) else len(content)
 
     def translate(self, translator: "SyntaxTranslator") -> str:
         """
@@ -24,5 +102,8 @@ class TextNode(Node):
 
         return translator.translate_text(self)
 
+    def emit(self, translator: "SyntaxTranslator", out: list[str]):
+        translator.emit_text(self, out)
+
     def __str__(self) -> str:
         return f'"{self.content}"'
@@ -0,0 +1,124 @@
+from collections import OrderedDict
+from typing import TypedDict, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from godocs.translation.interpreter import Interpreter
+    from godocs.translation.translator import SyntaxTranslator
+
+
+class CacheInfo(TypedDict):
+    hits: int
+    misses: int
+    size: int
+    maxsize: int | None
+
+
+class TranslationCache:
+    """
+    A bounded least recently used (LRU) cache for the results of
+    interpreting and translating texts.
+
+    Godot docs repeat the same descriptions many times (empty strings,
+    inherited overrides, "Emitted when..." boilerplate), so caching their
+    translation allows each distinct text to be converted only once.
+
+    Entries are keyed on the text and on the identity of the
+    `Interpreter` and `SyntaxTranslator` used, so the same cache can be
+    shared between different translators safely. While the translator
+    checks references against its `symbols`, entries are also keyed on
+    its `scope`, as the references of a text are resolved relative to
+    the class it's translated in.
+    """
+
+    maxsize: int | None
+    """
+    The maximum number of entries kept in this cache, or `None` for
+    an unbounded cache.
+    """
+
+    hits: int
+    """
+    How many translations were served from this cache.
+    """
+
+    misses: int
+    """
+    How many translations had to be computed by this cache.
+    """
+
+    entries: OrderedDict[tuple[int, int, str, str], str]
+    """
+    The cached translations, from the least to the most recently used.
+    """
+
+    owners: dict[int, object]
+    """
+    The interpreters and translators used in the keys of the `entries`,
+    kept alive so that their ids can't be reused by other objects.
+    """
+
+    def __init__(self, maxsize: int | None = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.entries = OrderedDict()
+        self.owners = {}
+
+    def translate(
+        self,
+        text: str,
+        interpreter: "Interpreter",
+        translator: "SyntaxTranslator",
+    ) -> str:
+        """
+        Returns the `text` interpreted by the `interpreter` and translated
+        by the `translator`, computing it only if it isn't cached yet.
+        """
+
+        scope = translator.scope if translator.symbols is not None else ''
+
+        key = (id(interpreter), id(translator), scope, text)
+
+        result = self.entries.get(key)
+
+        if result is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+
+            return result
+
+        self.misses += 1
+
+        result = interpreter.translate(text, translator)
+
+        self.owners[id(interpreter)] = interpreter
+        self.owners[id(translator)] = translator
+
+        self.entries[key] = result
+
+        if self.maxsize is not None and len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+        return result
+
+    def info(self) -> CacheInfo:
+        """
+        Returns the statistics of this cache.
+        """
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.entries),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self):
+        """
+        Removes all entries from this cache and resets its statistics.
+        """
+
+        self.entries.clear()
+        self.owners.clear()
+        self.hits = 0
+        self.misses = 0
@@ -1,4 +1,11 @@
 from .interpreter import Interpreter
 from .bbcode_interpreter import BBCodeInterpreter
+from .token_bbcode_interpreter import TokenBBCodeInterpreter
+from .flat_bbcode_interpreter import FlatBBCodeInterpreter
 
-__all__ = ["Interpreter", "BBCodeInterpreter"]
+__all__ = [
+    "Interpreter",
+    "BBCodeInterpreter",
+    "TokenBBCodeInterpreter",
+    "FlatBBCodeInterpreter",
+]
@@ -28,6 +28,12 @@ class BBCodeInterpreter(Interpreter):
     their `name`, `options`, `content` and `closing` tag.
     """
 
+    RAW_ELEMENTS = ("kbd", "code", "codeblock")
+    """
+    The elements whose content isn't meant to be parsed, as they
+    are either keyboard keys or code samples.
+    """
+
     def interpret(self, text: str) -> ast.TagNode:
         """
         Parses the input `BBCode` text into an Abstract Syntax Tree
@@ -102,6 +108,19 @@ class BBCodeInterpreter(Interpreter):
         tag referencing some documentation member and returns
         its equivalent in an AST `Node`.
 
+        See `build_reference_tag` for the tags supported.
+        """
+
+        return self.build_reference_tag(
+            el_match.group("name"),
+            el_match.group("options"),
+        )
+
+    def build_reference_tag(self, name: str, options: str) -> ast.TagNode:
+        """
+        Builds the AST `Node` equivalent to a `BBCode` tag referencing
+        some documentation member, given the tag `name` and `options`.
+
         This method interprets the following tags:
         - `[annotation]`
         - `[constant]`
@@ -119,9 +138,6 @@ class BBCodeInterpreter(Interpreter):
         `ast.Node` documentation.
         """
 
-        name = el_match.group("name")
-        options = el_match.group("options")
-
         params = self.parse_options(options)
 
         result = ast.TagNode("tag")
@@ -147,7 +163,7 @@ class BBCodeInterpreter(Interpreter):
                 # If the reference is an operator ([operator <name> <symbol>]),
                 # also register its symbol.
                 if name == "operator":
-                    result.params["symbol"] = params["list"][1]
+                    result.set_param("symbol", params["list"][1])
 
                 return result
             case _: pass
@@ -159,7 +175,7 @@ class BBCodeInterpreter(Interpreter):
             )
 
         # If the reference is none of the above, assumes it is a Class reference.
-        return ast.TagNode("reference", [], {
+        return ast.TagNode("reference", None, {
             "type": "class", "name": name
         })
 
@@ -179,7 +195,18 @@ class BBCodeInterpreter(Interpreter):
         For full elements, see `parse_element`.
         """
 
-        name = el_match.group("name")
+        return self.build_tag(
+            el_match.group("name"),
+            el_match.group("options"),
+        )
+
+    def build_tag(self, name: str, options: str) -> ast.Node:
+        """
+        Builds the AST `Node` equivalent to a standalone `BBCode` tag,
+        given the tag `name` and `options`.
+
+        See `parse_tag` for the tags supported.
+        """
 
         match name:
             # Returns a new line tag Node.
@@ -192,7 +219,7 @@ class BBCodeInterpreter(Interpreter):
 
         # If the tag isn't any of the above, it's assumed it is a reference tag,
         # (tags that point to a Class, a property etc).
-        return self.parse_reference_tag(el_match)
+        return self.build_reference_tag(name, options)
 
     def parse_element(self, el_match: re.Match[str]) -> ast.Node:
         """
@@ -223,9 +250,41 @@ class BBCodeInterpreter(Interpreter):
             return self.parse_tag(el_match)
 
         name = el_match.group("name")
-        content = el_match.group("content")
         options = el_match.group("options")
 
+        # The content is kept as a span of the text matched, so
+        # it isn't copied.
+        content_start, content_end = el_match.span("content")
+
+        element = self.build_element(name, options, ast.TextNode.from_span(
+            el_match.string, content_start, content_end))
+
+        # If there is any content inside the element parsed, use parse_text to
+        # parse it and append it to the element as root.
+        # Since parse_text may use this own method, this can end up
+        # being recursive.
+        if content_end > content_start and name not in self.RAW_ELEMENTS:
+            element = self.parse_text(
+                el_match.string, element, content_start, content_end)
+
+        return element
+
+    def build_element(
+        self,
+        name: str,
+        options: str,
+        content: ast.TextNode,
+    ) -> ast.TagNode:
+        """
+        Builds the AST `TagNode` equivalent to a `BBCode` element, given
+        the element `name`, `options` and raw `content`, as a `TextNode`.
+
+        The `content` of the `RAW_ELEMENTS` is added as their single child,
+        while the content of other elements is left for the caller to parse.
+
+        See `parse_element` for the elements supported.
+        """
+
         params = self.parse_options(options)
 
         element = ast.TagNode(name)
@@ -239,49 +298,44 @@ class BBCodeInterpreter(Interpreter):
             case 's': element.name = "strikethrough"
             case "color":
                 element.name = "color"
-                element.params["value"] = params["map"].get('', '')
+                element.set_param("value", params["map"].get('', ''))
             case "font":
                 element.name = "font"
-                element.params["url"] = params["map"].get('', '')
+                element.set_param("url", params["map"].get('', ''))
             case "img":
                 element.name = "image"
-                element.params["width"] = params["map"].get("width", '')
+                element.set_param("width", params["map"].get("width", ''))
             case "url":
                 element.name = "link"
-                element.params["url"] = params["map"].get('', content)
+                element.set_param("url", params["map"].get('', content.content))
             case "center":
                 element.name = "alignment"
-                element.params["x"] = "center"
+                element.set_param("x", "center")
             # For the below cases, don't parse the contents, as they aren't meant
             # to be parsed (they are either keyboard keys or code samples).
             case "kbd":
                 element.name = "keyboard"
-                element.children.append(ast.TextNode(content))
+                element.append(content)
                 return element
             case "code":
                 element.name = "code"
-                element.children.append(ast.TextNode(content))
+                element.append(content)
                 return element
             case "codeblock":
                 element.name = "codeblock"
-                element.params["language"] = params["map"].get("lang", '')
-                element.children.append(ast.TextNode(content))
+                element.set_param("language", params["map"].get("lang", ''))
+                element.append(content)
                 return element
             case _: pass
 
-        # If there is any content inside the element parsed, use parse_text to
-        # parse it and append it to the element as root.
-        # Since parse_text may use this own method, this can end up
-        # being recursive.
-        if content:
-            element = self.parse_text(content, element)
-
         return element
 
     def parse_text(
         self,
         text: str,
         root: ast.TagNode | None = None,
+        start: int = 0,
+        end: int | None = None,
     ) -> ast.TagNode:
         """
         Parses a `BBCode` text into an Abstract Syntax Tree, with
@@ -292,23 +346,28 @@ class BBCodeInterpreter(Interpreter):
 
         To understand how is the structure of the generated AST, see
         the protocol in the `ast.Node` documentation.
+
+        If a `start` and an `end` are given, only that span of the `text`
+        is parsed, which allows the content of elements to be parsed
+        without copying it. Texts in the AST are spans of the `text`, too.
         """
 
         if root is None:
             root = ast.TagNode("root")
 
-        text_start = 0
-        text_end = len(text)
+        text_start = start
+        text_end = len(text) if end is None else end
 
         # Searches all elements with the el_regex.
-        el_matches = list(re.finditer(
-            self.el_regex,
+        el_matches = list(re.compile(self.el_regex).finditer(
             text,
+            text_start,
+            text_end,
         ))
 
         # If no elements are found, the entire content is considered plain text.
         if not el_matches:
-            root.children.append(ast.TextNode(text))
+            root.append(ast.TextNode.from_span(text, text_start, text_end))
             return root
 
         prev_el_end = text_start
@@ -320,15 +379,15 @@ class BBCodeInterpreter(Interpreter):
 
             # Parse the content prior to this element, if any.
             if el_start > prev_el_end:
-                root.children.append(ast.TextNode(text[prev_el_end:el_start]))
+                root.append(ast.TextNode.from_span(text, prev_el_end, el_start))
 
             # Parse the element found, and, consequentially, its children.
-            root.children.append(self.parse_element(el_match))
+            root.append(self.parse_element(el_match))
 
             # Parse the remaining contents, if any.
             if i == len(el_matches) - 1:
                 if el_end < text_end:
-                    root.children.append(ast.TextNode(text[el_end:]))
+                    root.append(ast.TextNode.from_span(text, el_end, text_end))
 
             prev_el_end = el_end
 
@@ -0,0 +1,168 @@
+from typing import TYPE_CHECKING
+
+from .token_bbcode_interpreter import TokenBBCodeInterpreter
+from godocs.translation import ast
+
+if TYPE_CHECKING:
+    from godocs.translation.translator import SyntaxTranslator
+
+
+type FlatFrame = tuple[int, int, str]
+"""
+An element whose content is being parsed into a `FlatTree`, as its
+index in the tree, the offset where its content ends and its `name`.
+"""
+
+
+class FlatBBCodeInterpreter(TokenBBCodeInterpreter):
+    """
+    `FlatBBCodeInterpreter` is a `TokenBBCodeInterpreter` that parses
+    `BBCode` markup into an `ast.FlatTree`, instead of building one `Node`
+    object per element and text.
+
+    Texts are stored as spans of the parsed markup, so they aren't copied
+    while parsing, and tag names and params are interned in `tables`
+    shared by all the trees built.
+    Translators can then walk the tree directly with `translate_flat`,
+    which makes this interpreter better suited for bulk translations.
+
+    The `interpret` method still returns regular `Nodes`, built from the
+    `FlatTree` with its `to_node` adapter.
+    """
+
+    tables: ast.FlatTables
+    """
+    The interned names and params shared by all the trees built
+    by this interpreter.
+    """
+
+    tags: dict[tuple[str, str], ast.FlatTemplate]
+    """
+    The standalone tags already built by this interpreter, keyed by
+    their name and options, as templates made by its `tables`.
+    """
+
+    def __init__(self):
+        self.tables = ast.FlatTables()
+        self.tags = {}
+
+    def interpret(self, text: str) -> ast.TagNode:
+        """
+        Parses the input `BBCode` text into an Abstract Syntax Tree
+        with a root `TagNode`.
+        """
+
+        return self.interpret_flat(text).to_node()  # type: ignore
+
+    def interpret_flat(self, text: str) -> ast.FlatTree:
+        """
+        Parses the input `BBCode` text into a `FlatTree`, whose first node
+        is a wrapper `"root"` element.
+        """
+
+        return self.parse_flat(text)
+
+    def translate(self, text: str, translator: "SyntaxTranslator") -> str:
+        return translator.translate_flat(self.interpret_flat(text))
+
+    def parse_flat(self, text: str) -> ast.FlatTree:
+        """
+        Parses a `BBCode` text into a `FlatTree`, following the same rules
+        of the `TokenBBCodeInterpreter.parse_text` method.
+        """
+
+        tree = ast.FlatTree(text, self.tables)
+
+        stack: list[FlatFrame] = [(tree.add_tag("root"), len(text), "root")]
+
+        # Offsets of the next closing tag of each name.
+        closings: dict[str, int] = {}
+
+        # Start of the text not yet added to the tree.
+        text_start = 0
+        pos = 0
+
+        while True:
+            parent, parent_end, parent_name = stack[-1]
+
+            token = self.tag_regex.search(text, pos, parent_end)
+
+            if token is None:
+                self.add_span(tree, parent, text_start, parent_end)
+
+                if len(stack) == 1:
+                    break
+
+                # The content of the element ended, so it's closed.
+                stack.pop()
+
+                pos = parent_end + len(parent_name) + 3
+                text_start = pos
+                continue
+
+            name = token.group("name")
+            options = token.group("options")
+
+            self.add_span(tree, parent, text_start, token.start())
+
+            pos = token.end()
+            text_start = pos
+
+            content_end = self.find_closing(
+                text, name, pos, parent_end, closings)
+
+            # Tags that aren't closed inside their parent are standalone.
+            if content_end == -1:
+                self.add_standalone(tree, name, options, parent)
+                continue
+
+            # As the end of the content is already known, the element
+            # is added right away, and its content parsed into it.
+            element = self.build_element(
+                name, options, ast.TextNode.from_span(text, pos, content_end))
+
+            index = tree.add_tag(element.name, element.params, parent)
+
+            # Raw elements have their content added as is, as a span
+            # instead of the text child built by build_element.
+            if name in self.RAW_ELEMENTS:
+                tree.add_text(pos, content_end, index)
+
+            # Elements with content to parse are kept in the stack until
+            # the end of their content is reached.
+            if name not in self.RAW_ELEMENTS and content_end > pos:
+                stack.append((index, content_end, name))
+                continue
+
+            pos = content_end + len(name) + 3
+            text_start = pos
+
+        # An empty text is represented by an empty text node.
+        if not text:
+            tree.add_string(text, stack[0][0])
+
+        return tree
+
+    def add_standalone(self, tree: ast.FlatTree, name: str, options: str, parent: int):
+        """
+        Adds the standalone tag with the given `name` and `options` to the
+        `parent`, building it only if it wasn't built before.
+        """
+
+        template = self.tags.get((name, options))
+
+        if template is None:
+            template = self.tables.make_template(self.build_tag(name, options))
+
+            self.tags[(name, options)] = template
+
+        tree.add_template(template, parent)
+
+    def add_span(self, tree: ast.FlatTree, parent: int, start: int, end: int):
+        """
+        Adds the span of the `source` of the `tree` from `start` to `end`
+        as a text node in the `parent`, if it isn't empty.
+        """
+
+        if end > start:
+            tree.add_text(start, end, parent)
@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+from godocs.translation import walker
+
 if TYPE_CHECKING:
     from godocs.translation import ast
+    from godocs.translation.translator import SyntaxTranslator
 
 
 class Interpreter(ABC):
@@ -23,3 +26,14 @@ class Interpreter(ABC):
         """
 
         pass
+
+    def translate(self, text: str, translator: "SyntaxTranslator") -> str:
+        """
+        Parses the input `text` and returns its AST translated
+        by the given `translator`, with the `walker`.
+
+        Subclasses may override this method to translate their
+        results without building `Node` objects.
+        """
+
+        return walker.translate(self.interpret(text), translator)
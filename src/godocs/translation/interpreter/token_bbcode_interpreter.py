@@ -0,0 +1,176 @@
+import re
+
+from .bbcode_interpreter import BBCodeInterpreter
+from godocs.translation import ast
+
+
+class Frame:
+    """
+    An element that was opened, but not yet closed, while parsing
+    a `BBCode` text with the `TokenBBCodeInterpreter`.
+    """
+
+    __slots__ = ("name", "options", "content_start", "content_end", "children")
+
+    def __init__(self, name: str, options: str, content_start: int, content_end: int):
+        self.name = name
+        self.options = options
+        self.content_start = content_start
+        self.content_end = content_end
+        self.children: list[ast.Node] = []
+
+
+class TokenBBCodeInterpreter(BBCodeInterpreter):
+    """
+    `TokenBBCodeInterpreter` is a `BBCodeInterpreter` that parses `BBCode`
+    markup in a single pass, instead of matching whole elements with the
+    `el_regex` and recursively parsing their contents.
+
+    The text is scanned for opening tags once, from start to end, while
+    the elements whose content is being parsed are kept in a stack.
+    Tags are paired the same way as with the `el_regex`: each element
+    ends at the first closing tag with its name inside the content of
+    its parent, and tags without one are standalone tags.
+    That way, the AST built is the same as the one built by the
+    `BBCodeInterpreter`, for any markup.
+    """
+
+    tag_regex = re.compile(r"\[(?P<name>\w+)(?P<options>[^\]]*)\]")
+    """
+    A regex for capturing `BBCode` opening tags, with their `name`
+    and `options`.
+    """
+
+    def parse_text(
+        self,
+        text: str,
+        root: ast.TagNode | None = None,
+        start: int = 0,
+        end: int | None = None,
+    ) -> ast.TagNode:
+        """
+        Parses a `BBCode` text into an Abstract Syntax Tree, with
+        its topmost `Node` being a wrapper `"root"` element.
+
+        If a `start` and an `end` are given, only that span of the `text`
+        is parsed, like with the `BBCodeInterpreter.parse_text` method.
+        """
+
+        if root is None:
+            root = ast.TagNode("root")
+
+        if end is None:
+            end = len(text)
+
+        stack = [Frame(root.name, '', start, end)]
+
+        # Offsets of the next closing tag of each name.
+        closings: dict[str, int] = {}
+
+        # Start of the text not yet added to the AST.
+        text_start = start
+        pos = start
+
+        while True:
+            frame = stack[-1]
+
+            token = self.tag_regex.search(text, pos, frame.content_end)
+
+            if token is None:
+                self.add_text(frame, text, text_start, frame.content_end)
+
+                if len(stack) == 1:
+                    break
+
+                # The content of the element ended, so it's closed.
+                stack.pop()
+
+                element = self.build_element(
+                    frame.name,
+                    frame.options,
+                    ast.TextNode.from_span(
+                        text, frame.content_start, frame.content_end),
+                )
+                if frame.children:
+                    element.children = frame.children
+
+                stack[-1].children.append(element)
+
+                pos = frame.content_end + len(frame.name) + 3
+                text_start = pos
+                continue
+
+            name = token.group("name")
+            options = token.group("options")
+
+            self.add_text(frame, text, text_start, token.start())
+
+            pos = token.end()
+            text_start = pos
+
+            content_end = self.find_closing(
+                text, name, pos, frame.content_end, closings)
+
+            # Tags that aren't closed inside their parent are standalone.
+            if content_end == -1:
+                frame.children.append(self.build_tag(name, options))
+                continue
+
+            # Raw elements have their content taken as is, and elements
+            # without content have nothing to parse.
+            if name in self.RAW_ELEMENTS or content_end == pos:
+                frame.children.append(self.build_element(
+                    name, options, ast.TextNode.from_span(text, pos, content_end)))
+
+                pos = content_end + len(name) + 3
+                text_start = pos
+                continue
+
+            stack.append(Frame(name, options, pos, content_end))
+
+        root.extend(stack[0].children)
+
+        # An empty text is represented by an empty text Node.
+        if start == end:
+            root.append(ast.TextNode.from_span(text, start, end))
+
+        return root
+
+    def find_closing(
+        self,
+        text: str,
+        name: str,
+        pos: int,
+        end: int,
+        closings: dict[str, int],
+    ) -> int:
+        """
+        Returns the offset of the first closing tag with the given `name`
+        in the `text` between `pos` and `end`, or `-1` if there isn't any.
+
+        The offsets found are kept in `closings`, so that the `text`
+        is scanned for each name only when the previous closing tag
+        found was left behind, which never happens twice for the same
+        tag, as the text is parsed from start to end.
+        """
+
+        result = closings.get(name)
+
+        if result is None or -1 < result < pos:
+            result = text.find(f"[/{name}]", pos)
+
+            closings[name] = result
+
+        if result == -1 or result + len(name) + 3 > end:
+            return -1
+
+        return result
+
+    def add_text(self, frame: Frame, text: str, start: int, end: int):
+        """
+        Adds the span of the `text` from `start` to `end` as a text
+        `Node` in the `frame`, if it isn't empty.
+        """
+
+        if end > start:
+            frame.children.append(ast.TextNode.from_span(text, start, end))
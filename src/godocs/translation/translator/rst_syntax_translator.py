@@ -1,7 +1,6 @@
-from functools import reduce
 from textwrap import indent
 import re
-from typing import TYPE_CHECKING
+from typing import Mapping, TYPE_CHECKING
 
 from godocs.translation.translator.syntax_translator import SyntaxTranslator
 # from godocs.constructor.jinja_constructor.rst.filters import make_code_member_ref
@@ -55,21 +54,11 @@ class RSTSyntaxTranslator(SyntaxTranslator):
 
         name_output = name
 
-        args_output = reduce(
-            lambda prev, next: prev + next + ' ',
-            args,
-            '',
-        )
-
-        options_output = ''
-
-        for i, option in enumerate(options):
-            value = options[option]
+        args_output = ''.join(f"{arg} " for arg in args)
 
-            options_output += f":{option}: {value}"
-
-            if i < len(options) - 1:
-                options_output += "\n"
+        options_output = "\n".join(
+            f":{option}: {value}" for option, value in options.items()
+        )
 
         if options_output:
             options_output = indent(options_output, "   ")
@@ -90,31 +79,103 @@ class RSTSyntaxTranslator(SyntaxTranslator):
     def make_codeblock(self, content: str, language: str = '') -> str:
         return self.make_directive("codeblock", [language], {}, content)
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Subclasses (like the translator scripts passed with -t) may
+        # customize the recursive API, which then has to be called for
+        # every node, as it was before emitting into buffers.
+        cls._translates_text = cls.translate_text is not RSTSyntaxTranslator.translate_text
+        cls._translates_tag = cls.translate_tag is not RSTSyntaxTranslator.translate_tag
+
+    _translates_text = False
+    """
+    Whether `translate_text` is overridden, so `emit_text` must use it.
+    """
+
+    _translates_tag = False
+    """
+    Whether `translate_tag` is overridden, so `emit_tag` must use it.
+    """
+
     def translate_text(self, node: "ast.TextNode") -> str:
         return node.content
 
     def translate_tag(self, node: "ast.TagNode") -> str:
-        # First of all, translates the children of the node received.
-        content = reduce(
-            lambda prev, next: prev + next.translate(self),
-            node.children,
-            '',
+        out: list[str] = []
+
+        self.emit_tag_syntax(node, out)
+
+        return ''.join(out)
+
+    def emit_text(self, node: "ast.TextNode", out: list[str]):
+        if self._translates_text:
+            out.append(self.translate_text(node))
+        else:
+            out.append(node.content)
+
+    def emit_tag(self, node: "ast.TagNode", out: list[str]):
+        if self._translates_tag:
+            out.append(self.translate_tag(node))
+        else:
+            self.emit_tag_syntax(node, out)
+
+    def emit_tag_syntax(self, node: "ast.TagNode", out: list[str]):
+        """
+        Appends the RST syntax of a `TagNode` to the `out` buffer, with
+        its children emitted straight into the buffer, which is joined
+        only once by the caller.
+        """
+
+        if self.enter_tag(node.name, node.params, out):
+            mark = len(out)
+
+            self.emit_children(node, out)
+            self.exit_tag(node.name, node.params, out, mark)
+
+    @property
+    def walkable(self) -> bool:  # type: ignore
+        # The walker only calls the callbacks, so subclasses that customize
+        # any method of the recursive API are translated with it instead,
+        # so that their customizations still apply.
+        cls = type(self)
+
+        return not (
+            cls._translates_text
+            or cls._translates_tag
+            or cls.emit_text is not RSTSyntaxTranslator.emit_text
+            or cls.emit_tag is not RSTSyntaxTranslator.emit_tag
         )
 
+    def enter_tag(self, name: str, params: Mapping[str, str], out: list[str]) -> bool:
         # Depending on the node name, the resultant syntax will change.
-        match node.name:
-            case "root": return content
-            case "bold": return f"**{content}**"
-            case "newline": return f"\n"
-            case "italic": return f"*{content}*"
-            case "paragraph": return content
-            case "code": return f"``{content}``"
-            case "codeblock": return self.make_codeblock(
-                content,
-                node.params.get("language", '')
-            )
-            case "link": return f"{content} <{node.params.get("url", '')}>_"
-            case "reference": return make_code_member_ref(node.params.get("name", ''))
-            case _: return ''
-
-        return content
+        match name:
+            case "root" | "paragraph" | "link" | "codeblock": return True
+            case "bold": out.append("**")
+            case "italic": out.append("*")
+            case "code": out.append("``")
+            case "newline":
+                out.append("\n")
+                return False
+            case "reference":
+                self.resolve_reference(params)
+                out.append(make_code_member_ref(params.get("name", '')))
+                return False
+            case _: return False
+
+        return True
+
+    def exit_tag(self, name: str, params: Mapping[str, str], out: list[str], mark: int):
+        match name:
+            case "bold": out.append("**")
+            case "italic": out.append("*")
+            case "code": out.append("``")
+            case "codeblock":
+                content = ''.join(out[mark:])
+                del out[mark:]
+                out.append(self.make_codeblock(content, params.get("language", '')))
+            case "link": out.append(f" <{params.get("url", '')}>_")
+            case _: pass
+
+    def visit_text(self, content: str, out: list[str]):
+        out.append(content)
@@ -1,8 +1,17 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import Mapping, TypedDict, TYPE_CHECKING
+
+from godocs.translation import walker
 
 if TYPE_CHECKING:
     from godocs.translation import ast
+    from godocs.parser.symbol_table import Symbol, SymbolTable
+
+
+class BrokenReference(TypedDict):
+    scope: str
+    kind: str
+    name: str
 
 
 class SyntaxTranslator(ABC):
@@ -14,6 +23,48 @@ class SyntaxTranslator(ABC):
 
     Subclasses must implement the `translate_text` and `translate_tag` methods
     for defining how those nodes should be translated.
+
+    Translations can also be emitted into a buffer (a `list` of `str`
+    later joined), through the `emit` methods. By default, those just
+    append the results of `translate_text` and `translate_tag`, but
+    subclasses can override `emit_text` and `emit_tag` so that the
+    output of nested nodes is joined only once, in linear time.
+
+    Subclasses that also implement the `enter_tag`, `exit_tag` and
+    `visit_text` callbacks, and set `walkable`, can have ASTs of any
+    depth translated iteratively by the `godocs.translation.walker`.
+    The walker only calls those callbacks, so they must produce the same
+    output as the recursive API, and translators whose recursive API
+    is customized (by a subclass, for example) shouldn't be `walkable`.
+    Translators that aren't `walkable` are always translated with their
+    recursive API, and don't need to implement the callbacks.
+
+    Translators given a `SymbolTable` through `use_symbols` can resolve
+    the references they translate with `resolve_reference`, which also
+    records the ones that point to no documented symbol.
+    """
+
+    walkable: bool = False
+    """
+    Whether this translator implements the `enter_tag`, `exit_tag` and
+    `visit_text` callbacks used by the `godocs.translation.walker`.
+    """
+
+    symbols: "SymbolTable | None" = None
+    """
+    The documented symbols that references are resolved against, if any.
+    """
+
+    scope: str = ''
+    """
+    The name of the class whose documentation is being translated,
+    which unqualified references are relative to.
+    """
+
+    broken: list[BrokenReference]
+    """
+    The references that couldn't be resolved against the `symbols`
+    since they were set.
     """
 
     @abstractmethod
@@ -31,3 +82,138 @@ class SyntaxTranslator(ABC):
         """
 
         pass
+
+    def translate(self, node: "ast.Node") -> str:
+        """
+        Translates any `Node` into its string representation by emitting
+        it into a buffer and joining the result.
+        """
+
+        out: list[str] = []
+
+        node.emit(self, out)
+
+        return ''.join(out)
+
+    def translate_flat(self, tree: "ast.FlatTree", index: int = 0) -> str:
+        """
+        Translates the node at `index` of a `FlatTree` into its string
+        representation.
+
+        If this translator is `walkable`, the arrays of the `tree` are
+        walked directly. Otherwise, the node is adapted into an `ast.Node`
+        first.
+        """
+
+        if self.walkable:
+            return walker.translate_flat(tree, self, index)
+
+        return self.translate(tree.to_node(index))
+
+    def use_symbols(self, symbols: "SymbolTable | None"):
+        """
+        Sets the `symbols` that references are resolved against, clearing
+        the `broken` references found so far.
+        """
+
+        self.symbols = symbols
+        self.broken = []
+
+    def resolve_reference(self, params: Mapping[str, str]) -> "Symbol | None":
+        """
+        Returns the symbol a `"reference"` tag with the given `params`
+        points to, if this translator has `symbols` and it's documented.
+
+        References that point to no documented symbol are added to
+        `broken`, unless they may point to undocumented classes (like the
+        ones of the engine), as told by `SymbolTable.is_documented`.
+        """
+
+        symbols = self.symbols
+
+        if symbols is None:
+            return None
+
+        kind = params.get("type", '')
+        name = params.get("name", '')
+
+        result = symbols.resolve(kind, name, self.scope)
+
+        if result is None and symbols.is_documented(kind, name, self.scope):
+            self.broken.append({"scope": self.scope, "kind": kind, "name": name})
+
+        return result
+
+    def translate_children(self, node: "ast.TagNode") -> str:
+        """
+        Translates the children of a `TagNode`, returning their string
+        representations joined together.
+        """
+
+        out: list[str] = []
+
+        self.emit_children(node, out)
+
+        return ''.join(out)
+
+    def emit(self, node: "ast.Node", out: list[str]):
+        """
+        Appends the string representation of any `Node` to the `out` buffer.
+        """
+
+        node.emit(self, out)
+
+    def emit_text(self, node: "ast.TextNode", out: list[str]):
+        """
+        Appends the string representation of a `TextNode` to the `out` buffer.
+        """
+
+        out.append(self.translate_text(node))
+
+    def emit_tag(self, node: "ast.TagNode", out: list[str]):
+        """
+        Appends the string representation of a `TagNode` to the `out` buffer.
+        """
+
+        out.append(self.translate_tag(node))
+
+    def emit_children(self, node: "ast.TagNode", out: list[str]):
+        """
+        Appends the string representations of the children of a `TagNode`
+        to the `out` buffer.
+        """
+
+        for child in node.children:
+            child.emit(self, out)
+
+    def enter_tag(self, name: str, params: Mapping[str, str], out: list[str]) -> bool:
+        """
+        Callback of the `walker` that appends the output that comes before
+        the children of a tag with a `name` and `params` to the `out`
+        buffer, returning whether its children should be translated.
+
+        Must be implemented by `walkable` translators, as no output can
+        be derived from `translate_tag` without the node's children.
+        """
+
+        raise NotImplementedError(
+            f"{type(self).__name__} isn't walkable, so it must be translated with its recursive API")
+
+    def exit_tag(self, name: str, params: Mapping[str, str], out: list[str], mark: int):
+        """
+        Callback of the `walker` that appends the output that comes after
+        the children of a tag with a `name` and `params` to the `out`
+        buffer, in which the translation of its children starts at `mark`.
+        """
+
+        pass
+
+    def visit_text(self, content: str, out: list[str]):
+        """
+        Callback of the `walker` that appends the translation of a text
+        with the given `content` to the `out` buffer.
+
+        By default, the `content` is appended as is.
+        """
+
+        out.append(content)
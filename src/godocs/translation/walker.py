@@ -0,0 +1,171 @@
+from typing import Iterator, TYPE_CHECKING
+
+from godocs.translation import ast
+from godocs.translation.ast.flat_tree import TEXT, NONE
+
+if TYPE_CHECKING:
+    from godocs.translation.translator import SyntaxTranslator
+
+
+def translate(node: ast.Node, translator: "SyntaxTranslator") -> str:
+    """
+    Translates an AST `node` with the given `translator`, without recursion
+    if the `translator` is `walkable`, or with its recursive API otherwise.
+    """
+
+    if not translator.walkable:
+        return translator.translate(node)
+
+    out: list[str] = []
+
+    walk(node, translator, out)
+
+    return ''.join(out)
+
+
+def translate_flat(
+    tree: ast.FlatTree,
+    translator: "SyntaxTranslator",
+    index: int = 0,
+) -> str:
+    """
+    Translates the node at `index` of a `FlatTree` with the given
+    `translator`, walking its arrays if the `translator` is `walkable`,
+    or adapting the node into an `ast.Node` for its recursive API
+    otherwise.
+    """
+
+    if not translator.walkable:
+        return translator.translate(tree.to_node(index))
+
+    out: list[str] = []
+
+    walk_flat(tree, translator, out, index)
+
+    return ''.join(out)
+
+
+def walk(node: ast.Node, translator: "SyntaxTranslator", out: list[str]):
+    """
+    Appends the translation of an AST `node` by a `walkable` `translator`
+    to the `out` buffer.
+
+    The tree is traversed with an explicit stack, calling the `enter_tag`
+    and `exit_tag` callbacks of the `translator` around the children of
+    each `TagNode` and its `visit_text` callback for each `TextNode`, so
+    ASTs of any depth can be translated without recursion. Other nodes
+    are emitted with their own `emit` method.
+    """
+
+    if not isinstance(node, ast.TagNode):
+        visit(node, translator, out)
+        return
+
+    if not translator.enter_tag(node.name, node.params, out):
+        return
+
+    # Tags whose children are being visited, with an iterator over
+    # the children left and the offset in the output where the
+    # translation of their children starts.
+    stack: list[tuple[Iterator[ast.Node], ast.TagNode, int]] = [
+        (iter(node.children), node, len(out))
+    ]
+
+    # Methods are bound once, as this loop runs once per node.
+    enter_tag = translator.enter_tag
+    exit_tag = translator.exit_tag
+    visit_text = translator.visit_text
+
+    while stack:
+        children, tag, mark = stack[-1]
+
+        for child in children:
+            if isinstance(child, ast.TextNode):
+                visit_text(child.content, out)
+            elif not isinstance(child, ast.TagNode):
+                child.emit(translator, out)
+            elif enter_tag(child.name, child.params, out):
+                if child.children:
+                    stack.append((iter(child.children), child, len(out)))
+                    break
+
+                exit_tag(child.name, child.params, out, len(out))
+        else:
+            stack.pop()
+
+            exit_tag(tag.name, tag.params, out, mark)
+
+
+def visit(node: ast.Node, translator: "SyntaxTranslator", out: list[str]):
+    """
+    Appends the translation of an AST `node` that isn't a `TagNode` by
+    a `walkable` `translator` to the `out` buffer.
+    """
+
+    if isinstance(node, ast.TextNode):
+        translator.visit_text(node.content, out)
+    else:
+        node.emit(translator, out)
+
+
+def walk_flat(
+    tree: ast.FlatTree,
+    translator: "SyntaxTranslator",
+    out: list[str],
+    index: int = 0,
+):
+    """
+    Appends the translation of the node at `index` of a `FlatTree` by
+    a `walkable` `translator` to the `out` buffer.
+
+    The arrays of the `tree` are walked directly, calling the same
+    callbacks of the `translator` as `walk`, so that no `Node` object
+    is created.
+    """
+
+    # The arrays are read directly, as this is the hot loop
+    # of bulk translations.
+    source = tree.source
+    kinds = tree.kinds
+    parents = tree.parents
+    starts = tree.starts
+    ends = tree.ends
+    values = tree.values
+    params = tree.params
+    strings = tree.tables.strings
+    param_tables = tree.tables.param_tables
+    size = len(tree)
+
+    # Tags whose children are being visited, with the offset in
+    # the output where the translation of their children starts.
+    stack: list[tuple[int, int]] = []
+
+    node = index
+
+    while True:
+        value = values[node]
+
+        if kinds[node] == TEXT:
+            translator.visit_text(
+                source[starts[node]:ends[node]] if value == NONE
+                else strings[value],
+                out,
+            )
+            node += 1
+        elif translator.enter_tag(strings[value], param_tables[params[node]], out):
+            stack.append((node, len(out)))
+            node += 1
+        else:
+            node = tree.skip(node)
+
+        parent = parents[node] if node < size else NONE
+
+        # Closes the tags that have no children left.
+        while stack and stack[-1][0] != parent:
+            tag, mark = stack.pop()
+
+            translator.exit_tag(
+                strings[values[tag]], param_tables[params[tag]], out, mark)
+
+        if not stack:
+            break
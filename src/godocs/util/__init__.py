@@ -1,5 +1,18 @@
-from . import dir
-from . import module
-from . import options
+import importlib
+from typing import TYPE_CHECKING
 
-__all__ = ["dir", "module", "options"]
+if TYPE_CHECKING:
+    from . import dir, module, options, profiling, watch
+
+__all__ = ["dir", "module", "options", "profiling", "watch"]
+
+
+def __getattr__(name: str):
+    """
+    Imports the modules of `godocs.util` when they're first accessed.
+    """
+
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
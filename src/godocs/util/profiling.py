@@ -0,0 +1,188 @@
+import os
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, TypedDict
+
+
+class StageReport(TypedDict):
+    name: str
+    wall_time: float
+    cpu_time: float
+    peak_memory: int
+    items: int
+
+
+type StageHook = Callable[[StageReport], None]
+
+
+class Profiler:
+    """
+    Measures the wall time, CPU time, item count and, optionally, peak
+    memory of the stages of a process, like the ones of the `construct`
+    command.
+
+    Stages are measured with the `stage` context manager, which only
+    does any work if this `Profiler` is `enabled` or if there are hooks
+    subscribed to it, so it costs nothing otherwise.
+
+    Hooks subscribed with `subscribe` are called with the `StageReport`
+    of each stage as soon as it ends.
+
+    The CPU time of a stage includes the one of the child processes
+    that ended during it, like the workers of the `--jobs` option, but
+    only on platforms that report it (not on Windows), and not the one
+    of workers that outlive the stage, like the ones of an executor
+    passed by the caller.
+    """
+
+    enabled: bool
+    """
+    Whether stages should be measured even without hooks subscribed.
+    """
+
+    memory: bool
+    """
+    Whether the peak memory of the stages should be measured, which
+    uses `tracemalloc` and slows the stages down so much that their
+    times are mostly the overhead of the tracing.
+    """
+
+    hooks: list[StageHook]
+    """
+    The functions called with the report of each stage measured.
+    """
+
+    reports: list[StageReport]
+    """
+    The reports of the stages measured so far.
+    """
+
+    def __init__(self, enabled: bool = False, memory: bool = False):
+        self.enabled = enabled
+        self.memory = memory
+        self.hooks = []
+        self.reports = []
+
+    @property
+    def active(self) -> bool:
+        """
+        Whether stages are being measured.
+        """
+
+        return self.enabled or len(self.hooks) > 0
+
+    def reset(self):
+        """
+        Removes the reports of the stages measured so far, so that
+        the next ones can be reported by themselves.
+        """
+
+        self.reports = []
+
+    def subscribe(self, hook: StageHook):
+        """
+        Registers a `hook` to be called with the report of each stage.
+        """
+
+        self.hooks.append(hook)
+
+    def unsubscribe(self, hook: StageHook):
+        """
+        Removes a `hook` previously registered with `subscribe`.
+        """
+
+        self.hooks.remove(hook)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageReport]:
+        """
+        Measures the code run inside this context manager as a stage
+        called `name`.
+
+        The `StageReport` yielded can have its `"items"` set to the
+        number of items the stage processed.
+        """
+
+        report: StageReport = {
+            "name": name,
+            "wall_time": 0.0,
+            "cpu_time": 0.0,
+            "peak_memory": 0,
+            "items": 0,
+        }
+
+        if not self.active:
+            yield report
+            return
+
+        # Only imported when measuring, as the profiler is created
+        # on every start of the CLI.
+        import tracemalloc
+
+        started_tracing = False
+
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+
+            tracemalloc.reset_peak()
+
+        start_memory = tracemalloc.get_traced_memory()[0] if self.memory else 0
+        start_wall = time.perf_counter()
+        start_cpu = get_cpu_time()
+
+        try:
+            yield report
+        finally:
+            report["wall_time"] = time.perf_counter() - start_wall
+            report["cpu_time"] = get_cpu_time() - start_cpu
+
+            if self.memory:
+                report["peak_memory"] = max(
+                    0, tracemalloc.get_traced_memory()[1] - start_memory)
+
+            if started_tracing:
+                tracemalloc.stop()
+
+            self.reports.append(report)
+
+            for hook in self.hooks:
+                hook(report)
+
+    def format(self) -> str:
+        """
+        Returns a table with the reports of the stages measured so far,
+        with their peak memory only if it's measured.
+        """
+
+        peak = f"{'peak (MiB)':>12}" if self.memory else ''
+
+        lines = [
+            f"{'stage':<28}{'wall (s)':>10}{'cpu (s)':>10}{peak}{'items':>8}"
+        ]
+
+        for report in self.reports:
+            if self.memory:
+                peak = f"{report['peak_memory'] / 2 ** 20:>12.2f}"
+
+            lines.append(
+                f"{report['name']:<28}"
+                f"{report['wall_time']:>10.3f}"
+                f"{report['cpu_time']:>10.3f}"
+                f"{peak}"
+                f"{report['items']:>8}"
+            )
+
+        return '\n'.join(lines)
+
+
+def get_cpu_time() -> float:
+    """
+    Returns the CPU time, in seconds, used by this process and by its
+    child processes that already ended.
+    """
+
+    times = os.times()
+
+    return times.user + times.system + times.children_user + times.children_system
@@ -0,0 +1,106 @@
+import time
+from os import PathLike
+from pathlib import Path
+
+
+type Snapshot = dict[str, tuple[int, int]]
+"""
+The size and modification time, in nanoseconds, of watched files,
+keyed by their paths.
+"""
+
+
+class Watcher:
+    """
+    Watches the files matching a `pattern` in a directory (or a single
+    file) for changes, by polling their size and modification time.
+
+    Polling only stats the files, so it is cheap enough to run a few
+    times per second, and works on any platform without extra
+    dependencies.
+    """
+
+    path: Path
+    """
+    The directory, or file, being watched.
+    """
+
+    pattern: str
+    """
+    The glob pattern of the files watched inside the `path`.
+    """
+
+    interval: float
+    """
+    How long, in seconds, to sleep between polls in `wait`.
+    """
+
+    snapshot: Snapshot
+    """
+    The state of the files found in the last poll.
+    """
+
+    def __init__(
+        self,
+        path: str | PathLike[str],
+        pattern: str = "*",
+        interval: float = 0.5,
+    ):
+        self.path = Path(path)
+        self.pattern = pattern
+        self.interval = interval
+        self.snapshot = self.scan()
+
+    def scan(self) -> Snapshot:
+        """
+        Returns the current state of the files watched.
+
+        Files removed while being scanned are left out.
+        """
+
+        paths = [self.path] if self.path.is_file() else self.path.glob(self.pattern)
+
+        result: Snapshot = {}
+
+        for path in paths:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+
+            result[str(path)] = (stat.st_size, stat.st_mtime_ns)
+
+        return result
+
+    def poll(self) -> list[str]:
+        """
+        Returns the sorted paths of the files that were added, changed
+        or removed since the last poll.
+        """
+
+        current = self.scan()
+        previous = self.snapshot
+
+        self.snapshot = current
+
+        changed = {
+            path for path, state in current.items()
+            if previous.get(path) != state
+        }
+        changed.update(path for path in previous if path not in current)
+
+        return sorted(changed)
+
+    def wait(self) -> list[str]:
+        """
+        Blocks until any file watched is added, changed or removed,
+        returning their sorted paths.
+        """
+
+        while True:
+            changed = self.poll()
+
+            if changed:
+                return changed
+
+            time.sleep(self.interval)
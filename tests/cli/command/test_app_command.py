@@ -0,0 +1,34 @@
+import sys
+
+import pytest
+
+from godocs.cli.command import app_command
+from godocs.cli.command.app_command import AppCommand
+from godocs.plugin import LazyPlugin, PluginRegistry
+
+
+def make_plugin(commands: list[list[str]]) -> LazyPlugin:
+    return LazyPlugin(
+        {"name": "example", "value": "module:Plugin", "commands": commands},
+        PluginRegistry(),
+    )
+
+
+def test_app_command_uses_argv_passed(monkeypatch: pytest.MonkeyPatch):
+    # Arrange
+    plugin = make_plugin([["example"]])
+
+    monkeypatch.setattr(app_command, "load_plugins", lambda: [plugin])
+    # The command line of the program needs the plugin, the one passed doesn't.
+    monkeypatch.setattr(sys, "argv", ["godocs", "example"])
+
+    app = AppCommand()
+
+    # Act
+    app.register(argv=["serve", "--socket", "godocs.sock"])
+
+    args = app.parse()
+
+    # Assert
+    assert app.deferred == [plugin]
+    assert args.socket == "godocs.sock"
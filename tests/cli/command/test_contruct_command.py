@@ -0,0 +1,80 @@
+from argparse import Namespace
+from pathlib import Path
+
+from godocs.cli.command import ConstructCommand
+from godocs.util.profiling import Profiler
+
+
+def make_args(input_dir: Path, **options: object) -> Namespace:
+    args = Namespace(
+        input_dir=str(input_dir),
+        output_dir="out",
+        options_file=None,
+        translator="rst",
+        jobs=None,
+        cache_dir=None,
+        watch=False,
+        profile=False,
+        profile_memory=False,
+        compact=False,
+        check_references=False,
+        execute=lambda args: None,
+    )
+
+    for name, value in options.items():
+        setattr(args, name, value)
+
+    return args
+
+
+def test_construct_command_profiles_only_the_current_build(tmp_path: Path):
+    # Arrange
+    (tmp_path / "A.xml").write_text("""
+        <class name="A">
+          <brief_description>Brief.</brief_description>
+          <description>Description.</description>
+        </class>
+    """)
+
+    command = ConstructCommand()
+    command.profiler = Profiler(memory=False)
+
+    command.process(make_args(tmp_path, profile=True))
+
+    profiled = [report["name"] for report in command.profiler.reports]
+
+    # Act
+    command.process(make_args(tmp_path))
+
+    # Assert
+    assert profiled == [
+        "xml_parser.parse", "context_creator.create", "context_creator.translate"]
+    assert not command.profiler.active
+    assert command.profiler.reports == []
+
+
+def test_construct_command_profiles_the_stages_of_cached_builds(tmp_path: Path):
+    # Arrange
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "A.xml").write_text("""
+        <class name="A">
+          <brief_description>Brief.</brief_description>
+          <description>Description.</description>
+        </class>
+    """)
+
+    command = ConstructCommand()
+    command.profiler = Profiler()
+    command.caches = {}
+
+    # Act
+    command.process(make_args(
+        tmp_path / "docs", profile=True, cache_dir=str(tmp_path / "cache")))
+
+    # Assert
+    reports = {report["name"]: report for report in command.profiler.reports}
+
+    assert list(reports) == [
+        "xml_parser.parse", "context_creator.create", "context_creator.translate"]
+    assert [report["items"] for report in reports.values()] == [1, 1, 1]
+    assert command.profiler.memory is False
@@ -0,0 +1,126 @@
+import io
+import json
+from argparse import ArgumentParser, Namespace
+from typing import Any
+
+from godocs.cli.command import ServeCommand
+
+
+class FakeApp:
+
+    def __init__(self):
+        self.parser = ArgumentParser()
+        self.parser.add_argument("input_dir")
+        self.parser.set_defaults(execute=self.execute)
+        self.builds: list[str] = []
+
+    def start(self, args: Namespace):
+        args.execute(args)
+
+    def execute(self, args: Namespace):
+        if args.input_dir == "broken":
+            raise ValueError("broken docs")
+
+        self.builds.append(args.input_dir)
+
+        args.ctx = {"classes": [{"name": "A"}]}
+        args.changed = ["A"] if len(self.builds) > 1 else None
+
+
+def make_command() -> tuple[ServeCommand, FakeApp]:
+    command = ServeCommand()
+    app = FakeApp()
+    command.app = app  # type: ignore
+
+    return command, app
+
+
+def request(command: ServeCommand, method: str, params: Any = None, id: int = 1) -> Any:
+    message = {"jsonrpc": "2.0", "id": id, "method": method}
+
+    if params is not None:
+        message["params"] = params
+
+    return json.loads(command.handle(json.dumps(message)))  # type: ignore
+
+
+def test_serve_command_answers_ping():
+    # Arrange
+    command, _ = make_command()
+
+    # Act
+    response = request(command, "ping")
+
+    # Assert
+    assert response == {"jsonrpc": "2.0", "id": 1, "result": "pong"}
+
+
+def test_serve_command_builds_command_lines():
+    # Arrange
+    command, app = make_command()
+
+    request(command, "build", {"args": ["docs"]})
+
+    # Act
+    response = request(command, "build", {"args": ["docs"]}, 2)
+
+    # Assert
+    assert app.builds == ["docs", "docs"]
+    assert response["id"] == 2
+    assert response["result"]["classes"] == 1
+    assert response["result"]["changed"] == ["A"]
+
+
+def test_serve_command_reports_errors():
+    # Arrange
+    command, _ = make_command()
+
+    # Act
+    invalid_json = json.loads(command.handle("{"))  # type: ignore
+    unknown = request(command, "unknown")
+    invalid_params = request(command, "build", {"args": "docs"})
+    invalid_args = request(command, "build", {"args": ["a", "b"]})
+    failed = request(command, "build", {"args": ["broken"]})
+
+    # Assert
+    assert invalid_json["error"]["code"] == -32700
+    assert unknown["error"]["code"] == -32601
+    assert invalid_params["error"]["code"] == -32602
+    assert invalid_args["error"]["code"] == -32602
+    assert failed["error"] == {
+        "code": -32000, "message": "Build failed: broken docs"}
+
+
+def test_serve_command_ignores_notifications():
+    # Arrange
+    command, app = make_command()
+
+    # Act
+    response = command.handle(json.dumps(
+        {"jsonrpc": "2.0", "method": "build", "params": {"args": ["docs"]}}))
+
+    # Assert
+    assert response is None
+    assert app.builds == ["docs"]
+
+
+def test_serve_command_serves_stream_until_shutdown():
+    # Arrange
+    command, _ = make_command()
+
+    input = io.StringIO("\n".join([
+        json.dumps({"jsonrpc": "2.0", "id": 1, "method": "ping"}),
+        '',
+        json.dumps({"jsonrpc": "2.0", "id": 2, "method": "shutdown"}),
+        json.dumps({"jsonrpc": "2.0", "id": 3, "method": "ping"}),
+    ]))
+    output = io.StringIO()
+
+    # Act
+    command.serve_stream(input, output)
+
+    # Assert
+    responses = [json.loads(line) for line in output.getvalue().splitlines()]
+
+    assert [r["id"] for r in responses] == [1, 2]
+    assert command.running is False
@@ -0,0 +1,90 @@
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import godocs
+
+
+STARTUP_BUDGET = 0.25
+"""
+The maximum time, in seconds, that showing the help of the CLI may take
+over starting the interpreter alone.
+
+It's generous, so that loaded machines don't fail the check, as slow
+imports are already caught by the checks of the modules imported.
+"""
+
+HEAVY_MODULES = [
+    "godocs.parser",
+    "godocs.translation",
+    "godocs.constructor",
+    "xml.etree.ElementTree",
+    "concurrent.futures",
+    "multiprocessing",
+    "tracemalloc",
+    "socketserver",
+]
+"""
+Modules that should only be imported by the commands that use them.
+"""
+
+
+def run(*args: str) -> subprocess.CompletedProcess[str]:
+    env = {**os.environ, "PYTHONPATH": str(Path(godocs.__file__).parent.parent)}
+
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, env=env, check=True)
+
+
+def measure(*args: str) -> float:
+    start = time.perf_counter()
+
+    run(*args)
+
+    return time.perf_counter() - start
+
+
+def test_cli_startup_skips_heavy_modules():
+    # Arrange
+    code = "import sys, json, godocs.cli.main; print(json.dumps(list(sys.modules)))"
+
+    # Act
+    modules = json.loads(run("-c", code).stdout)
+
+    # Assert
+    assert [name for name in HEAVY_MODULES if name in modules] == []
+
+
+def test_cli_registration_skips_heavy_modules():
+    # Arrange
+    code = (
+        "import sys, json\n"
+        "from godocs.cli.command import AppCommand\n"
+        "AppCommand().register(argv=[])\n"
+        "print(json.dumps(list(sys.modules)))"
+    )
+
+    # Act
+    modules = json.loads(run("-c", code).stdout)
+
+    # Assert
+    assert [name for name in HEAVY_MODULES if name in modules] == []
+
+
+def test_cli_startup_fits_budget():
+    # Arrange
+    baseline: list[float] = []
+    times: list[float] = []
+
+    # Act
+    # Runs are interleaved, and only the fastest ones compared, so
+    # changes in the load of the machine affect both the same way.
+    for _ in range(5):
+        baseline.append(measure("-c", "pass"))
+        times.append(measure("-c", "from godocs.cli import main; main()", "--help"))
+
+    # Assert
+    assert min(times) - min(baseline) < STARTUP_BUDGET
@@ -0,0 +1,17 @@
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """
+    Keeps the plugin registry of the commands run by tests out of the
+    user cache directory.
+    """
+
+    path = tmp_path_factory.mktemp("cache")
+
+    monkeypatch.setenv("GODOCS_CACHE_DIR", str(path))
+
+    return path
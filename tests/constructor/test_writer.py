@@ -0,0 +1,81 @@
+from pathlib import Path
+
+import pytest
+
+from godocs.constructor import OutputWriter
+from godocs.constructor.writer import write_file
+
+
+def test_output_writer_writes_files(tmp_path: Path):
+    # Arrange
+    writer = OutputWriter(tmp_path, jobs=4)
+
+    # Act
+    with writer:
+        for i in range(20):
+            writer.write(f"classes/class_{i}.rst", f"Class {i}")
+
+    # Assert
+    assert (tmp_path / "classes" / "class_7.rst").read_text() == "Class 7"
+    assert writer.stats == {"written": 20, "skipped": 0}
+    assert len(list((tmp_path / "classes").iterdir())) == 20
+
+
+def test_output_writer_skips_unchanged_files(tmp_path: Path):
+    # Arrange
+    (tmp_path / "a.rst").write_text("Same")
+    (tmp_path / "b.rst").write_text("Old")
+
+    mtime = (tmp_path / "a.rst").stat().st_mtime_ns
+
+    writer = OutputWriter(tmp_path, jobs=0)
+
+    # Act
+    with writer:
+        a = writer.write("a.rst", "Same")
+        b = writer.write("b.rst", b"New")
+
+    # Assert
+    assert a.result() is False
+    assert b.result() is True
+    assert (tmp_path / "a.rst").stat().st_mtime_ns == mtime
+    assert (tmp_path / "b.rst").read_text() == "New"
+    assert writer.stats == {"written": 1, "skipped": 1}
+
+
+def test_output_writer_writes_serially(tmp_path: Path):
+    # Arrange
+    writer = OutputWriter(tmp_path, jobs=1)
+
+    # Act
+    future = writer.write("a.rst", "Content")
+
+    # Assert
+    assert future.done()
+    assert (tmp_path / "a.rst").read_text() == "Content"
+
+    writer.close()
+
+
+def test_output_writer_raises_write_errors(tmp_path: Path):
+    # Arrange
+    (tmp_path / "file").write_text('')
+
+    writer = OutputWriter(tmp_path)
+
+    # Act
+    writer.write("file/a.rst", "Content")
+
+    # Assert
+    with pytest.raises(OSError):
+        writer.close()
+
+
+def test_write_file_leaves_no_temporary_files(tmp_path: Path):
+    # Act
+    write_file(tmp_path / "a.rst", b"First")
+    write_file(tmp_path / "a.rst", b"Second")
+
+    # Assert
+    assert [p.name for p in tmp_path.iterdir()] == ["a.rst"]
+    assert (tmp_path / "a.rst").read_bytes() == b"Second"
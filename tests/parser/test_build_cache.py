@@ -0,0 +1,238 @@
+from pathlib import Path
+
+import pytest
+
+from godocs.parser import BuildCache, ParseCache, context_creator, xml_parser
+from godocs.translation.interpreter import BBCodeInterpreter
+from godocs.translation.translator import RSTSyntaxTranslator
+
+
+def write_class(path: Path, name: str, inherits: str = '', brief: str = "Brief."):
+    (path / f"{name}.xml").write_text(f"""
+        <class name="{name}" inherits="{inherits}">
+          <brief_description>{brief}</brief_description>
+          <description>Description of [b]{name}[/b].</description>
+        </class>
+    """)
+
+
+def build(cache: BuildCache, path: Path):
+    return cache.build(path, BBCodeInterpreter(), RSTSyntaxTranslator())
+
+
+def test_build_cache_builds_same_context(tmp_path: Path):
+    # Arrange
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    write_class(docs_dir, "A")
+    write_class(docs_dir, "B", "A")
+
+    cache = BuildCache(tmp_path / "cache")
+
+    expected = context_creator.translate(
+        context_creator.create(xml_parser.parse(docs_dir)),
+        BBCodeInterpreter(),
+        RSTSyntaxTranslator(),
+    )
+
+    # Act
+    ctx = build(cache, docs_dir)
+
+    # Assert
+    assert ctx["classes"] == expected["classes"]
+    assert ctx["hierarchy"] == expected["hierarchy"]
+    assert cache.stats["changed"] == 2
+
+
+def test_build_cache_builds_same_context_in_parallel(tmp_path: Path):
+    # Arrange
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+
+    for name, inherits in [("A", ''), ("B", "A"), ("C", "B"), ("D", "A")]:
+        write_class(docs_dir, name, inherits)
+
+    expected = build(BuildCache(None), docs_dir)
+
+    cache = BuildCache(tmp_path / "cache")
+
+    # Act
+    ctx = cache.build(
+        docs_dir, BBCodeInterpreter(), RSTSyntaxTranslator(), jobs=2)
+
+    # Assert
+    assert ctx["classes"] == expected["classes"]
+    assert ctx["hierarchy"] == expected["hierarchy"]
+    assert cache.affected == ["A", "B", "C", "D"]
+
+
+def test_build_cache_reuses_unchanged_classes(tmp_path: Path):
+    # Arrange
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    write_class(docs_dir, "A")
+    write_class(docs_dir, "B", "A")
+
+    build(BuildCache(tmp_path / "cache"), docs_dir)
+
+    write_class(docs_dir, "B", "A", "Changed.")
+
+    cache = BuildCache(tmp_path / "cache")
+
+    # Act
+    ctx = build(cache, docs_dir)
+
+    # Assert
+    assert cache.stats == {
+        "files": 2, "changed": 1, "removed": 0, "updated": 0}
+    assert ctx["classes"][0]["description"] == "Description of **A**."
+    assert ctx["classes"][1]["brief_description"] == "Changed."
+
+
+def test_build_cache_updates_inheritage_of_descendants(tmp_path: Path):
+    # Arrange
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    write_class(docs_dir, "A")
+    write_class(docs_dir, "B", "A")
+    write_class(docs_dir, "C", "B")
+
+    build(BuildCache(tmp_path / "cache"), docs_dir)
+
+    write_class(docs_dir, "A", "Object")
+
+    cache = BuildCache(tmp_path / "cache")
+
+    # Act
+    ctx = build(cache, docs_dir)
+
+    # Assert
+    assert cache.stats["changed"] == 1
+    assert cache.stats["updated"] == 2
+    assert ctx["classes"][2]["inheritage"] == ["B", "A", "Object"]
+
+
+def test_build_cache_forgets_removed_classes(tmp_path: Path):
+    # Arrange
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    write_class(docs_dir, "A")
+    write_class(docs_dir, "B", "A")
+
+    build(BuildCache(tmp_path / "cache"), docs_dir)
+
+    (docs_dir / "A.xml").unlink()
+
+    cache = BuildCache(tmp_path / "cache")
+
+    # Act
+    ctx = build(cache, docs_dir)
+
+    # Assert
+    assert cache.stats["removed"] == 1
+    assert [c["name"] for c in ctx["classes"]] == ["B"]
+    assert ctx["classes"][0]["inheritage"] == ["A"]
+
+
+def test_build_cache_discards_other_signatures(tmp_path: Path):
+    # Arrange
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    write_class(docs_dir, "A")
+
+    cache = BuildCache(tmp_path / "cache")
+
+    build(cache, docs_dir)
+
+    # Act
+    cache.load("other")
+
+    # Assert
+    assert cache.entries == {}
+
+
+@pytest.mark.parametrize("content", [
+    b"\xff\xfe not utf-8",
+    b'"entries"',
+    b'{"version": 1, "signature": "sig", "entries": []}',
+    b'{"version": 1, "signature": "sig", "entries": {"A.xml": {"hash": "h"}}}',
+    b'{"version": 1, "signature": "sig", "entries": {"A.xml": {"hash": "h", "name": "A", "inherits": "", "record": 1}}}',
+])
+def test_build_cache_discards_malformed_files(tmp_path: Path, content: bytes):
+    # Arrange
+    (tmp_path / BuildCache.FILE_NAME).write_bytes(content)
+
+    cache = BuildCache(tmp_path)
+
+    # Act
+    cache.load("sig")
+
+    # Assert
+    assert cache.entries == {}
+
+
+def test_build_cache_reuses_parsed_records_when_invalidated(tmp_path: Path):
+    # Arrange
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    write_class(docs_dir, "A")
+
+    build(BuildCache(tmp_path / "cache"), docs_dir)
+
+    parse_file = tmp_path / "cache" / ParseCache.FILE_NAME
+    parse_mtime = parse_file.stat().st_mtime_ns
+
+    # Simulates a build made with another translator.
+    cache = BuildCache(tmp_path / "cache")
+    cache.signature = "other"
+    cache.save()
+
+    # Act
+    ctx = build(cache, docs_dir)
+
+    # Assert
+    assert cache.stats["changed"] == 1
+    assert ctx["classes"][0]["description"] == "Description of **A**."
+    assert parse_file.stat().st_mtime_ns == parse_mtime
+
+
+def test_build_cache_rebuilds_affected_classes_in_memory(tmp_path: Path):
+    # Arrange
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    write_class(docs_dir, "A")
+    write_class(docs_dir, "B", "A")
+    write_class(docs_dir, "C")
+
+    cache = BuildCache(None)
+
+    build(cache, docs_dir)
+
+    write_class(docs_dir, "A", "Object")
+
+    # Act
+    ctx = build(cache, docs_dir)
+
+    # Assert
+    assert cache.affected == ["A", "B"]
+    assert cache.parse_cache.stats["parsed"] == 1
+    assert ctx["classes"][1]["inheritage"] == ["A", "Object"]
+    assert list(tmp_path.iterdir()) == [docs_dir]
+
+
+def test_get_sources_covers_base_classes_and_helpers():
+    # Arrange
+    from godocs.parser.build_cache import get_sources
+    from godocs.translation import walker
+    from godocs.translation.ast import tag_node
+    from godocs.translation.interpreter import bbcode_interpreter
+    from godocs.translation.translator import syntax_translator
+
+    # Act
+    sources = get_sources(BBCodeInterpreter(), RSTSyntaxTranslator())
+
+    # Assert
+    paths = {path.resolve() for path in sources.values()}
+
+    for module in (walker, tag_node, bbcode_interpreter, syntax_translator):
+        assert Path(module.__file__).resolve() in paths  # type: ignore
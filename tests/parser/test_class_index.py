@@ -0,0 +1,136 @@
+import xml.etree.ElementTree as ET
+
+from godocs.parser import ClassIndex
+from godocs.parser.xml_parser import XMLDoc
+
+
+def test_class_index_gets_nodes():
+    # Arrange
+    docs: list[XMLDoc] = [
+        ET.ElementTree(ET.fromstring('<class name="A"></class>')),
+        ET.ElementTree(ET.fromstring('<class name="B" inherits="A"></class>'))
+    ]
+
+    # Act
+    index = ClassIndex(docs)
+
+    # Assert
+    assert len(index) == 2
+    assert index.get("B") is docs[1].getroot()
+    assert index.get("C") is None
+
+
+def test_class_index_gets_parents():
+    # Arrange
+    docs: list[XMLDoc] = [
+        ET.ElementTree(ET.fromstring('<class name="A"></class>')),
+        ET.ElementTree(ET.fromstring('<class name="B" inherits="A"></class>'))
+    ]
+
+    # Act
+    index = ClassIndex(docs)
+
+    # Assert
+    assert index.get_parent("B") == "A"
+    assert index.get_parent("A") == ""
+    assert index.get_parent("C") == ""
+
+
+def test_class_index_adds_entries_without_nodes():
+    # Arrange
+    index = ClassIndex()
+
+    # Act
+    index.add_entry("B", "A")
+
+    # Assert
+    assert "B" in index
+    assert index.get("B") is None
+    assert index.get_parent("B") == "A"
+
+
+def test_class_index_removes_entries():
+    # Arrange
+    index = ClassIndex([
+        ET.ElementTree(ET.fromstring('<class name="A"></class>')),
+    ])
+
+    # Act
+    index.remove("A")
+
+    # Assert
+    assert "A" not in index
+    assert index.get("A") is None
+
+
+def test_class_index_gets_inheritage():
+    # Arrange
+    index = ClassIndex()
+    index.add_entry("Node2D", "CanvasItem")
+    index.add_entry("Control", "CanvasItem")
+    index.add_entry("CanvasItem", "Node")
+    index.add_entry("Node", "Object")
+    index.add_entry("Object")
+
+    # Act
+    node_2d = index.get_inheritage("Node2D")
+    control = index.get_inheritage("Control")
+
+    # Assert
+    assert node_2d == ["CanvasItem", "Node", "Object"]
+    assert control == ["CanvasItem", "Node", "Object"]
+    assert index.get_inheritage("Object") == []
+
+
+def test_class_index_inheritage_stops_at_unindexed_class():
+    # Arrange
+    index = ClassIndex()
+    index.add_entry("B", "A")
+
+    # Act
+    inheritage = index.get_inheritage("B")
+
+    # Assert
+    assert inheritage == ["A"]
+    assert index.get_inheritage("A") == []
+
+
+def test_class_index_inheritage_stops_on_cycles():
+    # Arrange
+    index = ClassIndex()
+    index.add_entry("A", "B")
+    index.add_entry("B", "A")
+
+    # Act
+    inheritage = index.get_inheritage("A")
+
+    # Assert
+    assert inheritage == ["B", "A"]
+
+
+def test_class_index_inheritage_updates_on_changes():
+    # Arrange
+    index = ClassIndex()
+    index.add_entry("B", "A")
+    index.add_entry("A")
+
+    assert index.get_inheritage("B") == ["A"]
+
+    # Act
+    index.add_entry("A", "Object")
+
+    # Assert
+    assert index.get_inheritage("B") == ["A", "Object"]
+
+
+def test_class_index_gets_hierarchy():
+    # Arrange
+    index = ClassIndex()
+    index.add_entry("B", "A")
+    index.add_entry("A")
+
+    # Act
+    hierarchy = index.get_hierarchy()
+
+    # Assert
+    assert hierarchy == {"B": ["A"], "A": []}
@@ -16,9 +16,19 @@ from godocs.parser.context_creator import (
     parse_enums,
     parse_theme_items,
     parse_class,
+    create,
+    translate,
+    stream,
 )
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from godocs.parser import ClassIndex
+from godocs.parser.records import ClassRecord
+from godocs.translation.cache import TranslationCache
+from godocs.translation.interpreter import BBCodeInterpreter
+from godocs.translation.translator import RSTSyntaxTranslator
 
-from godocs.parser.xml_parser import XMLDoc
+from godocs.parser.xml_parser import XMLDoc, parse
 
 
 def test_get_class_node_finds_class():
@@ -67,6 +77,34 @@ def test_parse_inheritage_succeds():
     assert inheritage[1] == "B"
 
 
+def test_get_class_node_uses_index():
+    # Arrange
+    docs: list[XMLDoc] = [
+        ET.ElementTree(ET.fromstring('<class name="A"></class>')),
+        ET.ElementTree(ET.fromstring('<class name="B"></class>'))
+    ]
+
+    # Act
+    class_node = get_class_node("B", ClassIndex(docs))
+
+    # Assert
+    assert class_node is docs[1].getroot()
+
+
+def test_parse_inheritage_uses_index():
+    # Arrange
+    class_c = ET.fromstring('<class name="C" inherits="A"></class>')
+    index = ClassIndex()
+    index.add_entry("A", "B")
+    index.add_entry("B")
+
+    # Act
+    inheritage = parse_inheritage(class_c, index)
+
+    # Assert
+    assert inheritage == ["A", "B"]
+
+
 def test_parse_inheritage_unexisting():
     # Arrange
     class_c = ET.fromstring('<class name="C"></class>')
@@ -251,6 +289,23 @@ def test_parse_properties_succeds():
     assert result[1]["description"] == "The name of the thinga."
 
 
+def test_parse_property_interns_attributes():
+    # Arrange
+    nodes = [
+        ET.fromstring(
+            f'<member name="size" type="{"".join(["in", "t"])}" default="0">Size.</member>')
+        for _ in range(2)
+    ]
+
+    # Act
+    first, second = [parse_property(node) for node in nodes]
+
+    # Assert
+    assert first["type"] is second["type"]
+    assert first["name"] is second["name"]
+    assert first["default"] is second["default"]
+
+
 def test_parse_methods_succeeds():
     # Arrange
     methods = ET.fromstring("""
@@ -527,3 +582,205 @@ def test_parse_class_succeds():
     assert result["enums"][0]["name"] == "StateMachine"
     assert len(result["theme_items"]) == 1
     assert result["theme_items"][0]["name"] == "font_color"
+
+
+def test_create_indexes_classes():
+    # Arrange
+    docs: list[XMLDoc] = [
+        ET.ElementTree(ET.fromstring(f"""
+            <class name="{name}" inherits="{inherits}">
+              <brief_description>Brief.</brief_description>
+              <description>Description.</description>
+            </class>
+        """))
+        for name, inherits in [("C", "B"), ("B", "A"), ("A", "")]
+    ]
+
+    # Act
+    ctx = create(docs)
+
+    # Assert
+    assert ctx["index"].get("B") is docs[1].getroot()
+    assert ctx["classes"][0]["inheritage"] == ["B", "A"]
+    assert ctx["classes"][2]["inheritage"] == []
+    assert ctx["hierarchy"] == {"C": ["B", "A"], "B": ["A"], "A": []}
+    assert "A" in ctx["symbols"]
+
+
+def test_create_compact_translates_records():
+    # Arrange
+    docs = make_translation_docs()
+
+    # Act
+    ctx = translate(create(docs, compact=True),
+                    BBCodeInterpreter(), RSTSyntaxTranslator())
+
+    # Assert
+    assert isinstance(ctx["classes"][0], ClassRecord)
+    assert ctx["classes"] == translate(
+        create(docs), BBCodeInterpreter(), RSTSyntaxTranslator())["classes"]
+
+
+def make_reference_docs() -> list[XMLDoc]:
+    return [
+        ET.ElementTree(ET.fromstring(f"""
+            <class name="{name}" inherits="{inherits}">
+              <brief_description>See [member size] and [method grow].</brief_description>
+              <description>Description of [{name}] and [Node2D].</description>
+              <members>
+                {members}
+              </members>
+            </class>
+        """))
+        for name, inherits, members in [
+            ("A", "", '<member name="size" type="int" default="0">Size.</member>'),
+            ("B", "A", ''),
+            ("C", "", ''),
+            ("D", "Node2D", ''),
+        ]
+    ]
+
+
+def test_translate_finds_broken_references():
+    # Arrange
+    translator = RSTSyntaxTranslator()
+
+    # Act
+    translate(create(make_reference_docs()), BBCodeInterpreter(),
+              translator, check_references=True)
+
+    # Assert
+    assert translator.broken == [
+        {"scope": "A", "kind": "method", "name": "grow"},
+        {"scope": "B", "kind": "method", "name": "grow"},
+        {"scope": "C", "kind": "member", "name": "size"},
+        {"scope": "C", "kind": "method", "name": "grow"},
+    ]
+
+
+def test_translate_checks_references_only_when_asked():
+    # Arrange
+    translator = RSTSyntaxTranslator()
+
+    # Act
+    translate(create(make_reference_docs()), BBCodeInterpreter(), translator)
+
+    # Assert
+    assert translator.broken == []
+
+
+def test_translate_with_executor_finds_broken_references():
+    # Arrange
+    translator = RSTSyntaxTranslator()
+
+    # Act
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        translate(create(make_reference_docs()), BBCodeInterpreter(),
+                  translator, executor=executor, check_references=True)
+
+    # Assert
+    assert sorted(b["scope"] + b["name"] for b in translator.broken) == [
+        "Agrow", "Bgrow", "Cgrow", "Csize"]
+
+
+def test_translate_uses_cache():
+    # Arrange
+    docs: list[XMLDoc] = [
+        ET.ElementTree(ET.fromstring(f"""
+            <class name="{name}">
+              <brief_description>[b]Brief.[/b]</brief_description>
+              <description>Description.</description>
+            </class>
+        """))
+        for name in ["A", "B"]
+    ]
+    cache = TranslationCache()
+
+    # Act
+    ctx = translate(create(docs), BBCodeInterpreter(),
+                    RSTSyntaxTranslator(), cache)
+
+    # Assert
+    assert ctx["classes"][1]["brief_description"] == "**Brief.**"
+    assert cache.info()["hits"] == 2
+    assert cache.info()["misses"] == 2
+
+
+def test_stream_yields_same_classes_as_create(tmp_path: Path):
+    # Arrange
+    for name, inherits in [("C", "B"), ("B", "A"), ("A", "")]:
+        (tmp_path / f"{name}.xml").write_text(f"""
+            <class name="{name}" inherits="{inherits}">
+              <brief_description>Brief {name}.</brief_description>
+              <description>Description {name}.</description>
+              <members>
+                <member name="value" type="int" default="0">
+                  A value.
+                </member>
+              </members>
+            </class>
+        """)
+
+    # Act
+    classes = list(stream(tmp_path))
+
+    # Assert
+    assert classes == create(parse(tmp_path))["classes"]
+    assert classes[2]["inheritage"] == ["B", "A"]
+
+
+def make_translation_docs() -> list[XMLDoc]:
+    return [
+        ET.ElementTree(ET.fromstring(f"""
+            <class name="Class{i}">
+              <brief_description>[b]Brief {i}.[/b]</brief_description>
+              <description>Uses [Class{i + 1}].</description>
+            </class>
+        """))
+        for i in range(10)
+    ]
+
+
+def test_translate_with_jobs_keeps_order():
+    # Arrange
+    ctx = create(make_translation_docs())
+
+    # Act
+    ctx = translate(ctx, BBCodeInterpreter, RSTSyntaxTranslator, jobs=2)
+
+    # Assert
+    assert [c["brief_description"] for c in ctx["classes"]] == [
+        f"**Brief {i}.**" for i in range(10)]
+
+
+def test_translate_with_executor_matches_serial():
+    # Arrange
+    expected = translate(
+        create(make_translation_docs()), BBCodeInterpreter(), RSTSyntaxTranslator())
+
+    # Act
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        ctx = translate(
+            create(make_translation_docs()),
+            BBCodeInterpreter(),
+            RSTSyntaxTranslator(),
+            executor=executor,
+        )
+
+    # Assert
+    assert ctx["classes"] == expected["classes"]
+
+
+def test_translate_with_unpicklable_translator_runs_serially():
+    # Arrange
+    class LocalTranslator(RSTSyntaxTranslator):
+        pass
+
+    ctx = create(make_translation_docs())
+
+    # Act
+    ctx = translate(ctx, BBCodeInterpreter(), LocalTranslator(), jobs=2)
+
+    # Assert
+    assert ctx["classes"][0]["description"] == \
+        "Uses :ref:`Class1 <Class1>`."
@@ -0,0 +1,170 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from godocs.parser import ParseCache, context_creator, xml_parser
+
+
+def write_class(path: Path, name: str, inherits: str = '', brief: str = "Brief."):
+    (path / f"{name}.xml").write_text(f"""
+        <class name="{name}" inherits="{inherits}">
+          <brief_description>{brief}</brief_description>
+          <description>Description of [b]{name}[/b].</description>
+          <members>
+            <member name="size" type="int" default="0">The size.</member>
+          </members>
+        </class>
+    """)
+
+
+def test_parse_cache_creates_same_context(tmp_path: Path):
+    # Arrange
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    write_class(docs_dir, "A")
+    write_class(docs_dir, "B", "A")
+
+    cache = ParseCache(tmp_path / "cache")
+
+    expected = context_creator.create(xml_parser.parse(docs_dir))
+
+    # Act
+    ctx = cache.create(docs_dir)
+
+    # Assert
+    assert ctx["classes"] == expected["classes"]
+    assert ctx["hierarchy"] == expected["hierarchy"]
+    assert cache.stats == {"files": 2, "hashed": 2, "parsed": 2, "removed": 0}
+
+
+def test_parse_cache_skips_parsing_unchanged_files(tmp_path: Path):
+    # Arrange
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    write_class(docs_dir, "A")
+    write_class(docs_dir, "B", "A")
+
+    expected = ParseCache(tmp_path / "cache").create(docs_dir)
+
+    cache = ParseCache(tmp_path / "cache")
+
+    # Act
+    ctx = cache.create(docs_dir)
+
+    # Assert
+    assert ctx["classes"] == expected["classes"]
+    assert cache.stats == {"files": 2, "hashed": 0, "parsed": 0, "removed": 0}
+
+
+def test_parse_cache_hashes_touched_files(tmp_path: Path):
+    # Arrange
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    write_class(docs_dir, "A")
+
+    ParseCache(tmp_path / "cache").create(docs_dir)
+
+    os.utime(docs_dir / "A.xml", ns=(0, 0))
+
+    cache = ParseCache(tmp_path / "cache")
+
+    # Act
+    cache.create(docs_dir)
+
+    # Assert
+    assert cache.stats == {"files": 1, "hashed": 1, "parsed": 0, "removed": 0}
+
+
+def test_parse_cache_updates_inheritage_of_descendants(tmp_path: Path):
+    # Arrange
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    write_class(docs_dir, "A")
+    write_class(docs_dir, "B", "A")
+
+    ParseCache(tmp_path / "cache").create(docs_dir)
+
+    write_class(docs_dir, "A", "Object", "Changed.")
+    (docs_dir / "A.xml").touch()
+
+    cache = ParseCache(tmp_path / "cache")
+
+    # Act
+    ctx = cache.create(docs_dir)
+
+    # Assert
+    assert cache.stats["parsed"] == 1
+    assert ctx["classes"][1]["inheritage"] == ["A", "Object"]
+
+
+def test_parse_cache_returns_independent_records(tmp_path: Path):
+    # Arrange
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    write_class(docs_dir, "A")
+
+    cache = ParseCache(tmp_path / "cache")
+
+    cache.create(docs_dir)
+
+    # Act
+    first = cache.create(docs_dir)
+    first["classes"][0]["description"] = "Translated."
+
+    second = cache.create(docs_dir)
+
+    # Assert
+    assert second["classes"][0]["description"] == "Description of [b]A[/b]."
+
+
+def test_parse_cache_discards_other_signatures(tmp_path: Path):
+    # Arrange
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    write_class(docs_dir, "A")
+
+    cache = ParseCache(tmp_path / "cache")
+
+    cache.create(docs_dir)
+
+    # Act
+    cache.load("other")
+
+    # Assert
+    assert cache.entries == {}
+
+
+@pytest.mark.parametrize("content", [
+    b"\xff\xfe not utf-8",
+    b"[1, 2, 3]",
+    b'{"version": 2, "signature": "sig", "entries": []}',
+    b'{"version": 2, "signature": "sig", "entries": {"A.xml": {"size": 1}}}',
+])
+def test_parse_cache_discards_malformed_files(tmp_path: Path, content: bytes):
+    # Arrange
+    (tmp_path / ParseCache.FILE_NAME).write_bytes(content)
+
+    cache = ParseCache(tmp_path)
+
+    # Act
+    cache.load("sig")
+
+    # Assert
+    assert cache.entries == {}
+
+
+def test_parse_cache_stores_data_only(tmp_path: Path):
+    # Arrange
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    write_class(docs_dir, "A")
+
+    # Act
+    ParseCache(tmp_path / "cache").create(docs_dir)
+
+    # Assert
+    data = json.loads((tmp_path / "cache" / ParseCache.FILE_NAME).read_text())
+
+    assert json.loads(next(iter(data["entries"].values()))["record"])["name"] == "A"
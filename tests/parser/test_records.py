@@ -0,0 +1,117 @@
+import pickle
+import sys
+
+import pytest
+
+from godocs.parser.records import (
+    ClassRecord,
+    EnumRecord,
+    PropertyRecord,
+    compact,
+)
+
+
+def make_class() -> dict:
+    return {
+        "name": "Node",
+        "inheritage": ["Object"],
+        "brief_description": "Brief.",
+        "description": "Description.",
+        "properties": [
+            {"name": "name", "type": "StringName", "default": '', "description": "Name."},
+        ],
+        "methods": [
+            {
+                "name": "add_child",
+                "type": "void",
+                "args": [{"name": "node", "type": "Node", "default": '', "description": ''}],
+                "description": "Adds a child.",
+            },
+        ],
+        "signals": [
+            {"name": "ready", "args": [], "description": "Emitted when ready."},
+        ],
+        "constants": [
+            {"name": "NOTIFICATION_READY", "value": "13", "description": "Ready."},
+        ],
+        "enums": [
+            {
+                "name": "ProcessMode",
+                "values": [{"name": "PROCESS_MODE_INHERIT", "value": "0", "description": "Inherits."}],
+                "description": '',
+            },
+        ],
+        "theme_items": [
+            {"name": "font", "data_type": "font", "type": "Font", "default": '', "description": "Font."},
+        ],
+    }
+
+
+def test_compact_converts_class_and_members():
+    # Arrange
+    class_doc = make_class()
+
+    # Act
+    result = compact(class_doc)
+
+    # Assert
+    assert isinstance(result, ClassRecord)
+    assert isinstance(result.methods[0].args[0], PropertyRecord)
+    assert isinstance(result.enums[0], EnumRecord)
+    assert result.enums[0].values[0].name == "PROCESS_MODE_INHERIT"
+    assert result == class_doc
+
+
+def test_record_implements_mapping_interface():
+    # Arrange
+    record = PropertyRecord("size", "int", "0", "Size.")
+
+    # Act
+    record["description"] = "The size."
+
+    # Assert
+    assert record["description"] == record.description == "The size."
+    assert list(record) == ["name", "type", "default", "description"]
+    assert len(record) == 4
+    assert "type" in record
+    assert "setter" not in record
+    assert record.get("setter") is None
+    assert dict(record) == {
+        "name": "size", "type": "int", "default": "0", "description": "The size."}
+
+
+def test_record_rejects_unknown_and_removed_keys():
+    # Arrange
+    record = PropertyRecord("size", "int", "0", "Size.")
+
+    # Act / Assert
+    with pytest.raises(KeyError):
+        record["setter"]
+    with pytest.raises(KeyError):
+        record["setter"] = "set_size"
+    with pytest.raises(TypeError):
+        del record["name"]
+
+
+def test_record_is_smaller_than_dict():
+    # Arrange
+    values = {"name": "size", "type": "int", "default": "0", "description": "Size."}
+
+    # Act
+    record = PropertyRecord(**values)
+
+    # Assert
+    assert not hasattr(record, "__dict__")
+    assert sys.getsizeof(record) < sys.getsizeof(values)
+
+
+def test_record_can_be_pickled():
+    # Arrange
+    record = compact(make_class())
+
+    # Act
+    result = pickle.loads(pickle.dumps(record))
+
+    # Assert
+    assert isinstance(result, ClassRecord)
+    assert result == record
@@ -0,0 +1,114 @@
+from godocs.parser import SymbolTable
+from godocs.parser.context_creator import Class
+
+
+def make_class(name: str, inheritage: list[str] | None = None) -> Class:
+    return {
+        "name": name,
+        "inheritage": inheritage or [],
+        "brief_description": '',
+        "description": '',
+        "properties": [],
+        "methods": [],
+        "signals": [],
+        "constants": [],
+        "enums": [],
+        "theme_items": [],
+    }
+
+
+def make_classes() -> list[Class]:
+    node = make_class("Node", ["Object"])
+    node["properties"] = [
+        {"name": "name", "type": "StringName", "default": '', "description": ''}]
+    node["methods"] = [
+        {"name": "get_parent", "type": "Node", "args": [], "description": ''}]
+    node["enums"] = [{
+        "name": "ProcessMode",
+        "values": [{"name": "PROCESS_MODE_INHERIT", "value": "0", "description": ''}],
+        "description": '',
+    }]
+
+    object = make_class("Object")
+    object["signals"] = [{"name": "script_changed", "args": [], "description": ''}]
+
+    scope = make_class("@GlobalScope")
+    scope["constants"] = [{"name": "OK", "value": "0", "description": ''}]
+
+    return [node, object, scope, make_class("Node2D", ["Node", "Object"])]
+
+
+def test_symbol_table_indexes_symbols():
+    # Act
+    symbols = SymbolTable(make_classes())
+
+    # Assert
+    assert len(symbols) == 10
+    assert "Node.name" in symbols
+    assert symbols.get("member", "Node.name") == {
+        "kind": "member", "class_name": "Node", "enum": '', "name": "name"}
+    assert symbols.get("constant", "Node.PROCESS_MODE_INHERIT") == {
+        "kind": "constant",
+        "class_name": "Node",
+        "enum": "ProcessMode",
+        "name": "PROCESS_MODE_INHERIT",
+    }
+    assert symbols.get("method", "Node.name") is None
+
+
+def test_symbol_table_resolves_qualified_names():
+    # Arrange
+    symbols = SymbolTable(make_classes())
+
+    # Act
+    class_symbol = symbols.resolve("class", "Node2D", "Object")
+    enum = symbols.resolve("enum", "Node.ProcessMode", "Object")
+    missing = symbols.resolve("class", "Sprite2D", "Object")
+
+    # Assert
+    assert class_symbol is not None and class_symbol["class_name"] == "Node2D"
+    assert enum is not None and enum["name"] == "ProcessMode"
+    assert missing is None
+
+
+def test_symbol_table_resolves_names_in_scope():
+    # Arrange
+    symbols = SymbolTable(make_classes())
+
+    # Act
+    own = symbols.resolve("method", "get_parent", "Node")
+    inherited = symbols.resolve("member", "name", "Node2D")
+    qualified_inherited = symbols.resolve("signal", "Node2D.script_changed")
+    global_constant = symbols.resolve("constant", "OK", "Node2D")
+    missing = symbols.resolve("member", "get_parent", "Node")
+
+    # Assert
+    assert own is not None and own["class_name"] == "Node"
+    assert inherited is not None and inherited["class_name"] == "Node"
+    assert qualified_inherited is not None and qualified_inherited["class_name"] == "Object"
+    assert global_constant is not None and global_constant["class_name"] == "@GlobalScope"
+    assert missing is None
+
+
+def test_symbol_table_ignores_unknown_kinds():
+    # Arrange
+    symbols = SymbolTable(make_classes())
+
+    # Act
+    result = symbols.resolve("operator", "Node.get_parent", "Node")
+
+    # Assert
+    assert result is None
+
+
+def test_symbol_table_knows_which_references_are_documented():
+    # Arrange
+    symbols = SymbolTable([*make_classes(), make_class("MyNode", ["Sprite2D", "Node2D"])])
+
+    # Act / Assert
+    assert symbols.is_documented("member", "missing", "Node2D")
+    assert symbols.is_documented("method", "Node.missing", "MyNode")
+    assert not symbols.is_documented("class", "Missing")
+    assert not symbols.is_documented("member", "position", "MyNode")
+    assert not symbols.is_documented("method", "Sprite2D.missing", "Node")
+    assert not symbols.is_documented("operator", "Node.missing")
@@ -1,8 +1,16 @@
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import xml.etree.ElementTree as ET
 
-from godocs.parser.xml_parser import parse_file, parse_folder, parse
+from godocs.parser.xml_parser import (
+    parse_file,
+    parse_folder,
+    parse,
+    stream_file,
+    parse_header,
+    get_files,
+)
 
 
 def test_parse_file_valid_xml(tmp_path: Path):
@@ -92,3 +100,100 @@ def test_parse_with_folder(tmp_path: Path):
     assert isinstance(trees, list)
     assert len(trees) == 1
     assert trees[0].getroot().tag == "root"
+
+
+def test_parse_folder_sorts_files(tmp_path: Path):
+    # Arrange
+    for name in ["c", "a", "b"]:
+        (tmp_path / f"{name}.xml").write_text(f'<class name="{name}"/>')
+
+    # Act
+    trees = parse_folder(tmp_path)
+
+    # Assert
+    assert [t.getroot().attrib["name"] for t in trees] == ["a", "b", "c"]
+
+
+def test_parse_folder_with_jobs_keeps_order(tmp_path: Path):
+    # Arrange
+    names = [f"Class{i:02}" for i in range(20)]
+
+    for name in reversed(names):
+        (tmp_path / f"{name}.xml").write_text(f'<class name="{name}"/>')
+
+    # Act
+    trees = parse_folder(tmp_path, jobs=2)
+
+    # Assert
+    assert [t.getroot().attrib["name"] for t in trees] == names
+
+
+def test_parse_folder_with_executor(tmp_path: Path):
+    # Arrange
+    xml1 = tmp_path / "a.xml"
+    xml2 = tmp_path / "b.xml"
+
+    xml1.write_text("<root><child>A</child></root>")
+    xml2.write_text("<root><child>B</child></root>")
+
+    # Act
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        trees = parse(tmp_path, executor=executor)
+
+    # Assert
+    assert [t.getroot().find("child").text for t in trees] == [  # type: ignore
+        "A", "B"]
+
+
+def test_stream_file_yields_root_then_children(tmp_path: Path):
+    # Arrange
+    file = tmp_path / "test.xml"
+    file.write_text('<root name="A"><first>1</first><second><child/></second></root>')
+
+    # Act
+    nodes = list(stream_file(file))
+
+    # Assert
+    assert [node.tag for node in nodes] == ["root", "first", "second"]
+    assert nodes[0].attrib["name"] == "A"
+    assert len(nodes[0]) == 0
+
+
+def test_stream_file_keeps_children_until_next(tmp_path: Path):
+    # Arrange
+    file = tmp_path / "test.xml"
+    file.write_text("<root><first><child>1</child></first><second/></root>")
+
+    nodes = stream_file(file)
+    next(nodes)
+
+    # Act
+    first = next(nodes)
+
+    # Assert
+    assert first.find("child").text == "1"  # type: ignore
+
+
+def test_parse_header_reads_root_attributes(tmp_path: Path):
+    # Arrange
+    file = tmp_path / "test.xml"
+    file.write_text('<class name="B" inherits="A"><child/></class>')
+
+    # Act
+    header = parse_header(file)
+
+    # Assert
+    assert header == {"name": "B", "inherits": "A"}
+
+
+def test_get_files_sorts_folder(tmp_path: Path):
+    # Arrange
+    (tmp_path / "b.xml").write_text("<root/>")
+    (tmp_path / "a.xml").write_text("<root/>")
+    (tmp_path / "c.txt").write_text("Not XML")
+
+    # Act
+    files = get_files(tmp_path)
+
+    # Assert
+    assert files == [tmp_path / "a.xml", tmp_path / "b.xml"]
@@ -0,0 +1,197 @@
+import os
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+
+import pytest
+
+from godocs.plugin import LazyPlugin, PluginRegistry, load
+from godocs.plugin.loader import PluginEntry, get_cache_path, get_commands
+
+
+PLUGIN_SOURCE = """
+from godocs.plugin import Plugin
+
+
+class ExamplePlugin(Plugin):
+
+    def register(self, app):
+        subparsers = app.parser.add_subparsers()
+        command = subparsers.add_parser("example")
+        command.add_subparsers().add_parser("nested")
+"""
+
+
+class FakeApp:
+
+    def __init__(self):
+        self.parser = ArgumentParser()
+
+
+def make_site(path: Path, module: str) -> Path:
+    site = path / "site"
+    info = site / "example_plugin-1.0.dist-info"
+    info.mkdir(parents=True)
+
+    (info / "METADATA").write_text("Metadata-Version: 2.1\nName: example-plugin\nVersion: 1.0\n")
+    (info / "entry_points.txt").write_text(
+        f"[godocs.plugins]\nexample = {module}:ExamplePlugin\n")
+    (site / f"{module}.py").write_text(PLUGIN_SOURCE)
+
+    return site
+
+
+def make_plugin(commands: list[list[str]] | None) -> LazyPlugin:
+    entry: PluginEntry = {"name": "example", "value": "module:Plugin", "commands": commands}
+
+    return LazyPlugin(entry, PluginRegistry())
+
+
+def test_plugin_registry_discovers_and_caches_entry_points(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    # Arrange
+    monkeypatch.syspath_prepend(str(make_site(tmp_path, "cached_plugin")))
+
+    registry = PluginRegistry(tmp_path / "plugins.json")
+
+    # Act
+    entries = registry.discover()
+
+    # Assert
+    assert entries == [{
+        "name": "example", "value": "cached_plugin:ExamplePlugin", "commands": None}]
+    assert PluginRegistry(tmp_path / "plugins.json").load() is True
+
+
+def test_plugin_registry_is_invalidated_by_changes_in_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    # Arrange
+    site = make_site(tmp_path, "changed_plugin")
+    monkeypatch.syspath_prepend(str(site))
+
+    PluginRegistry(tmp_path / "plugins.json").discover()
+
+    # Simulates installing another distribution.
+    stat = site.stat()
+    os.utime(site, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    # Act
+    loaded = PluginRegistry(tmp_path / "plugins.json").load()
+
+    # Assert
+    assert loaded is False
+
+
+def test_lazy_plugin_imports_module_when_registered(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    # Arrange
+    monkeypatch.syspath_prepend(str(make_site(tmp_path, "lazy_plugin")))
+    monkeypatch.delitem(sys.modules, "lazy_plugin", raising=False)
+
+    registry = PluginRegistry(tmp_path / "plugins.json")
+
+    [plugin] = load(registry)
+
+    imported = "lazy_plugin" in sys.modules
+
+    # Act
+    plugin.register(FakeApp())  # type: ignore
+
+    # Assert
+    assert imported is False
+    assert "lazy_plugin" in sys.modules
+    assert plugin.entry["commands"] == [["example"]]
+    assert PluginRegistry(tmp_path / "plugins.json").discover()[0]["commands"] == [["example"]]
+
+    monkeypatch.delitem(sys.modules, "lazy_plugin")
+
+
+def test_lazy_plugin_is_needed_by_its_commands():
+    # Arrange
+    plugin = make_plugin([["construct", "jinja"]])
+
+    # Act
+    needed = {
+        "root": plugin.is_needed([]),
+        "construct": plugin.is_needed(["construct"]),
+        "jinja": plugin.is_needed(["construct", "jinja", "in", "out"]),
+        "other": plugin.is_needed(["construct", "other", "in", "out"]),
+        "serve": plugin.is_needed(["serve"]),
+    }
+
+    # Assert
+    assert needed == {
+        "root": False,
+        "construct": True,
+        "jinja": True,
+        "other": False,
+        "serve": False,
+    }
+
+
+def test_lazy_plugin_is_needed_without_known_commands():
+    # Arrange
+    unknown = make_plugin(None)
+    commandless = make_plugin([])
+
+    # Act
+    needed = (unknown.is_needed(["serve"]), commandless.is_needed(["serve"]))
+
+    # Assert
+    assert needed == (True, True)
+
+
+def test_get_commands_finds_nested_subcommands():
+    # Arrange
+    parser = ArgumentParser()
+    construct = parser.add_subparsers().add_parser("construct")
+    construct.add_subparsers().add_parser("jinja")
+
+    # Act
+    commands = get_commands(parser)
+
+    # Assert
+    assert commands == {("construct",), ("construct", "jinja")}
+
+
+def test_get_cache_path_uses_xdg_cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    # Arrange
+    monkeypatch.delenv("GODOCS_CACHE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(sys, "platform", "linux")
+
+    # Act
+    path = get_cache_path()
+
+    # Assert
+    assert path is not None
+    assert path.parent == tmp_path / "godocs"
+
+
+def test_get_cache_path_ignores_relative_xdg_cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    # Arrange
+    monkeypatch.delenv("GODOCS_CACHE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", "cache")
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(sys, "platform", "linux")
+
+    # Act
+    path = get_cache_path()
+
+    # Assert
+    assert path is not None
+    assert path.parent == tmp_path / ".cache" / "godocs"
+
+
+def test_plugin_registry_tolerates_unwritable_cache(tmp_path: Path):
+    # Arrange
+    # A file where the cache directory should be can't be written to,
+    # even by privileged users.
+    (tmp_path / "cache").write_text("")
+
+    registry = PluginRegistry(tmp_path / "cache" / "godocs" / "plugins.json")
+    registry.entries = [{"name": "example", "value": "module:Plugin", "commands": None}]
+
+    # Act
+    registry.save()
+
+    # Assert
+    assert registry.load("") is False
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["cache"]
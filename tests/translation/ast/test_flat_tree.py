@@ -0,0 +1,66 @@
+from godocs.translation.ast import FlatTree, TagNode, TextNode
+
+
+def test_flat_tree_adapts_nodes_back_and_forth():
+    # Arrange
+    root = TagNode("root", [
+        TextNode("Start "),
+        TagNode("bold", [TextNode("Bold "), TagNode("italic", [TextNode("Both")])]),
+        TagNode("reference", None, {"type": "class", "name": "Node"}),
+        TagNode("newline"),
+    ])
+
+    # Act
+    tree = FlatTree.from_node(root)
+
+    # Assert
+    assert len(tree) == 8
+    assert str(tree.to_node()) == str(root)
+
+
+def test_flat_tree_interns_names_and_params():
+    # Arrange
+    tree = FlatTree()
+
+    root = tree.add_tag("root")
+
+    # Act
+    first = tree.add_tag("reference", {"type": "class", "name": "Node"}, root)
+    second = tree.add_tag("reference", {"type": "class", "name": "Node"}, root)
+
+    # Assert
+    assert tree.values[first] == tree.values[second]
+    assert tree.get_params(first) is tree.get_params(second)
+    assert tree.tables.strings == ["root", "reference"]
+
+
+def test_flat_tree_text_nodes_reference_spans_of_the_source():
+    # Arrange
+    tree = FlatTree("Hello, World!")
+
+    root = tree.add_tag("root")
+
+    # Act
+    text = tree.add_text(7, 12, root)
+
+    # Assert
+    assert tree.get_text(text) == "World"
+    assert tree.tables.strings == ["root"]
+    assert list(tree.get_children(root)) == [text]
+
+
+def test_flat_tree_unwrap_moves_children_after_the_node():
+    # Arrange
+    tree = FlatTree("abc")
+
+    root = tree.add_tag("root")
+    tag = tree.add_tag("tag", None, root)
+    tree.add_text(0, 1, tag)
+    tree.add_text(1, 2, tag)
+
+    # Act
+    tree.unwrap(tag)
+    tree.add_text(2, 3, root)
+
+    # Assert
+    assert str(tree) == '<root\n\t<tag>,\n\t"a",\n\t"b",\n\t"c"\n>'
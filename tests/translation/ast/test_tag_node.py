@@ -0,0 +1,80 @@
+import pytest
+
+from godocs.translation.ast import TagNode, TextNode
+
+
+def test_tag_node_has_no_dict():
+    # Arrange
+    node = TagNode("bold", [TextNode("text")])
+
+    # Assert
+    assert not hasattr(node, "__dict__")
+    assert not hasattr(node.children[0], "__dict__")
+
+
+def test_tag_node_children_and_params_can_be_changed_in_place():
+    # Arrange
+    first = TagNode("bold")
+    second = TagNode("bold")
+
+    # Act
+    first.children.append(TextNode("text"))
+    first.params["x"] = "y"
+
+    # Assert
+    assert str(first) == '<bold x=y\n\t"text"\n>'
+    assert len(second.children) == 0
+    assert len(second.params) == 0
+
+
+def test_tag_node_append_copies_shared_children():
+    # Arrange
+    first = TagNode("bold")
+    second = TagNode("bold")
+
+    # Act
+    first.append(TextNode("text"))
+
+    # Assert
+    assert str(first) == '<bold\n\t"text"\n>'
+    assert len(second.children) == 0
+
+
+def test_tag_node_set_param_copies_shared_params():
+    # Arrange
+    first = TagNode("link")
+    second = TagNode("link")
+
+    # Act
+    first.set_param("url", "https://github.com")
+
+    # Assert
+    assert first.params == {"url": "https://github.com"}
+    assert len(second.params) == 0
+
+
+def test_tag_node_freeze_makes_tree_read_only():
+    # Arrange
+    inner = TagNode("italic", [TextNode("text")], {"a": "b"})
+    root = TagNode("root", [inner, TagNode("newline", [])])
+
+    # Act
+    root.freeze()
+
+    # Assert
+    assert isinstance(root.children, tuple)
+    assert isinstance(inner.children, tuple)
+    assert root.children[1].children is TagNode("other").freeze().children  # type: ignore
+    with pytest.raises(TypeError):
+        inner.params["a"] = "c"  # type: ignore
+
+
+def test_tag_node_append_after_freeze():
+    # Arrange
+    root = TagNode("root", [TextNode("a")]).freeze()
+
+    # Act
+    root.append(TextNode("b"))
+
+    # Assert
+    assert [str(child) for child in root.children] == ['"a"', '"b"']
@@ -0,0 +1,38 @@
+from godocs.translation.ast import TextNode
+
+
+def test_text_node_from_span_copies_content_lazily():
+    # Arrange
+    source = "Hello, World!"
+
+    # Act
+    node = TextNode.from_span(source, 7, 12)
+
+    # Assert
+    assert node.source is source
+    assert node.content == "World"
+    assert node.source == "World"
+    assert (node.start, node.end) == (0, 5)
+
+
+def test_text_node_from_span_of_whole_source_shares_it():
+    # Arrange
+    source = "Hello, World!"
+
+    # Act
+    node = TextNode.from_span(source, 0, len(source))
+
+    # Assert
+    assert node.content is source
+
+
+def test_text_node_content_can_be_replaced():
+    # Arrange
+    node = TextNode.from_span("Hello, World!", 0, 5)
+
+    # Act
+    node.content = "Bye"
+
+    # Assert
+    assert str(node) == '"Bye"'
+    assert (node.source, node.start, node.end) == ("Bye", 0, 3)
@@ -703,3 +703,24 @@ def test_bbcode_interpreter_interpret_understands_nested_tags():
 			>
 		>
 	""").strip()
+
+
+def test_bbcode_interpreter_interpret_keeps_texts_as_spans():
+    # Arrange
+    text = "Start [b]Bold [i]Italic[/i][/b] [code]code[/code]"
+
+    interpreter = Interpreter()
+
+    # Act
+    ast = interpreter.interpret(text)
+
+    # Assert
+    start = ast.children[0]
+    bold = ast.children[1]
+    italic = bold.children[1]  # type: ignore
+    code = ast.children[3]
+
+    assert start.source is text  # type: ignore
+    assert italic.children[0].source is text  # type: ignore
+    assert code.children[0].source is text  # type: ignore
+    assert italic.children[0].content == "Italic"  # type: ignore
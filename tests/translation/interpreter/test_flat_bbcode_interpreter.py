@@ -0,0 +1,106 @@
+import pytest
+
+from godocs.translation.ast.flat_tree import NONE
+from godocs.translation.interpreter import TokenBBCodeInterpreter
+from godocs.translation.interpreter import FlatBBCodeInterpreter as Interpreter
+from godocs.translation.translator import RSTSyntaxTranslator
+
+
+TEXTS = [
+    "",
+    "Hello, World!",
+    "[b]Hello, World![/b]",
+    "Start Text [b]Bold[/b] [i]Italic[/i] End Text",
+    "[b]Wrapper [i]Inner Wrapper [u]Inner Text[/u] Text[/i] Text[/b]",
+    "[b][/b]",
+    "Emitted when the [Node] enters the [SceneTree].",
+    "Returns the [member position] of the [method get_node] result.",
+    "Multiplies by [operator Color.operator *] as [param value].",
+    "Break[br]Line [lb]not a tag[rb]",
+    "[url]https://github.com/nadjiel[/url] and [url=https://godotengine.org]Godot[/url]",
+    "[color=red]Red [b]bold[/b][/color] [font=res://mono.ttf]Mono[/font]",
+    "[img width=32]res://icon.svg[/img][center]Centered[/center]",
+    "Press [kbd]Ctrl + [b]C[/b][/kbd] to copy.",
+    '[code]var a = [1, 2][/code] and [code]print("[b]")[/code]',
+    "[codeblock lang=gdscript]\nfunc _ready():\n    print([1, [2]])\n[/codeblock]",
+    "Unclosed [code] tag and [b]bold[/b].",
+    "Stray [/b] closing tag and [i]italic[/i] [/i].",
+    "[b]Bold with [Color] reference and [lb] bracket[/b] after.",
+    "[i][b]Crossed[/i] tags[/b]",
+    "[b]Unclosed [param value] and [i]italic[/i] text",
+    "Array access like array[0] and [[b]double[/b]]",
+    "[b]a [b]c[/b] d[/b]",
+    "[color=red]x [color=blue]y[/color] z[/color]",
+    "[i][kbd][url=http://a]] [/i][kbd][/kbd]",
+    "[u]Closed [b]too[/u] early[/b][/u]",
+]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_flat_bbcode_interpreter_matches_token_bbcode_interpreter(text: str):
+    # Arrange
+    interpreter = Interpreter()
+    reference = TokenBBCodeInterpreter()
+
+    # Act
+    ast = interpreter.interpret(text)
+
+    # Assert
+    assert str(ast) == str(reference.interpret(text))
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_flat_bbcode_interpreter_translates_like_nodes(text: str):
+    # Arrange
+    interpreter = Interpreter()
+    translator = RSTSyntaxTranslator()
+
+    # Act
+    result = interpreter.translate(text, translator)
+
+    # Assert
+    assert result == TokenBBCodeInterpreter().interpret(text).translate(translator)
+
+
+def test_flat_bbcode_interpreter_stores_texts_as_spans():
+    # Arrange
+    text = "Emitted when the [Node] enters the [SceneTree]."
+
+    interpreter = Interpreter()
+
+    # Act
+    tree = interpreter.interpret_flat(text)
+
+    # Assert
+    assert tree.source is text
+    assert "Emitted when the " not in tree.tables.strings
+    assert tree.get_text(1) == "Emitted when the "
+
+
+def test_flat_bbcode_interpreter_handles_deep_nesting():
+    # Arrange
+    depth = 2000
+
+    # Elements only nest inside ones with other names, as each one ends
+    # at the first closing tag with its name.
+    text = (
+        "".join(f"[tag{i}]" for i in range(depth))
+        + "Deep"
+        + "".join(f"[/tag{i}]" for i in reversed(range(depth)))
+    )
+
+    interpreter = Interpreter()
+
+    # Act
+    tree = interpreter.interpret_flat(text)
+
+    # Assert
+    index = len(tree) - 1
+    ancestors: list[str] = []
+
+    while tree.parents[index] != NONE:
+        index = tree.parents[index]
+        ancestors.append(tree.get_name(index))
+
+    assert tree.get_text(len(tree) - 1) == "Deep"
+    assert ancestors == [f"tag{i}" for i in reversed(range(depth))] + ["root"]
@@ -0,0 +1,104 @@
+from textwrap import dedent
+
+import pytest
+
+from godocs.translation.interpreter import BBCodeInterpreter
+from godocs.translation.interpreter import TokenBBCodeInterpreter as Interpreter
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "Hello, World!",
+    "[b]Hello, World![/b]",
+    "Start Text [b]Bold[/b] [i]Italic[/i] End Text",
+    "[b]Wrapper [i]Inner Wrapper [u]Inner Text[/u] Text[/i] Text[/b]",
+    "[b][/b]",
+    "Emitted when the [Node] enters the [SceneTree].",
+    "Returns the [member position] of the [method get_node] result.",
+    "Multiplies by [operator Color.operator *] as [param value].",
+    "Break[br]Line [lb]not a tag[rb]",
+    "[url]https://github.com/nadjiel[/url] and [url=https://godotengine.org]Godot[/url]",
+    "[color=red]Red [b]bold[/b][/color] [font=res://mono.ttf]Mono[/font]",
+    "[img width=32]res://icon.svg[/img][center]Centered[/center]",
+    "Press [kbd]Ctrl + [b]C[/b][/kbd] to copy.",
+    '[code]var a = [1, 2][/code] and [code]print("[b]")[/code]',
+    "[codeblock lang=gdscript]\nfunc _ready():\n    print([1, [2]])\n[/codeblock]",
+    "Unclosed [code] tag and [b]bold[/b].",
+    "Stray [/b] closing tag and [i]italic[/i] [/i].",
+    "[b]Bold with [Color] reference and [lb] bracket[/b] after.",
+    "[i][b]Crossed[/i] tags[/b]",
+    "Array access like array[0] and [[b]double[/b]]",
+    "[b]a [b]c[/b] d[/b]",
+    "[color=red]x [color=blue]y[/color] z[/color]",
+    "[i][kbd][url=http://a]] [/i][kbd][/kbd]",
+    "[b][i]Unclosed inside[/b] and [/i] outside",
+    "[u]Closed [b]too[/u] early[/b][/u]",
+    "[url][url=x]Nested[/url] link[/url]",
+    "[code][b][/code][/b] and [kbd][/kbd][kbd]",
+])
+def test_token_bbcode_interpreter_matches_bbcode_interpreter(text: str):
+    # Arrange
+    interpreter = Interpreter()
+    reference = BBCodeInterpreter()
+
+    # Act
+    ast = interpreter.interpret(text)
+
+    # Assert
+    assert str(ast) == str(reference.interpret(text))
+
+
+def test_token_bbcode_interpreter_interpret_understands_nested_tags():
+    # Arrange
+    text = "[b]Wrapper [i]Inner Wrapper [u]Inner Text[/u] Text[/i] Text[/b]"
+
+    interpreter = Interpreter()
+
+    # Act
+    ast = interpreter.interpret(text)
+
+    assert str(ast) == dedent("""
+		<root
+			<bold
+				"Wrapper ",
+				<italic
+					"Inner Wrapper ",
+					<underline
+						"Inner Text"
+					>,
+					" Text"
+				>,
+				" Text"
+			>
+		>
+	""").strip()
+
+
+def test_token_bbcode_interpreter_interpret_handles_deep_nesting():
+    # Arrange
+    depth = 2000
+
+    # Elements only nest inside ones with other names, as each one ends
+    # at the first closing tag with its name.
+    text = (
+        "".join(f"[tag{i}]" for i in range(depth))
+        + "[b]Deep[/b]"
+        + "".join(f"[/tag{i}]" for i in reversed(range(depth)))
+    )
+
+    interpreter = Interpreter()
+
+    # Act
+    ast = interpreter.interpret(text)
+
+    # Assert
+    node = ast.children[0]
+
+    for _ in range(depth):
+        node = node.children[0]  # type: ignore
+
+    assert str(node) == dedent("""
+		<bold
+			"Deep"
+		>
+	""").strip()
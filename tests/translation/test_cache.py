@@ -0,0 +1,75 @@
+from godocs.translation.cache import TranslationCache
+from godocs.translation.interpreter import BBCodeInterpreter
+from godocs.translation.translator import RSTSyntaxTranslator
+
+
+class CountingInterpreter(BBCodeInterpreter):
+
+    def __init__(self):
+        self.calls = 0
+
+    def interpret(self, text: str):
+        self.calls += 1
+
+        return super().interpret(text)
+
+
+def test_translation_cache_translates_text():
+    # Arrange
+    cache = TranslationCache()
+
+    # Act
+    result = cache.translate(
+        "[b]Bold[/b]", BBCodeInterpreter(), RSTSyntaxTranslator())
+
+    # Assert
+    assert result == "**Bold**"
+
+
+def test_translation_cache_reuses_results():
+    # Arrange
+    cache = TranslationCache()
+    interpreter = CountingInterpreter()
+    translator = RSTSyntaxTranslator()
+
+    # Act
+    cache.translate("[b]Bold[/b]", interpreter, translator)
+    cache.translate("[b]Bold[/b]", interpreter, translator)
+    cache.translate("[i]Italic[/i]", interpreter, translator)
+
+    # Assert
+    assert interpreter.calls == 2
+    assert cache.info() == {
+        "hits": 1, "misses": 2, "size": 2, "maxsize": 4096}
+
+
+def test_translation_cache_keys_on_translator():
+    # Arrange
+    cache = TranslationCache()
+    interpreter = CountingInterpreter()
+
+    # Act
+    cache.translate("Text", interpreter, RSTSyntaxTranslator())
+    cache.translate("Text", interpreter, RSTSyntaxTranslator())
+
+    # Assert
+    assert interpreter.calls == 2
+
+
+def test_translation_cache_evicts_least_recently_used():
+    # Arrange
+    cache = TranslationCache(maxsize=2)
+    interpreter = CountingInterpreter()
+    translator = RSTSyntaxTranslator()
+
+    # Act
+    cache.translate("A", interpreter, translator)
+    cache.translate("B", interpreter, translator)
+    cache.translate("A", interpreter, translator)
+    cache.translate("C", interpreter, translator)
+    cache.translate("A", interpreter, translator)
+    cache.translate("B", interpreter, translator)
+
+    # Assert
+    assert interpreter.calls == 4
+    assert cache.info()["size"] == 2
@@ -0,0 +1,159 @@
+from typing import Mapping
+
+import pytest
+
+from godocs.translation import walker
+from godocs.translation.ast import TagNode, TextNode
+from godocs.translation.interpreter import FlatBBCodeInterpreter, TokenBBCodeInterpreter
+from godocs.translation.translator import RSTSyntaxTranslator, SyntaxTranslator
+
+
+class BracketTranslator(SyntaxTranslator):
+
+    walkable = True
+
+    def translate_text(self, node: "TextNode") -> str:
+        return node.content
+
+    def translate_tag(self, node: "TagNode") -> str:
+        return f"{node.name}({self.translate_children(node)})"
+
+    def enter_tag(self, name: str, params: Mapping[str, str], out: list[str]) -> bool:
+        out.append(f"{name}(")
+
+        return True
+
+    def exit_tag(self, name: str, params: Mapping[str, str], out: list[str], mark: int):
+        out.append(")")
+
+
+class UpperTranslator(SyntaxTranslator):
+
+    def translate_text(self, node: "TextNode") -> str:
+        return node.content.upper()
+
+    def translate_tag(self, node: "TagNode") -> str:
+        return f"<{self.translate_children(node)}>"
+
+
+class CustomRSTSyntaxTranslator(RSTSyntaxTranslator):
+
+    def emit_tag(self, node: "TagNode", out: list[str]):
+        if node.name == "underline":
+            out.append("_")
+
+        super().emit_tag(node, out)
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "Hello, World!",
+    "Start Text [b]Bold[/b] [i]Italic [code]code[/code][/i] End Text",
+    "Emitted when the [Node] enters the [SceneTree].",
+    "Multiplies by [operator Color.operator *] as [param value].",
+    "Break[br]Line [lb]not a tag[rb] [u]ignored [b]bold[/b][/u]",
+    "[url=https://godotengine.org]Godot [b]Engine[/b][/url]",
+    "[codeblock lang=gdscript]\nfunc _ready():\n    print([1, [2]])\n[/codeblock]",
+])
+def test_walker_translates_like_the_recursive_api(text: str):
+    # Arrange
+    ast = TokenBBCodeInterpreter().interpret(text)
+
+    translator = RSTSyntaxTranslator()
+
+    # Act
+    result = walker.translate(ast, translator)
+
+    # Assert
+    assert result == ast.translate(translator)
+    assert result == translator.translate_flat(
+        FlatBBCodeInterpreter().interpret_flat(text))
+
+
+def test_walker_translates_deep_trees_without_recursion():
+    # Arrange
+    depth = 5000
+
+    node: TagNode | TextNode = TextNode("Deep")
+
+    for _ in range(depth):
+        node = TagNode("bold", [node])
+
+    ast = TagNode("root", [node])
+
+    # Act
+    result = walker.translate(ast, RSTSyntaxTranslator())
+
+    # Assert
+    assert result == "**" * depth + "Deep" + "**" * depth
+
+
+def test_walker_calls_translator_callbacks():
+    # Arrange
+    ast = TagNode("root", [
+        TextNode("a"),
+        TagNode("tag", [TextNode("b"), TagNode("empty")]),
+    ])
+
+    # Act
+    result = walker.translate(ast, BracketTranslator())
+
+    # Assert
+    assert result == "root(atag(bempty()))"
+
+
+def test_walker_uses_recursive_api_of_translators_that_arent_walkable():
+    # Arrange
+    ast = TagNode("root", [TextNode("a"), TagNode("tag", [TextNode("b")])])
+
+    # Act
+    result = walker.translate(ast, UpperTranslator())
+
+    # Assert
+    assert result == "<A<B>>"
+
+
+def test_rst_syntax_translator_subclasses_customizing_emit_tag_arent_walkable():
+    # Arrange
+    ast = TokenBBCodeInterpreter().interpret("[u]under[/u]")
+
+    translator = CustomRSTSyntaxTranslator()
+
+    # Act
+    result = walker.translate(ast, translator)
+
+    # Assert
+    assert not translator.walkable
+    assert RSTSyntaxTranslator().walkable
+    assert result == "_"
+
+
+def test_rst_syntax_translator_subclasses_customizing_translate_methods_arent_walkable():
+    # Arrange
+    class UpperRSTSyntaxTranslator(RSTSyntaxTranslator):
+
+        def translate_text(self, node: "TextNode") -> str:
+            return node.content.upper()
+
+    interpreter = FlatBBCodeInterpreter()
+    translator = UpperRSTSyntaxTranslator()
+
+    # Act
+    result = walker.translate(
+        TokenBBCodeInterpreter().interpret("hi [b]x[/b]"), translator)
+    flat = translator.translate_flat(interpreter.interpret_flat("hi [b]x[/b]"))
+
+    # Assert
+    assert not translator.walkable
+    assert result == flat == "HI **X**"
+
+
+def test_walker_translates_flat_trees_with_recursive_api_of_translators_that_arent_walkable():
+    # Arrange
+    tree = FlatBBCodeInterpreter().interpret_flat("a [b]b[/b]")
+
+    # Act
+    result = walker.translate_flat(tree, UpperTranslator())
+
+    # Assert
+    assert result == "<A <B>>"
@@ -165,3 +165,82 @@ def test_rst_syntax_translator_translates_reference():
 
     # Assert
     assert rst == ":ref:`RSTSyntaxTranslator <RSTSyntaxTranslator>`"
+
+
+def test_rst_syntax_translator_translates_nested_tags():
+    # Arrange
+    root = TagNode("root", [
+        TextNode("Start "),
+        TagNode("bold", [
+            TextNode("Bold "),
+            TagNode("italic", [TextNode("Italic")]),
+        ]),
+        TagNode("newline"),
+        TagNode("link", [TextNode("Godocs")], {"url": "https://github.com"}),
+    ])
+
+    translator = Translator()
+
+    # Act
+    rst = translator.translate(root)
+
+    # Assert
+    assert rst == "Start **Bold *Italic***\nGodocs <https://github.com>_"
+
+
+def test_rst_syntax_translator_ignores_children_of_unknown_tags():
+    # Arrange
+    unknown = TagNode("unknown", [TextNode("Hidden")])
+    root = TagNode("root", [TextNode("Shown"), unknown])
+
+    translator = Translator()
+
+    # Act
+    rst = translator.translate(root)
+
+    # Assert
+    assert rst == "Shown"
+
+
+def test_rst_syntax_translator_emits_into_buffer():
+    # Arrange
+    references = [
+        TagNode("reference", [], {"name": f"Class{i}"}) for i in range(500)
+    ]
+    root = TagNode("root", references)
+
+    translator = Translator()
+    out: list[str] = []
+
+    # Act
+    translator.emit(root, out)
+
+    # Assert
+    assert len(out) == 500
+    assert ''.join(out) == translator.translate_tag(root)
+
+
+def test_rst_syntax_translator_uses_overridden_translate_methods():
+    # Arrange
+    class UpperTranslator(Translator):
+
+        def translate_text(self, node: TextNode) -> str:
+            return node.content.upper()
+
+        def translate_tag(self, node: TagNode) -> str:
+            if node.name == "bold":
+                return f"<B>{self.translate_children(node)}</B>"
+
+            return super().translate_tag(node)
+
+    root = TagNode("root", [
+        TextNode("hi "),
+        TagNode("bold", [TextNode("x")]),
+        TagNode("italic", [TextNode("y")]),
+    ])
+
+    # Act
+    rst = UpperTranslator().translate(root)
+
+    # Assert
+    assert rst == "HI <B>X</B>*Y*"
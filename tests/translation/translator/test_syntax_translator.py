@@ -0,0 +1,53 @@
+from godocs.translation.ast import FlatTree, TagNode, TextNode
+
+from godocs.translation.translator import SyntaxTranslator
+
+
+class UpperTranslator(SyntaxTranslator):
+
+    def translate_text(self, node: "TextNode") -> str:
+        return node.content.upper()
+
+    def translate_tag(self, node: "TagNode") -> str:
+        return f"<{self.translate_children(node)}>"
+
+
+def test_syntax_translator_emits_with_translate_methods():
+    # Arrange
+    root = TagNode("root", [TextNode("a"), TagNode("tag", [TextNode("b")])])
+
+    translator = UpperTranslator()
+    out: list[str] = []
+
+    # Act
+    translator.emit(root, out)
+
+    # Assert
+    assert out == ["<A<B>>"]
+
+
+def test_syntax_translator_translates_any_node():
+    # Arrange
+    text = TextNode("a")
+
+    translator = UpperTranslator()
+
+    # Act
+    result = translator.translate(text)
+
+    # Assert
+    assert result == "A"
+
+
+def test_syntax_translator_translates_flat_trees_through_nodes():
+    # Arrange
+    root = TagNode("root", [TextNode("a"), TagNode("tag", [TextNode("b")])])
+
+    tree = FlatTree.from_node(root)
+    translator = UpperTranslator()
+
+    # Act
+    result = translator.translate_flat(tree)
+
+    # Assert
+    assert result == "<A<B>>"
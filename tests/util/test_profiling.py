@@ -0,0 +1,120 @@
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import pytest
+
+from godocs.util.profiling import Profiler, StageReport
+
+
+def test_profiler_ignores_stages_when_inactive():
+    # Arrange
+    profiler = Profiler()
+
+    # Act
+    with profiler.stage("parse") as stage:
+        stage["items"] = 1
+
+    # Assert
+    assert profiler.reports == []
+
+
+def test_profiler_measures_stages_when_enabled():
+    # Arrange
+    profiler = Profiler(enabled=True, memory=True)
+
+    # Act
+    with profiler.stage("parse") as stage:
+        data = [str(i) for i in range(10000)]
+        stage["items"] = len(data)
+
+    # Assert
+    report = profiler.reports[0]
+
+    assert report["name"] == "parse"
+    assert report["items"] == 10000
+    assert report["wall_time"] > 0
+    assert report["peak_memory"] > 0
+
+
+def test_profiler_only_traces_memory_when_asked():
+    # Arrange
+    profiler = Profiler(enabled=True)
+
+    # Act
+    with profiler.stage("parse"):
+        tracing = tracemalloc.is_tracing()
+        data = [str(i) for i in range(10000)]
+
+    # Assert
+    assert tracing is False
+    assert len(data) == 10000
+    assert profiler.reports[0]["peak_memory"] == 0
+    assert "peak" not in profiler.format()
+
+
+def test_profiler_calls_hooks():
+    # Arrange
+    profiler = Profiler(memory=False)
+    received: list[StageReport] = []
+
+    profiler.subscribe(received.append)
+
+    # Act
+    with profiler.stage("parse"):
+        pass
+    with profiler.stage("create"):
+        pass
+
+    # Assert
+    assert [report["name"] for report in received] == ["parse", "create"]
+    assert received[0]["peak_memory"] == 0
+
+
+def test_profiler_formats_reports():
+    # Arrange
+    profiler = Profiler(enabled=True, memory=False)
+
+    with profiler.stage("translate") as stage:
+        stage["items"] = 3
+
+    # Act
+    table = profiler.format()
+
+    # Assert
+    lines = table.splitlines()
+
+    assert lines[0].startswith("stage")
+    assert lines[1].startswith("translate")
+    assert lines[1].endswith("3")
+
+
+def test_profiler_resets_reports():
+    # Arrange
+    profiler = Profiler(enabled=True, memory=False)
+
+    with profiler.stage("parse"):
+        pass
+
+    # Act
+    profiler.reset()
+
+    # Assert
+    assert profiler.reports == []
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Windows doesn't report the CPU time of child processes")
+def test_profiler_measures_cpu_time_of_child_processes():
+    # Arrange
+    profiler = Profiler(enabled=True, memory=False)
+
+    # Act
+    with profiler.stage("workers") as stage:
+        start = time.process_time()
+        subprocess.run(
+            [sys.executable, "-c", "sum(range(10 ** 7))"], check=True)
+        own = time.process_time() - start
+
+    # Assert
+    assert stage["cpu_time"] > own
@@ -0,0 +1,55 @@
+from pathlib import Path
+from godocs.util.watch import Watcher
+
+
+def test_watcher_poll_finds_nothing_without_changes(tmp_path: Path):
+    # Arrange
+    (tmp_path / "A.xml").write_text("a")
+
+    watcher = Watcher(tmp_path, "*.xml")
+
+    # Act
+    changed = watcher.poll()
+
+    # Assert
+    assert changed == []
+
+
+def test_watcher_poll_finds_added_changed_and_removed_files(tmp_path: Path):
+    # Arrange
+    (tmp_path / "A.xml").write_text("a")
+    (tmp_path / "B.xml").write_text("b")
+
+    watcher = Watcher(tmp_path, "*.xml")
+
+    (tmp_path / "A.xml").write_text("changed")
+    (tmp_path / "B.xml").unlink()
+    (tmp_path / "C.xml").write_text("c")
+    (tmp_path / "D.txt").write_text("d")
+
+    # Act
+    changed = watcher.poll()
+
+    # Assert
+    assert changed == [
+        str(tmp_path / "A.xml"),
+        str(tmp_path / "B.xml"),
+        str(tmp_path / "C.xml"),
+    ]
+    assert watcher.poll() == []
+
+
+def test_watcher_watches_single_file(tmp_path: Path):
+    # Arrange
+    file = tmp_path / "A.xml"
+    file.write_text("a")
+
+    watcher = Watcher(file)
+
+    file.write_text("changed")
+
+    # Act
+    changed = watcher.wait()
+
+    # Assert
+    assert changed == [str(file)]